@@ -3,7 +3,7 @@
 import sys
 import os
 sys.path.append(os.path.join(os.path.dirname(__file__), "../.."))
-from Santorini.Common.pieces import Board, Worker
+from Santorini.Common.pieces import Board, Worker, Direction
 from Santorini.Common import rulechecker
 from Santorini.Common.player_guard import *
 from Santorini.Admin.observermanager import ObserverManager
@@ -148,14 +148,15 @@ class Referee:
         id_and_players = zip(players, [self.uuids_to_player[player] for player in players])
         for player_uuid, player in itertools.cycle(id_and_players):
             turn_result = self._play_turn(player)
-            if turn_result is PlayerResult.OK:
-                continue
-            else:
+            if turn_result is not PlayerResult.OK:
                 return (turn_result, player_uuid)
 
-            workers = [w for w in self.board.workers if w.player == player_uuid]
-            if rulechecker.is_game_over(copy.deepcopy(self.board), workers):
-                return (PlayerResult.OK, rulechecker.get_winner(self.board))
+            workers = self.board.workers_of(player_uuid)
+            mobility = self._update_mobility()
+            if rulechecker.is_game_over(self.board, workers, mobility):
+                winner = rulechecker.get_winner(self.board, mobility)
+                if winner:
+                    return (PlayerResult.OK, winner)
 
     def _place_worker(self, player):
         """Get a placement from a player and place on the board.
@@ -165,7 +166,7 @@ class Referee:
                              NEFARIOUS if player did something untrustworthy
         """
         try:
-            worker, position = player.place_worker(copy.deepcopy(self.board))
+            worker, position = player.place_worker(self.board.snapshot())
         except PlayerInvalidPlacement:
             p_uuid = self._uuid_of_player_guard(player)
             self._notify_observers_player_bad_placement(p_uuid)
@@ -176,6 +177,7 @@ class Referee:
             return PlayerResult.NEFARIOUS
         else:
             self.board.place_worker(worker, position)
+            self._changed_positions.append(position)
             self._notify_observers_placement((worker, position))
             return PlayerResult.OK
 
@@ -188,7 +190,7 @@ class Referee:
                              NEFARIOUS if player did something untrustworthy
         """
         try:
-            worker, move_dir, build_dir = player.play_turn(copy.deepcopy(self.board))
+            worker, move_dir, build_dir = player.play_turn(self.board.snapshot())
         except PlayerInvalidTurn:
             p_uuid = self._uuid_of_player_guard(player)
             self._notify_observers_player_bad_turn(p_uuid)
@@ -216,9 +218,35 @@ class Referee:
         :param Direction move_dir: the worker to move in
         :param Direction build_dir: the direction to build in
         """
+        self._changed_positions.append(self.board.worker_position(worker))
         self.board.move_worker(worker, move_dir)
+        moved_pos = self.board.worker_position(worker)
+        self._changed_positions.append(moved_pos)
         if build_dir:
             self.board.build_floor(worker, build_dir)
+            self._changed_positions.append(
+                Direction.move_position(moved_pos, build_dir))
+
+    def _update_mobility(self):
+        """Bring the mobility of the workers up to date with the board.
+
+        Only the workers next to a position that changed since the last
+        update can have gained or lost a move, the others are not checked
+        again.
+
+        :rtype dict[Worker -> bool]: every Worker to whether it can move
+        """
+        changed = self._changed_positions
+        if changed:
+            for worker in self.board.workers:
+                row, col = self.board.worker_position(worker)
+                if worker not in self._mobility or any(
+                        abs(row - c_row) <= 1 and abs(col - c_col) <= 1
+                        for c_row, c_col in changed):
+                    self._mobility[worker] = rulechecker.can_move(self.board,
+                                                                  worker)
+            changed.clear()
+        return self._mobility
 
     def _end_game(self, winner, evil_players):
         """ Notifies players of end of game.
@@ -275,10 +303,10 @@ class Referee:
         if evil_players is None:
             evil_players = []
 
+        result, player = result
         if result is PlayerResult.OK:
             winner = player
         else:
-            result, player = result
             winner = [p_id for p_id in self.uuids_to_player if p_id is not player][0]
             if result is not PlayerResult.GIVE_UP:
                 evil_players.append(player)
@@ -314,14 +342,14 @@ class Referee:
         """Notify observers of placement.
         :param Placement placement: a placement of a worker
         """
-        self.observer_manager.notify_all("update_placement", copy.deepcopy(self.board),
+        self.observer_manager.notify_all("update_placement", self.board.snapshot(),
                                         copy.deepcopy(placement), self.uuids_to_name)
 
     def _notify_observers_turn(self, turn):
         """Notify observers of placement.
         :param Turn turn:
         """
-        self.observer_manager.notify_all("update_turn", copy.deepcopy(self.board),
+        self.observer_manager.notify_all("update_turn", self.board.snapshot(),
                                         turn, self.uuids_to_name)
 
     def _notify_observers_gave_up(self, player_name):
@@ -334,7 +362,7 @@ class Referee:
         """Notify observers of game over
         :param Uuid winner: Uuid of winner
         """
-        self.observer_manager.notify_all("update_game_over", copy.deepcopy(self.board),
+        self.observer_manager.notify_all("update_game_over", self.board.snapshot(),
                                         winner, self.uuids_to_name)
 
     def _notify_observers_error_msg(self, msg):
@@ -370,3 +398,7 @@ class Referee:
     def _reset_board(self):
         """ Resets the board """
         self.board = Board()
+        # The worker mobility known for the board, and the positions that
+        # changed since it was last updated, see _update_mobility
+        self._mobility = {}
+        self._changed_positions = []
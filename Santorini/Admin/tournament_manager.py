@@ -23,7 +23,7 @@ class TournamentManager:
 
     MEET_UP_GAMES = 3
 
-    def __init__(self, timeout=60):
+    def __init__(self, timeout=PlayerGuard.DEFAULT_TIMEOUT):
         self.uuids_players = collections.OrderedDict()
         self.uuids_names = collections.OrderedDict()
         self.observer_manager = ObserverManager()
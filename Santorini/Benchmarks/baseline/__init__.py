@@ -0,0 +1,8 @@
+"""The Board and rulechecker from before the bitboard Board, for
+board_bench.py to compare against.
+
+pieces.py and rulechecker.py are copies of Common/pieces.py and
+Common/rulechecker.py at the first commit of the repository. The only
+change is that the rulechecker imports the pieces next to it. They are
+not used by the game.
+"""
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3.6
+"""Benchmark for the NumPy batch rulechecker.
+
+Scores a batch of random positions with the batch rulechecker, finding
+every legal move and move+build of every worker, the immediate wins and
+the winners, and compares the rate with doing the same one board at a time
+with the rulechecker. Needs NumPy. Prints the platform and the Python and
+NumPy versions first, to keep with the rates.
+
+Usage:
+    batch_bench.py [COUNT]
+"""
+import platform
+import random
+import sys
+import os
+import time
+import numpy
+sys.path.append(os.path.join(os.path.dirname(__file__), "../.."))
+from Santorini.Common.pieces import Board, Worker, CELLS
+from Santorini.Common import rulechecker, batch_rulechecker
+
+PLAYERS = ["one", "two"]
+WORKERS = [Worker(player, num) for player in PLAYERS for num in (1, 2)]
+
+
+def random_boards(count, seed=0):
+    """Return count boards with random heights and workers.
+
+    :param int count: the number of boards
+    :param int seed: the random seed
+    :rtype list Board
+    """
+    rng = random.Random(seed)
+    boards = []
+    for _ in range(count):
+        board = Board([[rng.choice([0, 0, 1, 1, 2, 3, 4])
+                        for col in range(Board.BOARD_SIZE)]
+                       for row in range(Board.BOARD_SIZE)])
+        for worker, cell in zip(WORKERS, rng.sample(CELLS, len(WORKERS))):
+            board.place_worker(worker, cell)
+        boards.append(board)
+    return boards
+
+
+def score_batch(heights, workers):
+    """Compute every mask and flag of the batch rulechecker.
+
+    :rtype int: the number of legal move+build turns
+    """
+    batch_rulechecker.move_masks(heights, workers)
+    batch_rulechecker.immediate_wins(heights, workers)
+    batch_rulechecker.winners(heights, workers)
+    return int(batch_rulechecker.build_masks(heights, workers).sum())
+
+
+def score_loop(boards):
+    """Compute the same answers one board at a time with the rulechecker.
+
+    :rtype int: the number of legal move+build turns
+    """
+    turns = 0
+    for board in boards:
+        for player in PLAYERS:
+            turns += sum(1 for _, _, build_dir in
+                         rulechecker.legal_turns(board, player) if build_dir)
+        rulechecker.get_winner(board)
+    return turns
+
+
+def timed(func, *args):
+    """Return (result, seconds) for calling func with args."""
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+def main():
+    """Run the benchmarks and print their rates."""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    print(f"{platform.platform()}, {os.cpu_count()} CPUs, "
+          f"Python {platform.python_version()}, NumPy {numpy.__version__}")
+    boards = random_boards(count)
+    (heights, workers), secs = timed(batch_rulechecker.from_boards,
+                                     boards, PLAYERS)
+    print(f"stack: {count} boards in {secs:.3f}s "
+          f"({count / secs:,.0f} boards/s)")
+    batch_turns, secs = timed(score_batch, heights, workers)
+    print(f"batch: {count} boards in {secs:.3f}s "
+          f"({count / secs:,.0f} boards/s)")
+    loop_turns, secs = timed(score_loop, boards)
+    print(f"rulechecker: {count} boards in {secs:.3f}s "
+          f"({count / secs:,.0f} boards/s)")
+    if batch_turns != loop_turns:
+        print(f"mismatch: {batch_turns} batch turns, {loop_turns} turns")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,204 @@
+#!/usr/bin/env python3.6
+"""Benchmark for the Santorini Board.
+
+Measures how many search nodes per second can be expanded on a fixed
+mid-game position, the way TreeStrategy expands them: generate every turn
+the rulechecker's legal_turns gives, clone the board and apply the turn to
+the clone.
+
+To compare with the Board of Building objects the bitboard Board replaced,
+the search that was first measured is also run on both: try every move and
+build Direction with can_move_build, deep copy the board and apply the
+turn to the copy. The old Board runs with the old rulechecker, both kept in
+the baseline package next to this file.
+
+Usage:
+    board_bench.py [DEPTH]
+"""
+import copy
+import sys
+import os
+import time
+from itertools import product
+sys.path.append(os.path.join(os.path.dirname(__file__), "../.."))
+from Santorini.Common.pieces import Board, Worker, Direction, MOVE_BUILDS
+from Santorini.Common import rulechecker
+from Santorini.Benchmarks.baseline import pieces as baseline_pieces
+from Santorini.Benchmarks.baseline import rulechecker as baseline_rulechecker
+
+HEIGHTS = [[0, 1, 2, 0, 1, 0],
+           [1, 3, 0, 2, 0, 1],
+           [0, 2, 4, 1, 0, 0],
+           [2, 0, 1, 3, 2, 1],
+           [0, 1, 0, 0, 4, 0],
+           [1, 0, 2, 1, 0, 0]]
+
+PLAYERS = ["one", "two"]
+
+
+def mid_game_board(pieces=None):
+    """Return a fresh copy of the benchmark position.
+
+    :param module pieces: the module of the Board and Worker to use, the
+                          game's by default
+    """
+    board_class, worker_class = ((Board, Worker) if pieces is None else
+                                 (pieces.Board, pieces.Worker))
+    workers = {worker_class(PLAYERS[0], 1): (0, 0),
+               worker_class(PLAYERS[0], 2): (2, 3),
+               worker_class(PLAYERS[1], 1): (3, 1),
+               worker_class(PLAYERS[1], 2): (4, 5)}
+    return board_class(HEIGHTS, workers)
+
+
+def expand(board, player, depth):
+    """Expand every move+build turn for player down to depth plies.
+
+    :param Board board: the position to expand
+    :param str player: the player to move
+    :param int depth: the number of plies to expand
+    :rtype int: the number of nodes visited
+    """
+    if depth == 0:
+        return 1
+    nodes = 1
+    other = PLAYERS[1] if player == PLAYERS[0] else PLAYERS[0]
+    for worker, move_dir, build_dir in rulechecker.legal_turns(board, player):
+        if build_dir:
+            child = board.clone()
+            child.move_worker(worker, move_dir)
+            child.build_floor(worker, build_dir)
+            nodes += expand(child, other, depth - 1)
+    return nodes
+
+
+def expand_copied(board, player, depth, rules=rulechecker,
+                  directions=Direction):
+    """Expand the same tree as expand, the way it was first measured.
+
+    :param Board board: the position to expand
+    :param str player: the player to move
+    :param int depth: the number of plies to expand
+    :param module rules: the rulechecker to check turns with
+    :param type directions: the Direction enum of the board's pieces
+    :rtype int: the number of nodes visited
+    """
+    if depth == 0:
+        return 1
+    nodes = 1
+    other = PLAYERS[1] if player == PLAYERS[0] else PLAYERS[0]
+    for worker in [w for w in board.workers if w.player == player]:
+        for move_dir, build_dir in product(directions, directions):
+            if rules.can_move_build(board, worker, move_dir, build_dir):
+                child = copy.deepcopy(board)
+                child.move_worker(worker, move_dir)
+                child.build_floor(worker, build_dir)
+                nodes += expand_copied(child, other, depth - 1, rules,
+                                       directions)
+    return nodes
+
+
+def expand_in_place(board, player, depth):
+    """Expand the same tree as expand, making and unmaking turns on one board.
+
+    :param Board board: the position to expand, it is restored on return
+    :param str player: the player to move
+    :param int depth: the number of plies to expand
+    :rtype int: the number of nodes visited
+    """
+    if depth == 0:
+        return 1
+    nodes = 1
+    other = PLAYERS[1] if player == PLAYERS[0] else PLAYERS[0]
+    for worker, move_dir, build_dir in rulechecker.legal_turns(board, player):
+        if build_dir:
+            board.make_turn(worker, move_dir, build_dir)
+            nodes += expand_in_place(board, other, depth - 1)
+            board.unmake_turn()
+    return nodes
+
+
+def primitives(board, rounds, directions=Direction):
+    """Hammer the read-only Board queries used by the rulechecker.
+
+    :param type directions: the Direction enum of the board's pieces
+    :rtype int: the number of queries made
+    """
+    calls = 0
+    workers = board.workers
+    for _ in range(rounds):
+        for worker in workers:
+            pos = board.worker_position(worker)
+            for direction in directions:
+                try:
+                    board.get_height(pos, direction)
+                    board.is_occupied(directions.move_position(pos,
+                                                               direction))
+                except IndexError:
+                    pass
+                calls += 2
+    return calls
+
+
+def dumps(board, rounds):
+    """Dump the board the way the referee's observers and players do.
+
+    Each round plays a turn, then dumps a snapshot of the position three
+    times with the same names, and finally takes the turn back.
+
+    :rtype int: the number of dumps made
+    """
+    names = {player: player for player in PLAYERS}
+    worker = board.workers_of(PLAYERS[0])[1]
+    turns = [(move_dir, build_dir)
+             for move_dir, build_dir, _, _ in
+             MOVE_BUILDS[board.worker_position(worker)]
+             if rulechecker.can_move_build(board, worker, move_dir, build_dir)]
+    calls = 0
+    for index in range(rounds):
+        board.make_turn(worker, *turns[index % len(turns)])
+        for _ in range(3):
+            board.snapshot().dump_as_json(names)
+            calls += 1
+        board.unmake_turn()
+    return calls
+
+
+def timed(func, *args):
+    """Return (result, seconds) for calling func with args."""
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+def main():
+    """Run the benchmarks and print their rates."""
+    depth = int(sys.argv[1]) if len(sys.argv) > 1 else 2
+    nodes, secs = timed(expand, mid_game_board(), PLAYERS[0], depth)
+    print(f"search: {nodes} nodes in {secs:.3f}s "
+          f"({nodes / secs:,.0f} nodes/s)")
+    nodes, secs = timed(expand_in_place, mid_game_board(), PLAYERS[0], depth)
+    print(f"in-place search: {nodes} nodes in {secs:.3f}s "
+          f"({nodes / secs:,.0f} nodes/s)")
+    calls, secs = timed(primitives, mid_game_board(), 2000)
+    print(f"queries: {calls} calls in {secs:.3f}s "
+          f"({calls / secs:,.0f} calls/s)")
+    calls, secs = timed(dumps, mid_game_board(), 5000)
+    print(f"json dumps: {calls} dumps in {secs:.3f}s "
+          f"({calls / secs:,.0f} dumps/s)")
+    nodes, secs = timed(expand_copied, mid_game_board(), PLAYERS[0], depth)
+    print(f"copied search: {nodes} nodes in {secs:.3f}s "
+          f"({nodes / secs:,.0f} nodes/s)")
+    nodes, secs = timed(expand_copied, mid_game_board(baseline_pieces),
+                        PLAYERS[0], depth, baseline_rulechecker,
+                        baseline_pieces.Direction)
+    print(f"baseline copied search: {nodes} nodes in {secs:.3f}s "
+          f"({nodes / secs:,.0f} nodes/s)")
+    calls, secs = timed(primitives, mid_game_board(baseline_pieces), 2000,
+                        baseline_pieces.Direction)
+    print(f"baseline queries: {calls} calls in {secs:.3f}s "
+          f"({calls / secs:,.0f} calls/s)")
+
+
+if __name__ == '__main__':
+    main()
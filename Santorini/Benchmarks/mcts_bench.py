@@ -0,0 +1,115 @@
+#!/usr/bin/env python3.6
+"""Benchmark for the Monte Carlo tree search strategy against TreeStrategy.
+
+Plays games between MCTSStrategy and TreeStrategy, each playing first in
+half of them, and reports the win rate of MCTS and the time each strategy
+took per turn. By default the two play at equal time: every turn, MCTS
+gets as long as TreeStrategy took on average for its turns so far. With a
+time budget, MCTS gets that many seconds per turn instead.
+
+Usage:
+    mcts_bench.py [GAMES [TIME_BUDGET]]
+"""
+import logging
+import sys
+import os
+import time
+sys.path.append(os.path.join(os.path.dirname(__file__), "../.."))
+from Santorini.Common.pieces import Board, Building, Direction, Worker, CELLS
+from Santorini.Common import rulechecker
+from Santorini.Player.mcts_strat import MCTSStrategy
+from Santorini.Player.tree_strat import TreeStrategy
+from Santorini.Player.place_strat import PlaceStratDiagonal
+
+MAX_TURNS = 200
+
+
+def play_game(strategies, players, before_turn=None, rng=None):
+    """Play a game between turn strategies, like the referee does.
+
+    Workers are placed with PlaceStratDiagonal, or on random cells, two
+    per player in turns. A player that gives up or plans a turn the
+    rulechecker does not accept loses, as does a player with no turns; a
+    player that moves a worker onto a building of height
+    Building.MAX_HEIGHT - 1 wins.
+
+    :param list TurnStrategy strategies: the strategy of each player, the
+                                         first one moves first
+    :param list players: the name of each player
+    :param function before_turn: an (optional) function called before
+                                 every turn with the index of the player
+                                 and the seconds every player took so far
+    :param random.Random rng: an (optional) random generator to place the
+                              workers with
+    :rtype (int | None, list float): the index of the winner, None for a
+                                     draw after MAX_TURNS turns, and the
+                                     seconds each player took for its turns
+    """
+    board = Board()
+    for num in (1, 2):
+        for player in players:
+            worker = Worker(player, num)
+            if rng is None:
+                pos = PlaceStratDiagonal.plan_placement(worker, board)
+            else:
+                pos = rng.choice([cell for cell in CELLS
+                                  if not board.is_occupied(cell)])
+            board.place_worker(worker, pos)
+    seconds = [0.0] * len(players)
+    for turn_index in range(MAX_TURNS):
+        index = turn_index % len(players)
+        if before_turn is not None:
+            before_turn(index, seconds)
+        workers = list(board.workers_of(players[index]))
+        start = time.perf_counter()
+        turn = strategies[index].plan_turn(workers, board.snapshot())
+        seconds[index] += time.perf_counter() - start
+        if (turn == (None, None, None) or
+                not rulechecker.can_move_build(board, *turn)):
+            return 1 - index, seconds
+        board.make_turn(*turn)
+        if (board.get_height(board.worker_position(turn[0]), Direction.STAY) ==
+                Building.MAX_HEIGHT - 1):
+            return index, seconds
+    return None, seconds
+
+
+def main():
+    """Play the games and print the win rate."""
+    games = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    budget = float(sys.argv[2]) if len(sys.argv) > 2 else None
+    # TreeStrategy logs every node it visits
+    logging.disable(logging.CRITICAL)
+    wins = draws = 0
+    seconds = [0.0, 0.0]
+    turns = [0, 0]
+    for game in range(games):
+        mcts = MCTSStrategy(time_budget=budget or 0, time_fraction=1,
+                            seed=game)
+        # MCTS plays first in the even games
+        slot = game % 2
+        strategies = [mcts, TreeStrategy()][::1 - 2 * slot]
+        players = ["mcts", "tree"][::1 - 2 * slot]
+        counts = [0, 0]
+
+        def before_turn(index, taken):
+            counts[index] += 1
+            if budget is None and counts[1 - slot]:
+                # as long as TreeStrategy took per turn so far
+                mcts.time_budget = taken[1 - slot] / counts[1 - slot]
+
+        winner, taken = play_game(strategies, players, before_turn)
+        wins += winner == slot
+        draws += winner is None
+        for index, name in enumerate(players):
+            seconds[name == "tree"] += taken[index]
+            turns[name == "tree"] += counts[index]
+        result = "draw" if winner is None else f"{players[winner]} won"
+        print(f"game {game}: {result} in {sum(counts)} turns")
+    print(f"mcts won {wins} of {games} games ({wins / games:.0%}) with "
+          f"{draws} draws, taking {seconds[0] / max(turns[0], 1):.4f}s per "
+          f"turn against {seconds[1] / max(turns[1], 1):.4f}s for TreeStrategy")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3.6
+"""Benchmark for the move orders of the alpha-beta search.
+
+Searches the positions of search_bench.py and a few random mid-game
+positions to every depth from 3 to MAX_DEPTH with every move order: the
+order of legal_turns, wins and climbs first, then with killer turns, then
+with the history table too. Every order must find the same score; the
+benchmark reports the nodes each needs to find it and the time taken.
+
+Usage:
+    order_bench.py [MAX_DEPTH]
+        MAX_DEPTH is 4 by default and at least 3
+"""
+import random
+import sys
+import os
+import time
+sys.path.append(os.path.join(os.path.dirname(__file__), "../.."))
+from Santorini.Common.pieces import Board, Worker, CELLS
+from Santorini.Player.alphabeta_strat import AlphaBetaStrategy
+from Santorini.Player.move_order import MoveOrder, HeuristicOrder
+from Santorini.Benchmarks.search_bench import suite
+
+ORDERS = [("legal_turns", lambda: MoveOrder()),
+          ("wins+climbs", lambda: HeuristicOrder(killers=False, history=False)),
+          ("+killers", lambda: HeuristicOrder(history=False)),
+          ("+history", lambda: HeuristicOrder())]
+
+# The first depth searched, shallower searches barely differ between orders
+MIN_DEPTH = 3
+
+
+def _searched(board, player):
+    """Return if a position needs a search: the player has turns but no
+    winning one."""
+    return (AlphaBetaStrategy.winning_turn(board, player) is None and
+            bool(AlphaBetaStrategy.search_turns(board, player)))
+
+
+def positions(count=4, seed=0):
+    """Return the (name, board, player) positions to search."""
+    rng = random.Random(seed)
+    found = [position for position in suite() if _searched(*position[1:])]
+    made = 0
+    while made < count:
+        board = Board([[rng.choice([0, 0, 0, 1, 1, 2, 3])
+                        for col in range(Board.BOARD_SIZE)]
+                       for row in range(Board.BOARD_SIZE)])
+        for num, cell in enumerate(rng.sample(CELLS, 4)):
+            board.place_worker(Worker(["one", "two"][num % 2], num // 2 + 1),
+                               cell)
+        if _searched(board, "one"):
+            found.append((f"random {made}", board, "one"))
+            made += 1
+    return found
+
+
+def main():
+    """Run the searches and print the nodes of every order."""
+    max_depth = int(sys.argv[1]) if len(sys.argv) > 1 else 4
+    if max_depth < MIN_DEPTH:
+        sys.exit(__doc__)
+    totals = {name: [0, 0.0] for name, _ in ORDERS}
+    for name, board, player in positions():
+        for depth in range(MIN_DEPTH, max_depth + 1):
+            scores = set()
+            line = []
+            for order_name, make_order in ORDERS:
+                strategy = AlphaBetaStrategy(depth, move_order=make_order())
+                start = time.perf_counter()
+                strategy.plan_turn(list(board.workers_of(player)), board)
+                secs = time.perf_counter() - start
+                scores.add(strategy.score)
+                totals[order_name][0] += strategy.nodes
+                totals[order_name][1] += secs
+                line.append(f"{order_name} {strategy.nodes}")
+            status = "same score" if len(scores) == 1 else "DIFFERENT scores"
+            print(f"{name}: depth {depth} {', '.join(line)} nodes, {status}")
+    baseline = totals[ORDERS[0][0]][0]
+    for order_name, (nodes, secs) in totals.items():
+        print(f"total {order_name}: {nodes} nodes "
+              f"({nodes / baseline:.1%}) in {secs:.2f}s")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,53 @@
+#!/usr/bin/env python3.6
+"""Benchmark for the parallel alpha-beta search.
+
+Plans a turn at a fixed depth for the positions of search_bench.py with
+the serial AlphaBetaStrategy and with ParallelAlphaBetaStrategy over 1, 2,
+4, ... processes up to the number of CPUs, checks that every search plays
+the turn and finds the score of the serial one, and reports the speedup.
+
+Usage:
+    parallel_bench.py [DEPTH [MAX_PROCESSES]]
+"""
+import sys
+import os
+import time
+sys.path.append(os.path.join(os.path.dirname(__file__), "../.."))
+from Santorini.Player.alphabeta_strat import AlphaBetaStrategy
+from Santorini.Player.parallel_strat import ParallelAlphaBetaStrategy
+from Santorini.Benchmarks.search_bench import suite
+
+
+def plan_all(strategy, positions):
+    """Return ([(turn, score)], seconds) for planning a turn of every position."""
+    results = []
+    start = time.perf_counter()
+    for _, board, player in positions:
+        turn = strategy.plan_turn(list(board.workers_of(player)), board)
+        results.append((turn, strategy.score))
+    return results, time.perf_counter() - start
+
+
+def main():
+    """Run the searches and print their speedups."""
+    depth = int(sys.argv[1]) if len(sys.argv) > 1 else 4
+    max_processes = (int(sys.argv[2]) if len(sys.argv) > 2
+                     else max(os.cpu_count() or 1, 2))
+    positions = suite()
+    expected, serial_secs = plan_all(AlphaBetaStrategy(depth), positions)
+    print(f"serial: depth {depth} in {serial_secs:.3f}s")
+    processes = 1
+    while processes <= max_processes:
+        strategy = ParallelAlphaBetaStrategy(depth, processes=processes)
+        # the processes are started by the first search, before timing
+        plan_all(strategy, positions[:1])
+        results, secs = plan_all(strategy, positions)
+        strategy.close()
+        status = "same turns" if results == expected else "DIFFERENT turns"
+        print(f"{processes} processes: depth {depth} in {secs:.3f}s, "
+              f"speedup {serial_secs / secs:.2f}x, {status}")
+        processes *= 2
+
+
+if __name__ == '__main__':
+    main()
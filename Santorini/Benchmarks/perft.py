@@ -0,0 +1,159 @@
+#!/usr/bin/env python3.6
+"""Perft for Santorini: count the positions reachable in N turns.
+
+Usage:
+    perft.py DEPTH PLAYER < boards.json
+        count the leaves DEPTH turns (plies) deep from every board on stdin,
+        PLAYER moves first, and report nodes per second
+    perft.py --verify [CORPUS]
+        count the leaves of every position of a corpus (perft-corpus.json
+        by default), checking the turns of every node against the reference
+        generator and the count against the expected one
+
+Boards are in the JSON format of 6/xboard and 7/xrules: a list of rows of
+cells, a cell is a height or a height followed by a worker, e.g. "2player11".
+
+Every turn rulechecker.legal_turns gives is a child, moves as well as
+move+builds. A turn that moves a worker onto a building of height
+Building.MAX_HEIGHT - 1 wins, it is a leaf whatever the remaining depth.
+A player with no turns has lost, that position adds no leaves.
+"""
+import json
+import sys
+import os
+import time
+from itertools import product
+sys.path.append(os.path.join(os.path.dirname(__file__), "../.."))
+from Santorini.Common.pieces import Board, Building, Worker, Direction
+from Santorini.Common import rulechecker
+from Santorini.Lib import echo
+
+CORPUS = os.path.join(os.path.dirname(__file__), "perft-corpus.json")
+
+
+def parse_board(cells):
+    """Converts a list of list of strings into a Board object."""
+    new_board = [[0 for col in range(Board.BOARD_SIZE)] for row in
+                 range(Board.BOARD_SIZE)]
+    workers = {}
+    for (row, rows) in enumerate(cells):
+        for col in range(len(rows)):
+            cur_cell = cells[row][col]
+            if isinstance(cur_cell, int):
+                new_board[row][col] = cur_cell
+            elif cur_cell:
+                new_board[row][col] = int(cur_cell[0])
+                if cur_cell[1:]:
+                    worker = Worker(cur_cell[1:-1], int(cur_cell[-1]))
+                    workers[worker] = (row, col)
+    return Board(new_board, workers)
+
+
+def reference_turns(board, player):
+    """Generate the turns of a player by asking can_move_build about every
+    move and build direction of every worker.
+
+    :param Board board: the game board
+    :param str player: the player to move
+    :rtype Generator[(Worker, Direction, Direction|None)]
+    """
+    for worker in board.workers_of(player):
+        for move_dir, build_dir in product(Direction, (None,) + tuple(Direction)):
+            if rulechecker.can_move_build(board, worker, move_dir, build_dir):
+                yield (worker, move_dir, build_dir)
+
+
+def checked_turns(board, player):
+    """Return the turns of legal_turns after checking them against
+    reference_turns.
+
+    :raise AssertionError: if the generators do not give the same turns
+    """
+    turns = list(rulechecker.legal_turns(board, player))
+    expected = set(reference_turns(board, player))
+    if len(turns) != len(expected) or set(turns) != expected:
+        raise AssertionError(f"legal_turns for {player} on {board} gave "
+                             f"{sorted(map(str, set(turns) ^ expected))} "
+                             f"differently from can_move_build")
+    return turns
+
+
+def perft(board, player, other, depth, turns=rulechecker.legal_turns):
+    """Count the leaves depth turns deep from a position.
+
+    The board is played on with make_turn and is restored on return.
+
+    :param Board board: the position
+    :param str player: the player to move
+    :param str other: the other player
+    :param int depth: the number of turns to play
+    :param function turns: the turn generator, taking (board, player)
+    :rtype int: the number of leaves
+    """
+    if depth == 0:
+        return 1
+    nodes = 0
+    for worker, move_dir, build_dir in list(turns(board, player)):
+        board.make_turn(worker, move_dir, build_dir)
+        if (board.get_height(board.worker_position(worker), Direction.STAY) ==
+                Building.MAX_HEIGHT - 1):
+            nodes += 1
+        else:
+            nodes += perft(board, other, player, depth - 1, turns)
+        board.unmake_turn()
+    return nodes
+
+
+def opponent(board, player):
+    """Return the player other than player with workers on the board."""
+    for worker in board.workers:
+        if worker.player != player:
+            return worker.player
+    return None
+
+
+def timed_perft(board, player, depth, turns=rulechecker.legal_turns):
+    """Return (leaves, seconds) for a perft of a position."""
+    start = time.perf_counter()
+    nodes = perft(board, player, opponent(board, player), depth, turns)
+    return nodes, time.perf_counter() - start
+
+
+def verify(corpus):
+    """Check every position of a corpus, printing one line per position.
+
+    A corpus is a JSON list of [board, player, depth, leaves].
+
+    :param str corpus: the path of the corpus
+    :rtype bool: True if every count matched
+    """
+    with open(corpus) as corpus_file:
+        positions = json.load(corpus_file)
+    passed = True
+    for index, (cells, player, depth, expected) in enumerate(positions):
+        nodes, secs = timed_perft(parse_board(cells), player, depth,
+                                  checked_turns)
+        status = "ok" if nodes == expected else f"FAIL expected {expected}"
+        passed = passed and nodes == expected
+        print(f"{index}: depth {depth} {nodes} leaves in {secs:.3f}s {status}")
+    return passed
+
+
+def main():
+    """Run perft on the boards on stdin, or verify a corpus."""
+    if len(sys.argv) > 1 and sys.argv[1] == "--verify":
+        corpus = sys.argv[2] if len(sys.argv) > 2 else CORPUS
+        sys.exit(0 if verify(corpus) else 1)
+    if len(sys.argv) != 3:
+        sys.exit(__doc__)
+    depth = int(sys.argv[1])
+    player = sys.argv[2]
+    for cells in echo.json_echo(sys.stdin.read()):
+        nodes, secs = timed_perft(parse_board(cells), player, depth)
+        print(json.dumps({"depth": depth, "leaves": nodes,
+                          "seconds": round(secs, 3),
+                          "nodes/sec": round(nodes / secs) if secs else None}))
+
+
+if __name__ == '__main__':
+    main()
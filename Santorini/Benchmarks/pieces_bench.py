@@ -0,0 +1,61 @@
+#!/usr/bin/env python3.6
+"""Benchmark for the memory and hashing cost of the Santorini pieces.
+
+Reports the memory held by a Board with four workers, and the time taken
+to create, hash and compare Workers and to look them up in a dictionary.
+"""
+import sys
+import os
+import timeit
+import tracemalloc
+import uuid
+sys.path.append(os.path.join(os.path.dirname(__file__), "../.."))
+from Santorini.Common.pieces import Board, Worker
+
+HEIGHTS = [[0, 1, 2, 0, 1, 0],
+           [1, 3, 0, 2, 0, 1],
+           [0, 2, 4, 1, 0, 0]]
+
+PLAYERS = [uuid.uuid4(), uuid.uuid4()]
+
+
+def board_bytes(count):
+    """Return the average number of bytes allocated per Board.
+
+    :param int count: the number of boards to allocate
+    """
+    workers = [Worker(player, num) for player in PLAYERS for num in (1, 2)]
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    boards = [Board(HEIGHTS, {worker: (3, col)
+                              for col, worker in enumerate(workers)})
+              for _ in range(count)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del boards
+    return (after - before) / count
+
+
+def worker_costs(number):
+    """Return the seconds per Worker creation, hash, equality and lookup."""
+    env = {"Worker": Worker, "player": PLAYERS[0],
+           "worker": Worker(PLAYERS[0], 1), "same": Worker(PLAYERS[0], 1),
+           "table": {Worker(player, num): (0, 0)
+                     for player in PLAYERS for num in (1, 2)}}
+    statements = {"create": "Worker(player, 1)",
+                  "hash": "hash(worker)",
+                  "equal": "worker == same",
+                  "lookup": "table[worker]"}
+    return {name: timeit.timeit(stmt, globals=env, number=number) / number
+            for name, stmt in statements.items()}
+
+
+def main():
+    """Run the benchmarks and print their results."""
+    print(f"bytes per Board: {board_bytes(2000):,.0f}")
+    for name, secs in worker_costs(200000).items():
+        print(f"Worker {name}: {secs * 1e9:.0f} ns")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3.6
+"""Benchmark for pondering, the search a Player runs while the opponent
+plays its turn.
+
+Plays games between a Player with a fixed depth AlphaBetaStrategy and a
+Player with a quick MCTSStrategy, seeded per game, once with pondering and
+once without. The opponent sleeps for a think time before every turn, as an
+opponent in another process would take that long without slowing the
+pondering down. Reports the seconds and nodes per turn of the alpha-beta
+player and how often it guessed the opponent's reply.
+
+Usage:
+    ponder_bench.py [GAMES [THINK [DEPTH]]]
+"""
+import logging
+import sys
+import os
+import time
+import uuid
+sys.path.append(os.path.join(os.path.dirname(__file__), "../.."))
+from Santorini.Common.pieces import Board, Building, Direction
+from Santorini.Common import rulechecker
+from Santorini.Player.player import Player
+from Santorini.Player.alphabeta_strat import AlphaBetaStrategy
+from Santorini.Player.mcts_strat import MCTSStrategy
+from Santorini.Player.transposition import TranspositionTable
+
+MAX_TURNS = 200
+
+
+class CountedStrategy(AlphaBetaStrategy):
+    """An AlphaBetaStrategy that keeps the (seconds, nodes, if the reply
+    was guessed) of every turn it plans, before it ponders."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.stats = []
+
+    def plan_turn(self, workers, board):
+        start = time.perf_counter()
+        turn = super().plan_turn(workers, board)
+        self.stats.append((time.perf_counter() - start, self.nodes,
+                           self.ponder_hit))
+        return turn
+
+
+def play_game(players, think):
+    """Play a game between Players, the first one moves first.
+
+    :param list Player players: the two players
+    :param float think: the seconds the second player sleeps before a turn
+    :rtype int | None: the index of the winner, None for a draw
+    """
+    board = Board()
+    for player in players:
+        player.set_id(uuid.uuid4())
+        player.start_of_game()
+    for _ in (1, 2):
+        for player in players:
+            board.place_worker(*player.place_worker(board.snapshot()))
+    winner = None
+    for turn_index in range(MAX_TURNS):
+        index = turn_index % 2
+        if index:
+            time.sleep(think)
+        turn = players[index].play_turn(board.snapshot())
+        if (turn == (None, None, None) or
+                not rulechecker.can_move_build(board, *turn)):
+            winner = 1 - index
+            break
+        board.make_turn(*turn)
+        if (board.get_height(board.worker_position(turn[0]), Direction.STAY) ==
+                Building.MAX_HEIGHT - 1):
+            winner = index
+            break
+    for player in players:
+        player.end_of_game(winner)
+    return winner
+
+
+def main():
+    """Play the games and print the time per turn with and without
+    pondering."""
+    games = int(sys.argv[1]) if len(sys.argv) > 1 else 4
+    think = float(sys.argv[2]) if len(sys.argv) > 2 else 1.0
+    depth = int(sys.argv[3]) if len(sys.argv) > 3 else 4
+    logging.disable(logging.CRITICAL)
+    for ponder in (False, True):
+        stats = []
+        wins = 0
+        for game in range(games):
+            strategy = CountedStrategy(depth, table=TranspositionTable())
+            players = [Player(strategy, ponder=ponder),
+                       Player(MCTSStrategy(playouts=200, seed=game))]
+            wins += play_game(players, think) == 0
+            stats.extend(strategy.stats)
+        turns = max(len(stats), 1)
+        seconds, nodes, hits = (sum(column) for column in zip(*stats))
+        print(f"pondering {'on ' if ponder else 'off'}: {turns} turns, "
+              f"{seconds / turns:.3f}s and {nodes // turns} nodes per "
+              f"turn, {hits} replies guessed ({hits / turns:.0%}), "
+              f"{wins} of {games} games won")
+
+if __name__ == '__main__':
+    main()
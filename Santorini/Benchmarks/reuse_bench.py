@@ -0,0 +1,68 @@
+#!/usr/bin/env python3.6
+"""Benchmark for keeping the transposition table of an AlphaBetaStrategy
+from turn to turn.
+
+Plays a full game between two AlphaBetaStrategy players that keep their
+tables, from random placements. Every turn of the first player is also
+planned by a strategy that starts with an empty table. Reports, per turn,
+the nodes of both, the depth the kept table already had the position
+searched to, and the hits on entries of earlier turns; then the work saved
+over the game.
+
+Usage:
+    reuse_bench.py [DEPTH [SEED]]
+"""
+import random
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(__file__), "../.."))
+from Santorini.Player.strategy import TurnStrategy
+from Santorini.Player.alphabeta_strat import AlphaBetaStrategy
+from Santorini.Player.transposition import TranspositionTable
+from Santorini.Benchmarks.mcts_bench import play_game
+
+
+class Compared(TurnStrategy):
+    """Plans turns with a strategy that keeps its table, and plans them
+    again with one that does not, keeping the stats of both."""
+
+    def __init__(self, depth):
+        self.kept = AlphaBetaStrategy(depth, table=TranspositionTable())
+        self.fresh = AlphaBetaStrategy(depth, table=TranspositionTable(),
+                                       reuse=False)
+        self.stats = []
+
+    def plan_turn(self, workers, board):
+        turn = self.kept.plan_turn(workers, board)
+        self.fresh.plan_turn(workers, board)
+        self.stats.append((self.fresh.nodes, self.kept.nodes,
+                           self.kept.reused_depth, self.kept.table.reused,
+                           self.kept.score == self.fresh.score))
+        return turn
+
+
+def main():
+    """Play the game and print the nodes of every turn."""
+    depth = int(sys.argv[1]) if len(sys.argv) > 1 else 4
+    seed = int(sys.argv[2]) if len(sys.argv) > 2 else 0
+    compared = Compared(depth)
+    opponent = AlphaBetaStrategy(depth, table=TranspositionTable())
+    winner, _ = play_game([compared, opponent], ["one", "two"],
+                          rng=random.Random(seed))
+    for turn, (fresh, kept, reused_depth, reused, same) in enumerate(
+            compared.stats, 1):
+        saved = 1 - kept / fresh if fresh else 0.0
+        print(f"turn {turn}: {fresh} nodes with an empty table, {kept} with "
+              f"the kept one ({saved:.0%} saved), position found searched "
+              f"to depth {reused_depth}, {reused} hits on earlier turns"
+              f"{'' if same else ', a different score'}")
+    fresh = sum(stats[0] for stats in compared.stats)
+    kept = sum(stats[1] for stats in compared.stats)
+    result = "a draw" if winner is None else f"won by {['one', 'two'][winner]}"
+    print(f"game {result} in {len(compared.stats)} turns of the first player: "
+          f"{fresh} nodes with an empty table, {kept} with the kept one, "
+          f"{1 - kept / max(fresh, 1):.0%} saved")
+
+
+if __name__ == '__main__':
+    main()
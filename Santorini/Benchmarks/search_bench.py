@@ -0,0 +1,81 @@
+#!/usr/bin/env python3.6
+"""Benchmark for the turn strategies' game tree searches.
+
+Plans a turn for a suite of positions, the opening and the positions of
+the perft corpus, with TreeStrategy and with AlphaBetaStrategy at every
+depth up to a maximum, without and with a transposition table, and
+reports the nodes searched, the time taken and the table's hit rate. With
+a time budget, it also reports how deep the time budgeted search gets.
+The deepest alpha-beta search that fits in the per-turn timeout of the
+PlayerGuard is what a player can afford.
+
+Usage:
+    search_bench.py [MAX_DEPTH [TIME_BUDGET]]
+"""
+import json
+import logging
+import sys
+import os
+import time
+sys.path.append(os.path.join(os.path.dirname(__file__), "../.."))
+from Santorini.Common.pieces import Board, Worker
+from Santorini.Player.alphabeta_strat import AlphaBetaStrategy
+from Santorini.Player.tree_strat import TreeStrategy
+from Santorini.Player.transposition import TranspositionTable
+from Santorini.Benchmarks.perft import parse_board, CORPUS
+
+
+def opening():
+    """Return the position after the diagonal placements of two players."""
+    board = Board()
+    for worker, pos in [(Worker("one", 1), (0, 0)), (Worker("two", 1), (1, 1)),
+                        (Worker("one", 2), (2, 2)), (Worker("two", 2), (3, 3))]:
+        board.place_worker(worker, pos)
+    return board
+
+
+def suite():
+    """Return the (name, board, player) positions to plan turns for."""
+    positions = [("opening", opening(), "one")]
+    with open(CORPUS) as corpus_file:
+        for index, (cells, player, _, _) in enumerate(json.load(corpus_file)):
+            positions.append((f"corpus {index}", parse_board(cells), player))
+    return positions
+
+
+def timed_turn(strategy, board, player):
+    """Return (turn, seconds) for planning a turn of a player."""
+    start = time.perf_counter()
+    turn = strategy.plan_turn(list(board.workers_of(player)), board)
+    return turn, time.perf_counter() - start
+
+
+def main():
+    """Run the searches and print their nodes and times."""
+    max_depth = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    budget = float(sys.argv[2]) if len(sys.argv) > 2 else None
+    # TreeStrategy logs every node it visits
+    logging.disable(logging.CRITICAL)
+    for name, board, player in suite():
+        _, secs = timed_turn(TreeStrategy(), board, player)
+        print(f"{name}: tree depth 2 in {secs:.3f}s")
+        for depth in range(1, max_depth + 1):
+            for table in (None, TranspositionTable()):
+                strategy = AlphaBetaStrategy(depth, table=table)
+                turn, secs = timed_turn(strategy, board, player)
+                rate = strategy.nodes / secs if secs else 0
+                stats = (f" table hit rate {table.hit_rate:.1%} of "
+                         f"{table.probes} probes" if table else "")
+                print(f"{name}: alpha-beta depth {depth} {strategy.nodes} "
+                      f"nodes in {secs:.3f}s ({rate:,.0f} nodes/s) "
+                      f"{' '.join(map(str, turn))}{stats}")
+        if budget is not None:
+            strategy = AlphaBetaStrategy.timed(budget)
+            turn, secs = timed_turn(strategy, board, player)
+            print(f"{name}: {budget}s budget reached depth "
+                  f"{strategy.completed_depth} with {strategy.nodes} nodes in "
+                  f"{secs:.3f}s {' '.join(map(str, turn))}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3.6
+"""Benchmark for the Zobrist hash of the Santorini Board.
+
+Reports the collision rate of the full hash and of its low bits (as used
+to index a table) over positions from random games, and the cost of
+keeping the hash up to date compared to recomputing it.
+"""
+import random
+import sys
+import os
+import time
+from itertools import product
+sys.path.append(os.path.join(os.path.dirname(__file__), "../.."))
+from Santorini.Common.pieces import Board, Worker, Direction
+from Santorini.Common import rulechecker
+
+PLAYERS = ["one", "two"]
+WORKERS = [Worker(player, num) for player in PLAYERS for num in (1, 2)]
+
+
+def random_positions(count, seed=0):
+    """Yield boards from random games until count positions were seen.
+
+    :param int count: the number of positions to yield
+    :param int seed: the random seed
+    :rtype Generator[Board]
+    """
+    rng = random.Random(seed)
+    seen = 0
+    while seen < count:
+        board = Board()
+        cells = rng.sample(list(product(range(Board.BOARD_SIZE),
+                                        range(Board.BOARD_SIZE))), 4)
+        for worker, cell in zip(WORKERS, cells):
+            board.place_worker(worker, cell)
+        ply = 0
+        while seen < count:
+            worker = rng.choice([w for w in WORKERS
+                                 if w.player == PLAYERS[ply % 2]])
+            turns = [(m, b) for m, b in product(Direction, Direction)
+                     if rulechecker.can_move_build(board, worker, m, b)]
+            if not turns or rulechecker.get_winner(board):
+                break
+            board.make_turn(worker, *rng.choice(turns))
+            ply += 1
+            seen += 1
+            yield board
+
+
+def position_key(board):
+    """Return an exact key for a position, to detect hash collisions."""
+    return (str(board), board._side)
+
+
+def collisions(count, low_bits):
+    """Count full and low-bit hash collisions between distinct positions.
+
+    :rtype tuple(int, int, int): distinct positions, full collisions and
+    low-bit collisions
+    """
+    by_hash = {}
+    by_low = {}
+    mask = (1 << low_bits) - 1
+    full = low = 0
+    for board in random_positions(count):
+        key = position_key(board)
+        hashed = board.zobrist_hash
+        if by_hash.setdefault(hashed, key) != key:
+            full += 1
+        if by_low.setdefault(hashed & mask, key) != key:
+            low += 1
+    return len(by_hash), full, low
+
+
+def update_cost(rounds):
+    """Return the seconds per make/unmake pair and per full recompute."""
+    board = Board([[0, 1, 2], [1, 0, 3]],
+                  {WORKERS[0]: (0, 0), WORKERS[2]: (3, 3)})
+    start = time.perf_counter()
+    for _ in range(rounds):
+        board.make_turn(WORKERS[0], Direction.SOUTHEAST, Direction.EAST)
+        board.unmake_turn()
+    incremental = (time.perf_counter() - start) / rounds
+    start = time.perf_counter()
+    for _ in range(rounds):
+        board.compute_zobrist_hash()
+    full = (time.perf_counter() - start) / rounds
+    return incremental, full
+
+
+def main():
+    """Run the benchmarks and print their results."""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    low_bits = 16
+    distinct, full, low = collisions(count, low_bits)
+    print(f"positions: {count} ({distinct} distinct hashes)")
+    print(f"64-bit collisions: {full}")
+    print(f"{low_bits}-bit collisions: {low} "
+          f"(ideal ~{distinct - (1 << low_bits) * (1 - (1 - 2 ** -low_bits) ** distinct):.0f})")
+    incremental, recompute = update_cost(20000)
+    print(f"make+unmake with hash update: {incremental * 1e6:.2f} us")
+    print(f"full hash recompute: {recompute * 1e6:.2f} us")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,174 @@
+#!/usr/bin/env python3.6
+"""Vectorized Santorini rules for batches of positions, backed by NumPy.
+
+The rulechecker answers questions about one board at a time. The functions
+here answer the same questions for thousands of positions at once with
+array operations, for self-play analytics and evaluator training.
+
+A batch of N positions is given as:
+* heights, an integer array of shape (N, 6, 6) with the building height of
+  every cell
+* workers, an integer array of shape (N, W, 2) with the (row, col) of every
+  worker. The first W // 2 workers belong to the first player and the rest
+  to the second, in the order the players placed them.
+
+Masks have one entry per direction in DIRECTIONS order, which is the
+Direction order without STAY.
+"""
+
+import sys
+import os
+import numpy as np
+sys.path.append(os.path.join(os.path.dirname(__file__), "../.."))
+from Santorini.Common.pieces import Board, Building, Direction
+from Santorini.Common.rulechecker import MOVE_HEIGHT_DIFFERENCE
+
+# The directions along the direction axes of the masks
+DIRECTIONS = tuple(direction for direction in Direction
+                   if direction is not Direction.STAY)
+
+# (row, col) offset of every direction in DIRECTIONS
+OFFSETS = np.array([direction.value for direction in DIRECTIONS])
+
+# The heights are padded with this many cells of _PAD_HEIGHT on every side,
+# so that a move and then a build off the board land on a padded cell
+_PAD = 2
+
+# Too high to move onto or to build on from any height on the board
+_PAD_HEIGHT = 2 * Building.MAX_HEIGHT + 1
+
+
+def from_boards(boards, players):
+    """Stack boards into the arrays used by this module.
+
+    :param list Board boards: boards with two workers per player placed
+    :param list players: the two players, in slot order
+    :rtype (ndarray, ndarray): the heights, of shape (N, 6, 6), and the
+                               workers, of shape (N, 4, 2)
+    """
+    size = Board.BOARD_SIZE
+    heights = np.array([board.heights() for board in boards],
+                       dtype=np.int8).reshape(len(boards), size, size)
+    workers = np.array([[board.worker_position(worker)
+                         for player in players
+                         for worker in board.workers_of(player)]
+                        for board in boards], dtype=np.int8)
+    return heights, workers.reshape(len(boards), -1, 2)
+
+
+def _moves(heights, workers):
+    """Compute the move targets of every worker and which are legal.
+
+    :param ndarray heights: the heights of shape (N, 6, 6)
+    :param ndarray workers: the workers of shape (N, W, 2)
+    :rtype tuple: the padded heights, the padded occupancy, the batch
+                  index of shape (N, 1, 1), the padded worker rows and
+                  cols of shape (N, W), the padded target rows and cols of
+                  shape (N, W, 8) and the move mask of shape (N, W, 8)
+    """
+    heights = np.asarray(heights)
+    workers = np.asarray(workers)
+    padded = np.pad(heights.astype(np.int8), ((0, 0), (_PAD, _PAD), (_PAD, _PAD)),
+                    mode="constant", constant_values=_PAD_HEIGHT)
+    batch = np.arange(len(heights))[:, None]
+    rows = workers[..., 0].astype(np.intp) + _PAD
+    cols = workers[..., 1].astype(np.intp) + _PAD
+    occupied = np.zeros(padded.shape, dtype=bool)
+    occupied[batch, rows, cols] = True
+
+    batch = batch[..., None]
+    target_rows = rows[..., None] + OFFSETS[:, 0]
+    target_cols = cols[..., None] + OFFSETS[:, 1]
+    climb = (padded[batch, target_rows, target_cols] -
+             padded[batch[..., 0], rows, cols][..., None])
+    can_move = (~occupied[batch, target_rows, target_cols] &
+                (climb <= MOVE_HEIGHT_DIFFERENCE))
+    return (padded, occupied, batch, rows, cols, target_rows, target_cols,
+            can_move)
+
+
+def move_masks(heights, workers):
+    """Return which moves every worker can make.
+
+    A move is legal when it stays on the board, the target is not occupied
+    and it climbs at most MOVE_HEIGHT_DIFFERENCE floors, like
+    rulechecker.can_move_build without a build.
+
+    :param ndarray heights: the heights of shape (N, 6, 6)
+    :param ndarray workers: the workers of shape (N, W, 2)
+    :rtype ndarray: a bool array of shape (N, W, 8), True at [n, w, m] when
+                    worker w of position n can move in DIRECTIONS[m]
+    """
+    return _moves(heights, workers)[-1]
+
+
+def build_masks(heights, workers):
+    """Return which move+build turns every worker can make.
+
+    The build is checked on the board after the move: the cell the worker
+    left is free unless another worker shares it, and a building at
+    Building.MAX_HEIGHT cannot be built on.
+
+    :param ndarray heights: the heights of shape (N, 6, 6)
+    :param ndarray workers: the workers of shape (N, W, 2)
+    :rtype ndarray: a bool array of shape (N, W, 8, 8), True at
+                    [n, w, m, b] when worker w of position n can move in
+                    DIRECTIONS[m] and then build in DIRECTIONS[b]
+    """
+    (padded, occupied, batch, rows, cols, target_rows, target_cols,
+     can_move) = _moves(heights, workers)
+    batch = batch[..., None]
+    build_rows = target_rows[..., None] + OFFSETS[:, 0]
+    build_cols = target_cols[..., None] + OFFSETS[:, 1]
+
+    shared = ((rows[:, :, None] == rows[:, None, :]) &
+              (cols[:, :, None] == cols[:, None, :])).sum(axis=2) > 1
+    vacated = ((build_rows == rows[..., None, None]) &
+               (build_cols == cols[..., None, None]) &
+               ~shared[..., None, None])
+    free = ~occupied[batch, build_rows, build_cols] | vacated
+    return (can_move[..., None] & free &
+            (padded[batch, build_rows, build_cols] < Building.MAX_HEIGHT))
+
+
+def immediate_wins(heights, workers):
+    """Return which workers can win with their next move.
+
+    A worker wins by moving up onto a building of height
+    Building.MAX_HEIGHT - 1.
+
+    :param ndarray heights: the heights of shape (N, 6, 6)
+    :param ndarray workers: the workers of shape (N, W, 2)
+    :rtype ndarray: a bool array of shape (N, W)
+    """
+    (padded, _, batch, _, _, target_rows, target_cols,
+     can_move) = _moves(heights, workers)
+    on_top = padded[batch, target_rows, target_cols] == Building.MAX_HEIGHT - 1
+    return (can_move & on_top).any(axis=2)
+
+
+def winners(heights, workers):
+    """Return the winner of every position, like rulechecker.get_winner.
+
+    A player wins when one of their workers is on a building of height
+    Building.MAX_HEIGHT - 1, the first such worker decides. Otherwise a
+    player loses when none of their workers can move, the first player is
+    checked first.
+
+    :param ndarray heights: the heights of shape (N, 6, 6)
+    :param ndarray workers: the workers of shape (N, W, 2), W even
+    :rtype ndarray: an int array of shape (N,) with the index of the
+                    winning player, 0 or 1, or -1 if there is no winner
+    """
+    (padded, _, batch, rows, cols, _, _,
+     can_move) = _moves(heights, workers)
+    per_player = rows.shape[1] // 2
+    on_top = padded[batch[..., 0], rows, cols] == Building.MAX_HEIGHT - 1
+    stuck = ~can_move.any(axis=2).reshape(len(rows), 2, per_player).any(axis=2)
+
+    result = np.full(len(rows), -1, dtype=np.int8)
+    result[stuck[:, 1]] = 0
+    result[stuck[:, 0]] = 1
+    climbed = on_top.any(axis=1)
+    result[climbed] = on_top.argmax(axis=1)[climbed] // per_player
+    return result
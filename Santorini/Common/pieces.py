@@ -2,44 +2,125 @@
 """Santorini game pieces implementation."""
 from operator import add
 from enum import Enum
+import hashlib
+from itertools import product
 import json
+import random
+from types import MappingProxyType
+import weakref
 
-class Board:
-    """Board implementation for Santorini."""
+class _JsonCache:
+    """Holder for the last Json rendering of a board.
+
+    It is shared by a Board, its clones and its snapshots, last is replaced
+    whenever one of them renders a different position.
+    """
+
+    __slots__ = ("last",)
+
+    def __init__(self):
+        self.last = None
+
+    def __reduce__(self):
+        return (_JsonCache, ())
+
+
+class _JsonDump:
+    """The Json rendering of a single position of a board.
+
+    It keeps the parts of the position it was rendered from, so that the
+    next rendering can tell which tiles have changed.
+    """
+
+    __slots__ = ("names", "levels", "occupied", "cells", "buried",
+                 "worker_list", "tiles", "worker_places", "encoded")
+
+    def __init__(self, board, names, tiles, worker_places):
+        """Record a rendering of a board.
+
+        :param Board | BoardState board: the rendered board
+        :param map{Uuid -> String} names: the names used for the workers
+        :param 2D List tiles: the rendered tiles
+        :param List worker_places: the rendered worker placements
+        """
+        self.names = names
+        self.levels = tuple(board._levels)
+        self.occupied = board._occupied
+        self.cells = dict(board._cells)
+        self.buried = tuple(board._buried)
+        self.worker_list = board._worker_list
+        self.tiles = tiles
+        self.worker_places = worker_places
+        self.encoded = None
+
+
+class _BoardQueries:
+    """The queries shared by a Board and a BoardState.
+
+    See Board for the attributes these read.
+    """
 
     # Board dimensions are 6x6
     BOARD_SIZE = 6
 
-    def __init__(self, board=None, workers=None):
-        """Create a 6x6 board. with 0-floor buildings in each cell.
+    __slots__ = ("_levels", "_side", "_hash", "_workers", "_occupied",
+                 "_cells", "_buried", "_worker_list", "_by_player",
+                 "_json_cache")
 
-        _board is a 2-d array of Buildings representing the Santorini board,
+    @property
+    def zobrist_hash(self):
+        """Return the 64-bit Zobrist hash of this board.
 
-        _workers is a dictionary of Workers to Position (ROW, COLUMN) on board
+        The hash covers the building heights, the worker positions and the
+        side to move, and is kept up to date incrementally by every change to
+        the board. The side to move flips every time a worker moves, since
+        every turn moves exactly one worker.
+
+        Equal positions have equal hashes, different positions collide with
+        a probability of about 2^-64.
+
+        :rtype int: the hash in [0, 2^64)
         """
-        if board:
-            self._board = []
-            for row in range(self.BOARD_SIZE):
-                self._board.append([])
-                for col in range(self.BOARD_SIZE):
-                    try:
-                        height = board[row][col]
-                    except IndexError:
-                        height = 0
-                    self._board[row].append(Building(height))
-        else:
-            self._board = [[Building() for col in range(self.BOARD_SIZE)]
-                           for row in range(self.BOARD_SIZE)]
+        return self._hash
 
-        if workers:
-            self._workers = workers
-        else:
-            self._workers = {}
+    def compute_zobrist_hash(self):
+        """Recompute the Zobrist hash of this board from scratch.
+
+        :rtype int: the hash in [0, 2^64), equal to zobrist_hash
+        """
+        full = _ZOBRIST_SIDE if self._side else 0
+        for level, bits in enumerate(self._levels):
+            for cell in range(self.BOARD_SIZE * self.BOARD_SIZE):
+                if bits & (1 << cell):
+                    full ^= _ZOBRIST_LEVELS[level][cell]
+        for worker, pos in self._workers.items():
+            full ^= _zobrist_worker_keys(worker)[self._cell(pos)]
+        return full
 
     @property
     def workers(self):
-        """Return the list of workers on this board."""
-        return list(self._workers.keys())
+        """Return the workers on this board in the order they were placed.
+
+        :rtype tuple of Worker
+        """
+        return self._worker_list
+
+    def workers_of(self, player):
+        """Return the workers of a player in the order they were placed.
+
+        :param Uuid player: the player the workers belong to
+        :rtype tuple of Worker
+        """
+        return self._by_player.get(player, ())
+
+    def worker_at(self, pos):
+        """Return the worker on a position.
+
+        :param tuple (row, col): a position on the board
+        :rtype Worker | None: the worker on the position, or None if there
+        is no worker on it
+        """
+        return self._cells.get(pos)
 
     def assert_bounds(self, pos):
         """Raise an exception if the position is out of bounds.
@@ -50,69 +131,36 @@ class Board:
         """
         row, col = pos
 
-        if not (row in range(self.BOARD_SIZE) and
-                col in range(self.BOARD_SIZE)):
+        if not (0 <= row < self.BOARD_SIZE and 0 <= col < self.BOARD_SIZE):
             raise IndexError("Cannot place a worker out of board bounds")
 
-    def place_worker(self, worker, pos):
-        """Place a worker in a starting position on the board.
-
-        This method updates the current dictionary of workers
-        to set the input worker's position to the new input
-        pos
+    def _cell(self, pos):
+        """Return the bitboard index of a position.
 
-        :param Worker worker: a Worker object
-        :param tuple (row, col): a position on the board
+        :param tuple (row, col): A position on the game board
+        :rtype int: the bit of the position in the board's bitboards
         :raises IndexError: if the position is outside of the board
-        range [0,BOARD_SIZE)
-        """
-        self.assert_bounds(pos)
-        self._workers[worker] = pos
-
-    def move_worker(self, worker, direction):
-        """Move a worker to a new position on the board.
-
-        This method updates the worker's position
-        in the internal dictionary to the new position
-        calculated from the input direction
-
-        *a Worker *must* be placed before it can move
-        *This does not check if a worker can move there.
-
-        :param Worker worker: a Worker on the board
-        :param Direction direction: a Direction on the board
-        :raise IndexError: if the calculated position is outside the bounds of
-        the board#
-        :raise LookupError: if the worker is not found on the board (i.e. in
-        the _workers dict)
-        :raise ValueError: if the calculated position is already occupied by
-        another Worker
         """
-        pos = self.worker_position(worker)
-        cur_pos = Direction.move_position(pos, direction)
-        self.assert_bounds(cur_pos)
-        self._workers[worker] = cur_pos
-
-    def build_floor(self, worker, direction):
-        """Build one floor of a building at a position.
-
-        build_floor adds a single floor to the given position.
-        All valid positions on the board are buildings, starting
-        at 0 floors. Increments the Building's floor counter by one
+        try:
+            return CELL_INDEX[pos]
+        except (KeyError, TypeError):
+            self.assert_bounds(pos)
+            row, col = pos
+            return row * self.BOARD_SIZE + col
 
-        Building on a position that already has 4 floors does nothing.
+    def _cell_height(self, cell):
+        """Return the number of floors on a cell.
 
-        :param Worker worker: a Worker on the board
-        :param Direction direction: a Direction on the board
-        :raise IndexError: if the calculated position is outside the bounds of
-        the board
-        :raise LookupError: if the worker is not found on the board (i.e. in
-        the _workers dict)
+        :param int cell: the bitboard index of a position
+        :rtype int: the building height at the cell
         """
-        pos = self.worker_position(worker)
-        row, col = Direction.move_position(pos, direction)
-        self.assert_bounds((row, col))
-        self._board[row][col].build()
+        bit = 1 << cell
+        height = 0
+        for level in self._levels:
+            if not level & bit:
+                break
+            height += 1
+        return height
 
     def get_height(self, position, direction):
         """Get the height of a building.
@@ -126,9 +174,8 @@ class Board:
         :raise IndexError: if the calculated position is outside the bounds of
         the board
         """
-        row, col = Direction.move_position(position, direction)
-        self.assert_bounds((row, col))
-        return self._board[row][col].floor
+        cell = self._cell(Direction.move_position(position, direction))
+        return self._cell_height(cell)
 
     def is_maxheight(self, position, direction):
         """Return if location from worker pos & dir is at max height.
@@ -137,9 +184,8 @@ class Board:
         :param Direction direction: the direction the Worker is interested in
         :rtype bool: True if the desired building is at max height
         """
-        row, col = Direction.move_position(position, direction)
-        self.assert_bounds((row, col))
-        return self._board[row][col].is_max_height()
+        cell = self._cell(Direction.move_position(position, direction))
+        return bool(self._levels[-1] & (1 << cell))
 
     def worker_position(self, worker):
         """Return the position of the given worker as a (row, col).
@@ -159,7 +205,10 @@ class Board:
         :param Position (row, col): the position to check against
         :rtype bool: Returns if the position is not occupied and valid
         """
-        return any([p == pos for p in self._workers.values()])
+        row, col = pos
+        if not (0 <= row < self.BOARD_SIZE and 0 <= col < self.BOARD_SIZE):
+            return False
+        return bool(self._occupied & (1 << (row * self.BOARD_SIZE + col)))
 
     def is_neighbor(self, worker, direction):
         """Check if the input worker has a neighbor.
@@ -169,12 +218,57 @@ class Board:
         :raises KeyError: if the worker is not in the dictionary
         :rtype bool
         """
-        try:
-            pos = self.worker_position(worker)
-            self.assert_bounds(Direction.move_position(pos, direction))
-        except IndexError:
-            return False
-        return True
+        pos = self.worker_position(worker)
+        return Direction.move_position(pos, direction) in CELL_INDEX
+
+    def heights(self):
+        """Return the building heights as a flat list of ints.
+
+        :rtype list of int: the height of every position in CELLS order
+        """
+        return [self._cell_height(cell)
+                for cell in range(self.BOARD_SIZE * self.BOARD_SIZE)]
+
+    def _height_grid(self):
+        """Return the building heights as a 2-d list of ints.
+        :rtype list of list of int
+        """
+        heights = self.heights()
+        return [heights[row * self.BOARD_SIZE:(row + 1) * self.BOARD_SIZE]
+                for row in range(self.BOARD_SIZE)]
+
+    def to_bytes(self, players=None):
+        """Give a compact binary representation of the board.
+
+        The encoding is 19 + (number of workers) bytes, 23 for a game:
+        * 18 bytes of heights, one nibble per cell in CELLS order, the even
+          cell of each pair in the low nibble
+        * 1 byte with the number of workers in the high nibble and the side
+          to move in the lowest bit
+        * 1 byte per worker in the order they were placed, the cell index in
+          the low 6 bits, the worker number - 1 in bit 6 and the owner's slot
+          in players in bit 7
+
+        :param list players: the (at most two) players that own the workers,
+        defaults to the players in the order their first worker was placed
+        :rtype bytes: the encoded board, see from_bytes
+        :raise ValueError: if a worker's player is not one of two players
+        """
+        players = list(self._by_player if players is None else players)
+        if len(players) > _BYTES_MAX_PLAYERS:
+            raise ValueError("Cannot encode more than two players")
+        heights = self.heights()
+        data = bytearray(heights[cell] | heights[cell + 1] << 4
+                         for cell in range(0, len(heights), 2))
+        data.append(len(self._worker_list) << 4 | self._side)
+        for worker in self._worker_list:
+            try:
+                slot = players.index(worker.player)
+            except ValueError:
+                raise ValueError(f"No slot for the player of {worker!r}")
+            data.append(slot << 7 | (worker.number - 1) << 6 |
+                        self._cell(self._workers[worker]))
+        return bytes(data)
 
     def dump_as_json(self, id_to_name):
         """
@@ -183,17 +277,7 @@ class Board:
         :rtype 2D List of string or int: a 2D list representing the board
                                          which can be dumped to json
         """
-        tiles = []
-        for i in range(self.BOARD_SIZE):
-            tiles.append([])
-            for j in range(self.BOARD_SIZE):
-                tiles[i].append(self.get_height((i, j), Direction.STAY))
-
-        for w in self.workers:
-            row, col = self.worker_position(w)
-            tiles[row][col] = str(tiles[row][col]) + w.dump_with_name(id_to_name)
-
-        return tiles
+        return [list(row) for row in self._json_dump(id_to_name).tiles]
 
     def dump_workers_as_json(self, id_to_name):
         """
@@ -201,26 +285,491 @@ class Board:
         :param map{Uuid -> String} id_to_name: map of uuids to player name
         :rtype List of WorkerPlace: List of worker placements
         """
-        worker_placements = []
-        for w in self.workers:
-            worker = w.dump_with_name(id_to_name)
-            row, col = self._workers[w]
-            worker_placements.append([worker, row, col])
-        return worker_placements
+        return [list(place)
+                for place in self._json_dump(id_to_name).worker_places]
 
+    def dump_as_json_bytes(self, id_to_name):
+        """
+        Gives the encoded Json text of dump_as_json, ready to be sent.
+        :param map{Uuid -> String} id_to_name: map of uuids to player name
+        :rtype bytes: the utf-8 encoded Json
+        """
+        dump = self._json_dump(id_to_name)
+        if dump.encoded is None:
+            dump.encoded = json.dumps(dump.tiles).encode()
+        return dump.encoded
+
+    def _json_dump(self, id_to_name):
+        """Return the Json rendering of this position, rebuilding as little
+        of the last rendering as possible.
+
+        The last rendering is shared with the clones and snapshots of the
+        board. The cells that differ from it are found by comparing the
+        bitboards and the worker index, only those tiles are rebuilt. It is
+        thrown away when id_to_name is different from the one it was made
+        with.
+
+        :param map{Uuid -> String} id_to_name: map of uuids to player name
+        :rtype _JsonDump: the rendering of this position
+        """
+        last = self._json_cache.last
+        if last is None or last.names != id_to_name:
+            changed = (1 << self.BOARD_SIZE * self.BOARD_SIZE) - 1
+            tiles = [[0] * self.BOARD_SIZE for _ in range(self.BOARD_SIZE)]
+        else:
+            changed = last.occupied ^ self._occupied
+            for old, new in zip(last.levels, self._levels):
+                changed |= old ^ new
+            for pos, worker in self._cells.items():
+                if last.cells.get(pos) is not worker:
+                    changed |= 1 << self._cell(pos)
+            for pos in set(last.buried).union(self._buried):
+                changed |= 1 << self._cell(pos)
+            if not changed and last.worker_list == self._worker_list:
+                return last
+            tiles = [list(row) for row in last.tiles]
+
+        stacked = {}
+        for worker in self._worker_list:
+            cell = self._cell(self._workers[worker])
+            if changed >> cell & 1:
+                stacked.setdefault(cell, []).append(
+                    worker.dump_with_name(id_to_name))
+        while changed:
+            low = changed & -changed
+            cell = low.bit_length() - 1
+            changed ^= low
+            tile = self._cell_height(cell)
+            if cell in stacked:
+                tile = str(tile) + "".join(stacked[cell])
+            tiles[cell // self.BOARD_SIZE][cell % self.BOARD_SIZE] = tile
+
+        worker_places = [[worker.dump_with_name(id_to_name)] +
+                         list(self._workers[worker])
+                         for worker in self._worker_list]
+        dump = _JsonDump(self, dict(id_to_name), tiles, worker_places)
+        self._json_cache.last = dump
+        return dump
 
     def __str__(self):
         """Give a readable string representation of this board.
         :rtype str
         """
-        return "Board: " + str(self._board) + " Workers: " + str(self._workers.items())
+        return ("Board: " + str(self._height_grid()) +
+                " Workers: " + str(self._workers.items()))
+
+class Board(_BoardQueries):
+    """Board implementation for Santorini."""
+
+    __slots__ = ("_undo_stack", "_snapshot")
+
+    def __init__(self, board=None, workers=None):
+        """Create a 6x6 board. with 0-floor buildings in each cell.
+
+        The board is stored as bitboards: cell (row, col) is bit
+        row * BOARD_SIZE + col of a 36-bit integer.
+
+        _levels is a list of Building.MAX_HEIGHT bitboards, bit i of
+        _levels[k] is set when cell i has more than k floors
+
+        _workers is a dictionary of Workers to Position (ROW, COLUMN) on board
+
+        _occupied is a bitboard of the cells that have a Worker on them
+
+        _cells is the reverse of _workers, a dictionary of Position to the
+        Worker on it. Workers that another worker was put on top of are kept
+        in _buried, a dictionary of Position to a list of Workers
+
+        _worker_list is a tuple of the workers in the order they were placed
+        and _by_player is a dictionary of player to a tuple of their workers
+
+        _undo_stack is a list of undo records for the turns played with
+        make_turn, most recent last
+
+        _side is 0 or 1, it flips every time a worker moves
+
+        _hash is the 64-bit Zobrist hash of the heights, the worker positions
+        and the side to move, see zobrist_hash
+
+        _snapshot is the BoardState of the current position once snapshot has
+        been called, it is dropped as soon as the board changes
+
+        _json_cache holds the last Json rendering of the board, shared with
+        its clones and snapshots, see dump_as_json
+        """
+        self._levels = [0] * Building.MAX_HEIGHT
+        self._side = 0
+        self._hash = 0
+        if board:
+            for row in range(self.BOARD_SIZE):
+                for col in range(self.BOARD_SIZE):
+                    try:
+                        height = board[row][col]
+                    except IndexError:
+                        height = 0
+                    bit = 1 << (row * self.BOARD_SIZE + col)
+                    for level in range(min(height, Building.MAX_HEIGHT)):
+                        self._levels[level] |= bit
+                        self._hash ^= _ZOBRIST_LEVELS[level][row * self.BOARD_SIZE + col]
+
+        self._workers = {}
+        self._occupied = 0
+        self._cells = {}
+        self._buried = {}
+        self._worker_list = ()
+        self._by_player = {}
+        self._undo_stack = []
+        self._snapshot = None
+        self._json_cache = _JsonCache()
+        if workers:
+            for worker, pos in workers.items():
+                self.place_worker(worker, pos)
+
+    def clone(self):
+        """Return a copy of this board that can be changed independently.
+
+        This is a flat copy of the height bitboards and the worker
+        dictionary, Workers are immutable so they are shared with the copy.
+        The undo stack is not copied, the clone starts with no turns to undo.
+
+        :rtype Board: the copied board
+        """
+        board = self.__class__.__new__(self.__class__)
+        board._levels = list(self._levels)
+        board._workers = dict(self._workers)
+        board._occupied = self._occupied
+        board._cells = dict(self._cells)
+        board._buried = {pos: list(buried)
+                         for pos, buried in self._buried.items()}
+        board._worker_list = self._worker_list
+        board._by_player = dict(self._by_player)
+        board._undo_stack = []
+        board._snapshot = self._snapshot
+        board._json_cache = self._json_cache
+        board._side = self._side
+        board._hash = self._hash
+        return board
+
+    def snapshot(self):
+        """Return an immutable snapshot of the current position.
+
+        The snapshot is made once per position: asking again before the
+        board changes returns the same BoardState.
+
+        :rtype BoardState: the current position
+        """
+        if self._snapshot is None:
+            self._snapshot = BoardState(self)
+        return self._snapshot
+
+    def _flip_side(self):
+        """Pass the turn to the other side."""
+        self._snapshot = None
+        self._side ^= 1
+        self._hash ^= _ZOBRIST_SIDE
+
+    def _set_position(self, worker, pos):
+        """Put a worker at a position and keep the indexes in sync.
+
+        :param Worker worker: a Worker object
+        :param tuple (row, col): a position on the board
+        :raises IndexError: if the position is outside of the board
+        """
+        cell = self._cell(pos)
+        keys = _zobrist_worker_keys(worker)
+        self._snapshot = None
+        old_pos = self._workers.get(worker)
+        self._workers[worker] = pos
+        if old_pos is None:
+            self._worker_list += (worker,)
+            self._by_player[worker.player] = (self.workers_of(worker.player) +
+                                              (worker,))
+        else:
+            old_cell = self._cell(old_pos)
+            self._hash ^= keys[old_cell]
+            self._remove_from_cell(worker, old_pos)
+            if old_pos not in self._cells:
+                self._occupied &= ~(1 << old_cell)
+        if pos in self._cells:
+            self._buried.setdefault(pos, []).append(self._cells[pos])
+        self._cells[pos] = worker
+        self._occupied |= 1 << cell
+        self._hash ^= keys[cell]
+
+    def _remove_from_cell(self, worker, pos):
+        """Take a worker off a position in the reverse index.
+
+        :param Worker worker: a Worker on the position
+        :param tuple (row, col): the position the worker is leaving
+        """
+        buried = self._buried.get(pos)
+        if not buried:
+            del self._cells[pos]
+            return
+        if self._cells[pos] == worker:
+            self._cells[pos] = buried.pop()
+        else:
+            buried.remove(worker)
+        if not buried:
+            del self._buried[pos]
+
+    def place_worker(self, worker, pos):
+        """Place a worker in a starting position on the board.
+
+        This method updates the current dictionary of workers
+        to set the input worker's position to the new input
+        pos
+
+        :param Worker worker: a Worker object
+        :param tuple (row, col): a position on the board
+        :raises IndexError: if the position is outside of the board
+        range [0,BOARD_SIZE)
+        """
+        self._set_position(worker, pos)
+
+    def move_worker(self, worker, direction):
+        """Move a worker to a new position on the board.
+
+        This method updates the worker's position
+        in the internal dictionary to the new position
+        calculated from the input direction
+
+        *a Worker *must* be placed before it can move
+        *This does not check if a worker can move there.
+
+        :param Worker worker: a Worker on the board
+        :param Direction direction: a Direction on the board
+        :raise IndexError: if the calculated position is outside the bounds of
+        the board#
+        :raise LookupError: if the worker is not found on the board (i.e. in
+        the _workers dict)
+        :raise ValueError: if the calculated position is already occupied by
+        another Worker
+        """
+        pos = self.worker_position(worker)
+        cur_pos = Direction.move_position(pos, direction)
+        self._set_position(worker, cur_pos)
+        self._flip_side()
+
+    def build_floor(self, worker, direction):
+        """Build one floor of a building at a position.
+
+        build_floor adds a single floor to the given position.
+        All valid positions on the board are buildings, starting
+        at 0 floors. Increments the Building's floor counter by one
+
+        Building on a position that already has 4 floors does nothing.
+
+        :param Worker worker: a Worker on the board
+        :param Direction direction: a Direction on the board
+        :raise IndexError: if the calculated position is outside the bounds of
+        the board
+        :raise LookupError: if the worker is not found on the board (i.e. in
+        the _workers dict)
+        :raise OverflowError: if the building is already at
+        Building.MAX_HEIGHT
+        """
+        pos = self.worker_position(worker)
+        cell = self._cell(Direction.move_position(pos, direction))
+        height = self._cell_height(cell)
+        if height == Building.MAX_HEIGHT:
+            raise OverflowError(f"Cannot build over {Building.MAX_HEIGHT}")
+        self._snapshot = None
+        self._levels[height] |= 1 << cell
+        self._hash ^= _ZOBRIST_LEVELS[height][cell]
+
+    def make_turn(self, worker, move_dir, build_dir=None):
+        """Play a turn on this board in place so that it can be undone.
+
+        The worker is moved in move_dir and then, if given, builds in
+        build_dir. An undo record of (Worker, (row, col), cell) is pushed on
+        the undo stack, where (row, col) is the position the worker moved
+        from and cell is the bitboard index that was built on, or None.
+
+        *This does not check if the turn is valid, see the rulechecker.
+
+        :param Worker worker: a Worker on the board
+        :param Direction move_dir: the Direction to move the worker in
+        :param Direction build_dir: an (optional) Direction to build in
+        :rtype tuple: the undo record for the turn
+        :raise IndexError: if a calculated position is outside the bounds of
+        the board
+        :raise OverflowError: if the build is on a building at
+        Building.MAX_HEIGHT
+        """
+        from_pos = self.worker_position(worker)
+        self.move_worker(worker, move_dir)
+        build_cell = None
+        if build_dir:
+            try:
+                build_cell = self._cell(Direction.move_position(
+                    self._workers[worker], build_dir))
+                self.build_floor(worker, build_dir)
+            except (IndexError, OverflowError):
+                self._set_position(worker, from_pos)
+                self._flip_side()
+                raise
+        record = (worker, from_pos, build_cell)
+        self._undo_stack.append(record)
+        return record
+
+    def unmake_turn(self):
+        """Undo the most recent turn played with make_turn.
+
+        Restores the worker's position and removes the floor it built.
+
+        :rtype tuple: the undo record of the turn that was undone
+        :raise IndexError: if there is no turn to undo
+        """
+        record = self._undo_stack.pop()
+        worker, from_pos, build_cell = record
+        if build_cell is not None:
+            height = self._cell_height(build_cell)
+            self._snapshot = None
+            self._levels[height - 1] &= ~(1 << build_cell)
+            self._hash ^= _ZOBRIST_LEVELS[height - 1][build_cell]
+        self._set_position(worker, from_pos)
+        self._flip_side()
+        return record
+
+    @classmethod
+    def from_bytes(cls, data, players):
+        """Create a board from its binary representation.
+
+        The data is read in place, it is not copied.
+
+        :param bytes | memoryview data: a board encoded with to_bytes
+        :param list players: the players that own the workers, in the slot
+        order used to encode the board
+        :rtype Board: the decoded board
+        :raise ValueError: if the data is not a valid encoded board
+        """
+        view = memoryview(data)
+        cells = cls.BOARD_SIZE * cls.BOARD_SIZE
+        header = cells // 2
+        if len(view) <= header or len(view) != header + 1 + (view[header] >> 4):
+            raise ValueError("Encoded board has the wrong length")
+        board = cls()
+        for cell in range(cells):
+            height = view[cell >> 1] >> 4 * (cell & 1) & 0xF
+            if height > Building.MAX_HEIGHT:
+                raise ValueError(f"Cannot decode a height of {height}")
+            for level in range(height):
+                board._levels[level] |= 1 << cell
+                board._hash ^= _ZOBRIST_LEVELS[level][cell]
+        for byte in view[header + 1:]:
+            if byte & 0x3F >= cells:
+                raise ValueError("Encoded worker is off the board")
+            worker = Worker(players[byte >> 7], (byte >> 6 & 1) + 1)
+            board.place_worker(worker, CELLS[byte & 0x3F])
+        if view[header] & 1:
+            board._flip_side()
+        return board
+
+
+class BoardState(_BoardQueries):
+    """An immutable snapshot of a Board.
+
+    A BoardState answers the same queries as the Board it was taken from but
+    cannot be changed, so it can be handed to players and observers without
+    copying and used as a dictionary key. Two states are equal when they
+    have the same heights, workers and side to move; the hash is the Zobrist
+    hash of the position.
+
+    Use Board.snapshot to make one and to_board to get a Board back.
+    """
+
+    __slots__ = ()
+
+    def __init__(self, board):
+        """Take a snapshot of a board.
+
+        :param Board board: the board to copy the position of
+        """
+        init = super().__setattr__
+        init("_levels", tuple(board._levels))
+        init("_side", board._side)
+        init("_hash", board._hash)
+        init("_workers", MappingProxyType(dict(board._workers)))
+        init("_occupied", board._occupied)
+        init("_cells", MappingProxyType(dict(board._cells)))
+        init("_buried", MappingProxyType(
+            {pos: tuple(buried) for pos, buried in board._buried.items()}))
+        init("_worker_list", board._worker_list)
+        init("_by_player", MappingProxyType(dict(board._by_player)))
+        init("_json_cache", board._json_cache)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __eq__(self, other):
+        if self is other:
+            return True
+        if not isinstance(other, BoardState):
+            return NotImplemented
+        return (self._hash == other._hash and
+                self._levels == other._levels and
+                self._side == other._side and
+                self._workers == other._workers)
+
+    def __hash__(self):
+        return self._hash
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __reduce__(self):
+        return (BoardState, (self.to_board(),))
+
+    def snapshot(self):
+        """Return this state, it is already immutable.
+
+        :rtype BoardState: self
+        """
+        return self
+
+    def to_board(self):
+        """Return a Board with this position that can be changed.
+
+        :rtype Board: a new board, with no turns to undo
+        """
+        board = Board.__new__(Board)
+        board._levels = list(self._levels)
+        board._workers = dict(self._workers)
+        board._occupied = self._occupied
+        board._cells = dict(self._cells)
+        board._buried = {pos: list(buried)
+                         for pos, buried in self._buried.items()}
+        board._worker_list = self._worker_list
+        board._by_player = dict(self._by_player)
+        board._undo_stack = []
+        board._snapshot = None
+        board._json_cache = self._json_cache
+        board._side = self._side
+        board._hash = self._hash
+        return board
+
+    clone = to_board
+
 
 class Building:
-    """A game piece representing a building in Santorini."""
+    """A game piece representing a building in Santorini.
+
+    The Board stores heights as plain ints, a Building is a standalone
+    piece for code that works with a single building.
+    """
 
     # Maximum height of a building is four
     MAX_HEIGHT = 4
 
+    __slots__ = ("_floor",)
+
     def __init__(self, floor=0):
         """Create a building with 0 floors."""
         self._floor = floor
@@ -256,12 +805,22 @@ class Building:
         return str(self._floor)
 
 class Worker:
-    """A game piece representing a worker in Santorini."""
+    """A game piece representing a worker in Santorini.
+
+    Workers are immutable and interned, there is one Worker object per
+    (player, number) for as long as it is in use, so equal workers are
+    usually the same object and copying a worker returns it unchanged.
+    """
 
     NUM_WORKERS = 2
 
-    def __init__(self, player, num):
-        """Create a worker.
+    __slots__ = ("_player", "_num", "_hash", "_zobrist_keys", "__weakref__")
+
+    # The interned workers, keyed by (player, number)
+    _instances = weakref.WeakValueDictionary()
+
+    def __new__(cls, player, num):
+        """Create a worker, or return the existing one.
 
         Worker will be associated with the player and the piece number
         given as inputs
@@ -269,11 +828,19 @@ class Worker:
         :param int num: the piece number [1 - NUM_WORKERS]
         :raises ValueError when num is out of range [1 - NUM_WORKERS]
         """
-        self._player = player
-        if num in range(1, self.NUM_WORKERS + 1):
-            self._num = num
-        else:
+        key = (player, num)
+        worker = cls._instances.get(key)
+        if worker is not None:
+            return worker
+        if num not in range(1, cls.NUM_WORKERS + 1):
             raise ValueError("Worker number out of range!")
+        worker = super().__new__(cls)
+        worker._player = player
+        worker._num = num
+        worker._hash = hash(key)
+        worker._zobrist_keys = None
+        cls._instances[key] = worker
+        return worker
 
     @property
     def player(self):
@@ -296,14 +863,28 @@ class Worker:
 
     def __eq__(self, other):
         """Worker piece equality."""
+        if self is other:
+            return True
         if not isinstance(other, Worker):
             return False
         return (self._player == other.player and
                 self._num == other.number)
 
     def __hash__(self):
-        """Worker piece hashing."""
-        return hash((self._player, self._num))
+        """Worker piece hashing, the hash is computed once on creation."""
+        return self._hash
+
+    def __copy__(self):
+        """Workers are immutable, a copy is the worker itself."""
+        return self
+
+    def __deepcopy__(self, memo):
+        """Workers are immutable, a copy is the worker itself."""
+        return self
+
+    def __reduce__(self):
+        """Pickle a worker so that it is interned again when loaded."""
+        return (Worker, (self._player, self._num))
 
     def __repr__(self):
         """Return a readable string representation of a worker
@@ -330,9 +911,16 @@ class Direction(Enum):
     STAY = (0, 0)
 
     def __init__(self, row, col):
-        """Create the Direction."""
+        """Create the Direction.
+
+        moves is a table of every position on the board to the position one
+        step in this direction from it, which may be off the board
+        """
         self.row = row
         self.col = col
+        self.moves = {(r, c): (r + row, c + col)
+                      for r, c in product(range(Board.BOARD_SIZE),
+                                          range(Board.BOARD_SIZE))}
 
     @property
     def vector(self):
@@ -343,11 +931,16 @@ class Direction(Enum):
     def move_position(pos, direction):
         """Return the new position as (row, col) given a direction to move in.
 
+        Positions on the board are read from the direction's moves table,
+        any other position is calculated.
+
         :param pos (row, col):
         :param Direction direction:
         """
-        pos = tuple(map(add, pos, direction.vector))
-        return pos
+        try:
+            return direction.moves[pos]
+        except (KeyError, TypeError):
+            return tuple(map(add, pos, direction.vector))
 
     def string_values(self):
         """Return Direction as a list of strings, EAST or WEST and NORTH or SOUTH
@@ -382,3 +975,60 @@ DIR_TABLE = {("PUT", "NORTH"): Direction.NORTH,
              ("WEST", "NORTH"): Direction.NORTHWEST,
              ("EAST", "SOUTH"): Direction.SOUTHEAST,
              ("WEST", "SOUTH"): Direction.SOUTHWEST}
+
+# Every position on the board in row-major order, the index of a position
+# in CELLS is its bitboard index
+CELLS = tuple(product(range(Board.BOARD_SIZE), range(Board.BOARD_SIZE)))
+
+CELL_INDEX = {pos: cell for cell, pos in enumerate(CELLS)}
+
+# Table of every position to its neighbours on the board as a tuple of
+# (Direction, (row, col)), in Direction order
+NEIGHBORS = {pos: tuple((direction, direction.moves[pos])
+                        for direction in Direction
+                        if direction is not Direction.STAY and
+                        direction.moves[pos] in CELL_INDEX)
+             for pos in CELLS}
+
+# Table of every position to the move+build pairs of a worker on it that stay
+# on the board, as a tuple of (move Direction, build Direction, moved
+# position, build position), in Direction order
+MOVE_BUILDS = {pos: tuple((move_dir, build_dir, moved_pos, build_pos)
+                          for move_dir, moved_pos in NEIGHBORS[pos]
+                          for build_dir, build_pos in NEIGHBORS[moved_pos])
+               for pos in CELLS}
+
+
+# Zobrist keys, one random 64-bit number per (level, cell), per
+# (worker, cell) and one for the side to move. The seed is fixed so that
+# hashes of heights are the same in every process.
+_ZOBRIST_RNG = random.Random(0x5A7012)
+_ZOBRIST_LEVELS = [[_ZOBRIST_RNG.getrandbits(64)
+                    for cell in range(Board.BOARD_SIZE * Board.BOARD_SIZE)]
+                   for level in range(Building.MAX_HEIGHT)]
+_ZOBRIST_SIDE = _ZOBRIST_RNG.getrandbits(64)
+
+# Worker owners are encoded with one bit in Board.to_bytes
+_BYTES_MAX_PLAYERS = 2
+
+
+def _zobrist_worker_keys(worker):
+    """Return the Zobrist keys of a worker, one per cell.
+
+    Keys are drawn the first time a worker is seen and kept on the
+    interned Worker. They are seeded from a digest of (player, number), so
+    a worker has the same keys in every process and whatever the order
+    workers are first seen in.
+
+    :param Worker worker: a Worker
+    :rtype list of int: the key of the worker standing on each cell
+    """
+    keys = worker._zobrist_keys
+    if keys is None:
+        digest = hashlib.sha256(
+            "{}/{}".format(worker.player, worker.number).encode()).digest()
+        rng = random.Random(int.from_bytes(digest, "big"))
+        keys = [rng.getrandbits(64)
+                for cell in range(Board.BOARD_SIZE * Board.BOARD_SIZE)]
+        worker._zobrist_keys = keys
+    return keys
@@ -4,7 +4,6 @@ Implementation of a PlayerGuard
 Wraps a player and throws custom exceptions beased
 on various player failure states.
 """
-import copy
 import os
 import sys
 sys.path.append(os.path.join(os.path.dirname(__file__), "../.."))
@@ -67,8 +66,9 @@ class PlayerGuard():
     PLACEMENT_LENGTH = 2
     POSITION_LENGTH = 2
     TURN_LENGTH = 3
+    DEFAULT_TIMEOUT = 60
 
-    def __init__(self, player, timeout=60):
+    def __init__(self, player, timeout=DEFAULT_TIMEOUT):
         """
         :param Player player: the Player to wrap
         :param Board board: a Board reference to the current game
@@ -109,7 +109,7 @@ class PlayerGuard():
         Run the place_worker method of a player and returns the data
         or raises a corresponding PlayerError
 
-        :param Board cur_board: a copy of the current board
+        :param BoardState cur_board: a snapshot of the current board
         :rtype Placement: the placement to be sent to the ref
         """
         placement = self._call_with_timeout(self.player.place_worker, cur_board)
@@ -124,7 +124,7 @@ class PlayerGuard():
         Runs the start of game function of a player and returns the data
         or raises a corresponding PlayerError
 
-        :param Board cur_board: a copy of the current state of the board
+        :param BoardState cur_board: a snapshot of the current board
         :rtype Turn: the turn to be sent to the ref.
         """
         turn = self._call_with_timeout(self.player.play_turn, cur_board)
@@ -216,7 +216,7 @@ class PlayerGuard():
         if all(element is None for element in turn):
             return
         worker, move_dir, build_dir = turn
-        can_move_build = rulechecker.can_move_build(copy.deepcopy(board), worker, move_dir, build_dir)
+        can_move_build = rulechecker.can_move_build(board, worker, move_dir, build_dir)
         if not can_move_build:
             raise PlayerInvalidTurn("")
 
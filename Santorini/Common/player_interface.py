@@ -48,8 +48,8 @@ class AbstractPlayer(ABC):
     def place_worker(self, cur_board):
         """Worker Placement.
 
-        This will be called with a copy of the board when it is this player's
-        turn to place.
+        This will be called with an immutable snapshot of the board when it
+        is this player's turn to place.
 
         The board contains a dictionary of workers mapped to their positions,
         and each worker knows which player it is associated with. When a
@@ -76,7 +76,7 @@ class AbstractPlayer(ABC):
         play turn when this player has both of its workers place and there are
         a total of four workers on the board.
 
-        :param Board cur_board: a copy of the current board
+        :param BoardState cur_board: a snapshot of the current board
         :rtype tuple (Worker, (row, col)) placement: the placement
         """
         pass
@@ -85,8 +85,9 @@ class AbstractPlayer(ABC):
     def play_turn(self, cur_board):
         """Regular Santorini turn.
 
-        This will be called with a copy of the board when it is this player's
-        turn.
+        This will be called with an immutable snapshot of the board when it
+        is this player's turn. Use cur_board.clone() for a Board that can be
+        changed.
 
         The board contains a dictionary of workers mapped to their positions,
         and each worker knows which player it is associated with.
@@ -114,7 +115,7 @@ class AbstractPlayer(ABC):
         requests and send back an updated version of the board on the next
         turn.
 
-        :param Board cur_board: a copy of the current state of the board
+        :param BoardState cur_board: a snapshot of the current board
         :rtype Turn result_turn: the turn to be sent to the ref.
         """
         pass
@@ -1,12 +1,13 @@
 #!/usr/bin/env python3.6
 """A Rule checker implementation for Santorini."""
 
+from collections import OrderedDict
 from itertools import product
 import sys
 import os
-import copy
+import threading
 sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
-from Santorini.Common.pieces import Building, Direction
+from Santorini.Common.pieces import Building, Direction, NEIGHBORS, CELL_INDEX
 
 # A build or move request is a (Worker, Direction)
 #
@@ -17,6 +18,88 @@ TOTAL_WORKERS = 4
 MOVE_HEIGHT_DIFFERENCE = 1
 
 
+class RuleCache:
+    """A bounded LRU cache of rulechecker results, keyed by position hash.
+
+    The same positions are checked again and again in a game: by the
+    player's strategy, by the PlayerGuard and by the referee. When the cache
+    is enabled, can_move_build, is_game_over and get_winner remember their
+    results by the Zobrist hash of the board (see Board.zobrist_hash) and the
+    rest of their arguments, so that a position is only checked once.
+
+    The cache is disabled until enable is called. The module keeps one
+    cache, rulechecker.cache, that every caller shares.
+    """
+
+    DEFAULT_MAX_SIZE = 100000
+
+    def __init__(self):
+        """Create a disabled, empty cache."""
+        self.enabled = False
+        self.max_size = self.DEFAULT_MAX_SIZE
+        self.hits = 0
+        self.misses = 0
+        self._results = OrderedDict()
+        self._lock = threading.Lock()
+
+    def enable(self, max_size=None):
+        """Start caching results.
+
+        :param int max_size: an (optional) number of results to keep, the
+                             least recently used are dropped first
+        """
+        if max_size is not None:
+            if max_size < 1:
+                raise ValueError("The cache must hold at least one result")
+            self.max_size = max_size
+            with self._lock:
+                while len(self._results) > max_size:
+                    self._results.popitem(last=False)
+        self.enabled = True
+
+    def disable(self):
+        """Stop caching results and drop the ones that were kept."""
+        self.enabled = False
+        self.invalidate()
+
+    def invalidate(self):
+        """Drop every kept result and reset the hit and miss counters."""
+        with self._lock:
+            self._results.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def __len__(self):
+        return len(self._results)
+
+    def lookup(self, key, check, *args):
+        """Return the result for key, calling check(*args) if it is missing.
+
+        :param tuple key: the position hash and the arguments of the check
+        :param function check: the uncached rulechecker function
+        :rtype: the result of check(*args)
+        """
+        with self._lock:
+            try:
+                result = self._results[key]
+            except KeyError:
+                self.misses += 1
+            else:
+                self._results.move_to_end(key)
+                self.hits += 1
+                return result
+        result = check(*args)
+        with self._lock:
+            self._results[key] = result
+            if len(self._results) > self.max_size:
+                self._results.popitem(last=False)
+        return result
+
+
+# The cache shared by every caller of the rulechecker, see RuleCache
+cache = RuleCache()
+
+
 def valid_position(board, position):
     """Return the worker destination if it is valid on the board.
 
@@ -65,11 +148,20 @@ def can_move_build(board, worker, move_dir, build_dir=None):
     :param Direction move_dir: A Direction to move in
     :param Direction build_dir: An (optional) Direction to build in
     """
+    if cache.enabled:
+        return cache.lookup(
+            ("move_build", board.zobrist_hash, worker, move_dir, build_dir),
+            _can_move_build, board, worker, move_dir, build_dir)
+    return _can_move_build(board, worker, move_dir, build_dir)
+
+
+def _can_move_build(board, worker, move_dir, build_dir):
+    """See can_move_build, without the cache."""
     if move_dir == Direction.STAY or build_dir == Direction.STAY:
         return False
     moved_pos = Direction.move_position(board.worker_position(worker),
                                         move_dir)
-    board_copy = copy.deepcopy(board)
+    board_copy = board.clone()
     can_move = (valid_position(board_copy, moved_pos) and
                 height_difference(board, worker, move_dir))
     if can_move:
@@ -82,7 +174,84 @@ def can_move_build(board, worker, move_dir, build_dir=None):
     return can_move and can_build
 
 
-def is_game_over(board, workers):
+def legal_turns(board, player):
+    """Generate every turn a player can make on the board.
+
+    The turns are found in a single pass over each worker's neighbours
+    without copying the board. They are exactly the turns can_move_build
+    accepts: per worker, first every move (Worker, Direction, None), then
+    every move+build (Worker, Direction, Direction), in Direction order.
+
+    :param Board board: the game board, it must not change while the
+                        generator is used, except for turns that are undone
+                        before the next turn is asked for
+    :param player: the player whose workers make the turns
+    :rtype Generator[(Worker, Direction, Direction|None)]
+    """
+    heights = board.heights()
+    positions = [board.worker_position(w) for w in board.workers]
+    for worker in board.workers_of(player):
+        yield from _worker_turns(worker, board.worker_position(worker),
+                                 heights, positions)
+
+
+def worker_turns(board, worker):
+    """Generate every turn a single worker can make on the board.
+
+    See legal_turns, these are the turns of one of the player's workers.
+
+    :param Board board: the game board
+    :param Worker worker: a Worker on the board
+    :rtype Generator[(Worker, Direction, Direction|None)]
+    """
+    positions = [board.worker_position(w) for w in board.workers]
+    return _worker_turns(worker, board.worker_position(worker),
+                         board.heights(), positions)
+
+
+def _worker_turns(worker, pos, heights, positions):
+    """Generate the turns of a worker from the heights and worker positions.
+
+    :param Worker worker: a Worker on the board
+    :param tuple (row, col) pos: the worker's position
+    :param list int heights: the height of every position, see Board.heights
+    :param list positions: the position of every worker on the board
+    :rtype Generator[(Worker, Direction, Direction|None)]
+    """
+    occupied = set(positions)
+    max_height = heights[CELL_INDEX[pos]] + MOVE_HEIGHT_DIFFERENCE
+    moves = [(move_dir, moved_pos) for move_dir, moved_pos in NEIGHBORS[pos]
+             if (moved_pos not in occupied and
+                 heights[CELL_INDEX[moved_pos]] <= max_height)]
+    for move_dir, _ in moves:
+        yield (worker, move_dir, None)
+    # The cell the worker leaves is free to build on, unless another
+    # worker shares it
+    vacated = positions.count(pos) == 1
+    for move_dir, moved_pos in moves:
+        for build_dir, build_pos in NEIGHBORS[moved_pos]:
+            if ((build_pos not in occupied or
+                 (vacated and build_pos == pos)) and
+                    heights[CELL_INDEX[build_pos]] < Building.MAX_HEIGHT):
+                yield (worker, move_dir, build_dir)
+
+
+def can_move(board, worker):
+    """Return if a worker can move anywhere, i.e. has any legal turn.
+
+    :param Board board: the game board
+    :param Worker worker: a Worker on the board
+    :rtype bool: True if can_move_build accepts a move for the worker
+    """
+    pos = board.worker_position(worker)
+    max_height = (board.get_height(pos, Direction.STAY) +
+                  MOVE_HEIGHT_DIFFERENCE)
+    return any(not board.is_occupied(moved_pos) and
+               board.get_height(moved_pos, Direction.STAY) <= max_height
+               for _, moved_pos in NEIGHBORS[pos])
+
+
+def is_game_over(board, workers, mobility=None):
     """Determine if the game is over based on board state.
 
     Called by the referee after every move and build for a player
@@ -96,7 +265,17 @@ def is_game_over(board, workers):
 
     :param Board board: a copy of the game board
     :param list workers: a list of Workers for the current player
+    :param dict mobility: an (optional) dictionary of every Worker to
+                          can_move for it, when it is already known
     """
+    if cache.enabled:
+        return cache.lookup(("game_over", board.zobrist_hash, tuple(workers)),
+                            _is_game_over, board, workers, mobility)
+    return _is_game_over(board, workers, mobility)
+
+
+def _is_game_over(board, workers, mobility):
+    """See is_game_over, without the cache."""
     turn_dict = {w: False for w in workers}
     for worker in workers:
 
@@ -108,24 +287,32 @@ def is_game_over(board, workers):
         # If any of the workers can move or build in any direction, the game
         # is not over
 
-        for move_dir in Direction:
-            if can_move_build(board, worker, move_dir):
-                break
-        else:
+        if not (mobility[worker] if mobility is not None
+                else can_move(board, worker)):
             turn_dict[worker] = True
 
     return any(turn_dict.values())
 
 
-def get_winner(board):
+def get_winner(board, mobility=None):
     """Return the winning player given the game board
     
     If there is no winning player, this will return false
 
     :param Board board: a copy of the game board
+    :param dict mobility: an (optional) dictionary of every Worker to
+                          can_move for it, when it is already known
     :returns Uuid | False: player if there is a winner,
     false if the game isn't over yet
     """
+    if cache.enabled:
+        return cache.lookup(("winner", board.zobrist_hash),
+                            _get_winner, board, mobility)
+    return _get_winner(board, mobility)
+
+
+def _get_winner(board, mobility):
+    """See get_winner, without the cache."""
 
     worker_status = {w.player: [] for w in board.workers}
 
@@ -136,9 +323,9 @@ def get_winner(board):
         worker_pos = board.worker_position(worker)
         if board.get_height(worker_pos, Direction.STAY) == Building.MAX_HEIGHT - 1:
             return worker.player
-        for move_dir in Direction:
-            if can_move_build(board, worker, move_dir):
-                worker_status[worker.player][worker.number - 1] = True
+        if (mobility[worker] if mobility is not None
+                else can_move(board, worker)):
+            worker_status[worker.player][worker.number - 1] = True
 
     for player in worker_status:
         if not any(worker_status[player]):
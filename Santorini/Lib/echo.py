@@ -1,8 +1,13 @@
 #!/usr/bin/env python3.6
 """ Echos JSON as array with reverse index """
 
+import codecs
 import sys
 import json
+import re
+
+# Whitespace between JSON values, the same characters str.strip removes
+_WHITESPACE = re.compile(r"\s*")
 
 
 def json_echo(string):
@@ -22,16 +27,66 @@ def json_echo(string):
 
     decoder = json.JSONDecoder()
 
-    next_string = string.lstrip()
+    index = _WHITESPACE.match(string).end()
 
-    while next_string != "":
-        parsed_line, index = decoder.raw_decode(next_string)
-        next_string = next_string[index:].lstrip()
+    while index != len(string):
+        parsed_line, index = decoder.raw_decode(string, index)
+        index = _WHITESPACE.match(string, index).end()
         output.append(parsed_line)
 
     return output
 
 
+def iter_json(stream, before_read=None, chunk_size=1 << 16):
+    """ Yields the JSON values of a stream one at a time, as they arrive
+
+        Unlike json_echo this does not wait for the end of the input: a
+        value is yielded as soon as it has been read, so that a harness can
+        answer queries while more are still being written. Only the text
+        after the last complete value is kept in memory.
+
+        :param stream: a binary (e.g. sys.stdin.buffer) or text stream
+        :param function before_read: an (optional) function called before
+            every read that may block, e.g. to flush the output
+        :param int chunk_size: the most characters to read at a time
+        :raises json.decoder.JSONDecodeError if the stream contains invalid
+            JSON
+        :rtype: Generator of JSON values
+    """
+    read = getattr(stream, "read1", stream.read)
+    decode = codecs.getincrementaldecoder("utf-8")().decode
+    decoder = json.JSONDecoder()
+    buffer = ""
+    index = 0
+    eof = False
+    while True:
+        index = _WHITESPACE.match(buffer, index).end()
+        if index != len(buffer):
+            try:
+                value, end = decoder.raw_decode(buffer, index)
+            except json.decoder.JSONDecodeError:
+                if eof:
+                    raise
+            else:
+                # A number at the end of what was read may not be complete
+                if (eof or end != len(buffer) or
+                        not isinstance(value, (int, float)) or
+                        isinstance(value, bool)):
+                    index = end
+                    yield value
+                    continue
+        elif eof:
+            return
+        if before_read:
+            before_read()
+        chunk = read(chunk_size)
+        eof = not chunk
+        if isinstance(chunk, bytes):
+            chunk = decode(chunk, final=eof)
+        buffer = buffer[index:] + chunk
+        index = 0
+
+
 def main():
     """ Main function that reads from stdin and prints to stdout """
     try:
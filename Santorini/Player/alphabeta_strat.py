@@ -0,0 +1,485 @@
+"""An alpha-beta game tree search strategy to be used with a Player component in Santorini."""
+
+import os
+import sys
+import time
+sys.path.append(os.path.join(os.path.dirname(__file__), "../.."))
+from Santorini.Player.strategy import TurnStrategy
+from Santorini.Player.transposition import TranspositionTable
+from Santorini.Player.evaluation import Evaluator
+from Santorini.Player.move_order import HeuristicOrder
+from Santorini.Common.pieces import Building, Direction, NEIGHBORS
+from Santorini.Common import rulechecker
+from Santorini.Common.player_guard import PlayerGuard
+
+# The score of a position won by the player to move. Wins found deeper in
+# the tree score lower, by one per turn, so the quickest win is preferred
+# and the slowest loss.
+WIN_SCORE = 1000000
+
+# The score bound of a search window
+INFINITY = WIN_SCORE + 1
+
+# The deepest search of a time budgeted search, a game is over long before
+MAX_DEPTH = 64
+
+# Scores beyond this are wins or losses, which count turns from the root
+# of a search and are kept in a transposition table counting from the
+# position instead
+_WON = WIN_SCORE - 1000
+
+
+class SearchTimeout(Exception):
+    """Raised inside a search when its time is up."""
+    pass
+
+
+def _to_table(score, ply):
+    """Return a score counted from the root as counted from the position."""
+    if score > _WON:
+        return score + ply
+    if score < -_WON:
+        return score - ply
+    return score
+
+
+def _from_table(score, ply):
+    """Return a score counted from the position as counted from the root."""
+    if score > _WON:
+        return score - ply
+    if score < -_WON:
+        return score + ply
+    return score
+
+
+def _first(turns, turn):
+    """Return the turns with turn moved to the front, if it is one of them."""
+    if turn is None or turn not in turns:
+        return turns
+    turns = list(turns)
+    turns.remove(turn)
+    turns.insert(0, turn)
+    return turns
+
+
+def height_evaluator(board, player, opponent):
+    """Score a position by how high the workers of each player stand.
+
+    :param Board board: the position
+    :param player: the player to move, the score is theirs
+    :param opponent: the other player
+    :rtype int: the sum of the heights of the player's workers minus the
+                sum of the heights of the opponent's workers
+    """
+    return (sum(board.get_height(board.worker_position(worker), Direction.STAY)
+                for worker in board.workers_of(player)) -
+            sum(board.get_height(board.worker_position(worker), Direction.STAY)
+                for worker in board.workers_of(opponent)))
+
+
+class AlphaBetaStrategy(TurnStrategy):
+    """A strategy implementation that searches the game tree with
+    alpha-beta pruned negamax down to a fixed number of turns and picks the
+    turn with the best score for the player.
+
+    A position is scored by the (pluggable) evaluator from the side of the
+    player to move, see Santorini.Player.evaluation. A player that can move a worker onto a building of
+    height Building.MAX_HEIGHT - 1 wins right away, and a player with no
+    turns loses. Like TreeStrategy, a move without a build is only played
+    when it wins; it is tried otherwise only when no build is possible.
+
+    With a time budget, the search deepens one turn at a time instead, and
+    plays the best turn of the deepest search that ended when a fraction of
+    the budget is spent. A search cut short still gives its best turn, when
+    it found one. Give it the PlayerGuard timeout, so that a turn is always
+    played in time.
+
+    A table is kept from turn to turn. The position of a turn was often
+    searched two turns below the root of the turn before: when the table
+    has its exact score, the search goes on from that depth.
+
+    With a table, it can ponder while the opponent plays: it guesses the
+    opponent's replies and plans its next turn after each of them, see
+    ponder.
+    """
+
+    # How many nodes are searched between two looks at the clock
+    CLOCK_NODES = 1024
+
+    def __init__(self, depth=4, evaluator=None, move_order=None,
+                 table=None, time_budget=None, time_fraction=0.5, reuse=True):
+        """Constructs an alpha-beta turn strategy object
+
+        :param int depth: the number of turns (of either player) to
+                          search, the turn being planned is the first one
+        :param function evaluator: an (optional) scorer of a position for
+                                   the player to move, taking (board,
+                                   player, opponent), an Evaluator by
+                                   default
+        :param MoveOrder move_order: an (optional) order to try turns in,
+                                     a HeuristicOrder by default
+        :param TranspositionTable table: an (optional) table to remember
+                                         the positions searched in
+        :param float time_budget: an (optional) number of seconds a turn
+                                  must be planned in, depth is then the
+                                  deepest search, see MAX_DEPTH
+        :param float time_fraction: the fraction of the time budget to
+                                    search for
+        :param bool reuse: if the table is kept from turn to turn, it is
+                           cleared at every turn planned that was not
+                           pondered otherwise
+        :raise ValueError: if the time fraction is not in (0, 1]
+        """
+        if not 0 < time_fraction <= 1:
+            raise ValueError("The time fraction must be in (0, 1]")
+        self.depth = depth
+        self.evaluator = evaluator if evaluator is not None else Evaluator()
+        self.move_order = (move_order if move_order is not None
+                           else HeuristicOrder())
+        self.table = table
+        self.time_budget = time_budget
+        self.time_fraction = time_fraction
+        self.reuse = reuse
+        self.nodes = 0
+        self.score = None
+        self.completed_depth = 0
+        self.reused_depth = 0
+        self.ponder_nodes = 0
+        self.ponder_hit = False
+        self._deadline = None
+        self._stop = None
+        self._pondered = {}
+        self._partial = None
+
+    @classmethod
+    def timed(cls, time_budget=PlayerGuard.DEFAULT_TIMEOUT, **kwargs):
+        """Return a strategy that searches as deep as a time budget allows,
+        with a transposition table.
+
+        :param float time_budget: the number of seconds a turn must be
+                                  planned in, the PlayerGuard timeout by
+                                  default
+        :param kwargs: the other arguments of the strategy
+        :rtype AlphaBetaStrategy
+        """
+        kwargs.setdefault("depth", MAX_DEPTH)
+        kwargs.setdefault("table", TranspositionTable())
+        return cls(time_budget=time_budget, **kwargs)
+
+    @staticmethod
+    def opponent(board, player):
+        """Return the player other than player with workers on the board."""
+        for worker in board.workers:
+            if worker.player != player:
+                return worker.player
+        return None
+
+    @staticmethod
+    def winning_turn(board, player):
+        """Return a turn that wins right away for the player, if any.
+
+        :param Board board: a game board
+        :param player: the player to move
+        :rtype (Worker, Direction, None) | None: a move onto a building of
+                                                 height MAX_HEIGHT - 1
+        """
+        top = Building.MAX_HEIGHT - 1
+        for worker in board.workers_of(player):
+            pos = board.worker_position(worker)
+            # only a worker one floor below the top can climb onto it
+            if (board.get_height(pos, Direction.STAY) !=
+                    top - rulechecker.MOVE_HEIGHT_DIFFERENCE):
+                continue
+            for move_dir, moved_pos in NEIGHBORS[pos]:
+                if (board.get_height(moved_pos, Direction.STAY) == top and
+                        not board.is_occupied(moved_pos)):
+                    return (worker, move_dir, None)
+        return None
+
+    @staticmethod
+    def search_turns(board, player):
+        """Return the turns to search for a player that cannot win right away.
+
+        :param Board board: a game board
+        :param player: the player to move
+        :rtype list: every move+build turn, or every move turn when no
+                     move+build is possible
+        """
+        moves = []
+        builds = []
+        for turn in rulechecker.legal_turns(board, player):
+            if turn[2] is None:
+                moves.append(turn)
+            else:
+                builds.append(turn)
+        return builds or moves
+
+    def search(self, board, player, opponent, depth, first=None):
+        """Search a position and return the best turn and its score.
+
+        :param Board board: the position, turns are made and unmade on it
+        :param player: the player to move
+        :param opponent: the other player
+        :param int depth: the number of turns to search, at least 1
+        :param tuple first: an (optional) turn to search first
+        :rtype (int, tuple): the score for the player and the best turn,
+                             (None, None, None) when the player has none
+        :raise SearchTimeout: if the time of a time budgeted search is up
+        """
+        win = self.winning_turn(board, player)
+        if win:
+            return WIN_SCORE - 1, win
+        turns = self.move_order.order(board, self.search_turns(board, player), 0)
+        if self.table is not None:
+            entry = self.table.probe(board.zobrist_hash)
+            if entry is not None:
+                turns = _first(turns, entry[4])
+        turns = _first(turns, first)
+        best_score, best_turn = -WIN_SCORE, (None, None, None)
+        alpha = -INFINITY
+        self._partial = None
+        for turn in turns:
+            board.make_turn(*turn)
+            score = -self._negamax(board, opponent, player, depth - 1,
+                                   -INFINITY, -alpha, 1)
+            board.unmake_turn()
+            if score > alpha:
+                best_score, best_turn, alpha = score, turn, score
+                self._partial = turn
+        if self.table is not None and turns:
+            self.table.store(board.zobrist_hash, depth, TranspositionTable.EXACT,
+                             best_score, best_turn)
+        return best_score, best_turn
+
+    def _negamax(self, board, player, opponent, depth, alpha, beta, ply):
+        """Return the score of a position for the player to move.
+
+        The score is exact when it falls inside (alpha, beta). Otherwise
+        it is a bound: at most alpha, or at least beta. With a table, a
+        position kept from a search at least as deep is not searched again
+        when its score answers the window, and the best turn kept for it is
+        tried first otherwise.
+
+        :param Board board: the position, turns are made and unmade on it
+        :param player: the player to move
+        :param opponent: the other player
+        :param int depth: the number of turns left to search
+        :param int alpha: the score the player is already sure of
+        :param int beta: the score the opponent is already sure of
+        :param int ply: the number of turns from the root of the search
+        :rtype int: the score
+        """
+        self.nodes += 1
+        if not self.nodes % self.CLOCK_NODES and self._stopped():
+            raise SearchTimeout()
+        if self.winning_turn(board, player):
+            return WIN_SCORE - ply - 1
+        if depth == 0:
+            return self.evaluator(board, player, opponent)
+        hash_move = None
+        if self.table is not None:
+            key = board.zobrist_hash
+            entry = self.table.probe(key)
+            if entry is not None:
+                _, entry_depth, bound, score, hash_move = entry
+                if entry_depth >= depth:
+                    score = _from_table(score, ply)
+                    if (bound == TranspositionTable.EXACT or
+                            (bound == TranspositionTable.LOWER and score >= beta) or
+                            (bound == TranspositionTable.UPPER and score <= alpha)):
+                        return score
+        turns = self.search_turns(board, player)
+        if not turns:
+            return ply - WIN_SCORE
+        turns = _first(self.move_order.order(board, turns, ply), hash_move)
+        start_alpha = alpha
+        best, best_turn = -INFINITY, None
+        for turn in turns:
+            board.make_turn(*turn)
+            score = -self._negamax(board, opponent, player, depth - 1,
+                                   -beta, -alpha, ply + 1)
+            board.unmake_turn()
+            if score > best:
+                best, best_turn = score, turn
+                if score > alpha:
+                    alpha = score
+                    if alpha >= beta:
+                        self.move_order.cutoff(board, turn, ply, depth - 1)
+                        break
+        if self.table is not None:
+            if best >= beta:
+                bound = TranspositionTable.LOWER
+            elif best <= start_alpha:
+                bound = TranspositionTable.UPPER
+            else:
+                bound = TranspositionTable.EXACT
+            self.table.store(key, depth, bound, _to_table(best, ply), best_turn)
+        return best
+
+    def _stopped(self):
+        """Return if the time of the search is up or it was told to stop."""
+        return ((self._deadline is not None and
+                 time.perf_counter() > self._deadline) or
+                (self._stop is not None and self._stop.is_set()))
+
+    def plan_turn(self, workers, board):
+        """Return a valid turn for the list of player's worker on the board.
+
+        A valid turn is one of:
+        (None, None, None) - A no request if it couldn't find any move
+        (Worker, Direction, None) - Move request
+        (Worker, Direction, Direction). - Move+Build request
+
+        :param list Worker workers: A list of a player's worker
+        :param Board board: a game board
+
+        :rtype Union[(None, None, None), (Worker, Direction, None),
+                     (Worker, Direction, Direction)]:
+               a valid turn as described above
+        """
+        if not workers:
+            return (None, None, None)
+        board = board.clone()
+        player = workers[0].player
+        self.nodes = 0
+        self.move_order.reset()
+        if self.table is not None:
+            if self.reuse or self._pondered:
+                self.table.new_search()
+            else:
+                self.table.clear()
+        start = self._pondered.get(board.zobrist_hash)
+        self._pondered = {}
+        self.ponder_hit = start is not None
+        if start is None and self.table is not None:
+            start = self._table_root(board, player)
+        self.reused_depth = start[0] if start is not None else 0
+        opponent = self.opponent(board, player)
+        if self.time_budget is None:
+            if start is not None and (start[0] >= max(self.depth, 1) or
+                                      abs(start[1]) > _WON):
+                self.completed_depth, self.score, turn = start
+                return turn
+            self.score, turn = self.search(board, player, opponent,
+                                           max(self.depth, 1),
+                                           start and start[2])
+            self.completed_depth = max(self.depth, 1)
+            return turn
+        return self._deepen(board, player, opponent, start)
+
+    def _table_root(self, board, player):
+        """Return what the table knows of the position of a turn, when an
+        earlier search found its exact score.
+
+        :param Board board: the position
+        :param player: the player to move
+        :rtype tuple | None: the (depth, score, turn) of the search
+        """
+        entry = self.table.probe(board.zobrist_hash)
+        if (entry is None or entry[2] != TranspositionTable.EXACT or
+                entry[4] not in self.search_turns(board, player)):
+            return None
+        return entry[1], entry[3], entry[4]
+
+    def _deepen(self, board, player, opponent, start=None):
+        """Search one turn deeper at a time until the time is up.
+
+        Every search is made on its own copy of the board, as a search that
+        runs out of time is left in the middle of its turns.
+
+        :param Board board: the position
+        :param player: the player to move
+        :param opponent: the other player
+        :param tuple start: the (optional) (depth, score, turn) of a
+                            search made before, while pondering or in an
+                            earlier turn, the search goes on from there
+        :rtype tuple: the best turn of the deepest search, or the best turn
+                      so far of the search that ran out of time
+        """
+        self._deadline = (time.perf_counter() +
+                          self.time_budget * self.time_fraction)
+        self.score, self.completed_depth = None, 0
+        best_turn = None
+        if start is not None:
+            self.completed_depth, self.score, best_turn = start
+            if abs(self.score) > _WON:
+                self._deadline = None
+                return best_turn
+        try:
+            for depth in range(self.completed_depth + 1, max(self.depth, 1) + 1):
+                try:
+                    score, turn = self.search(board.clone(), player, opponent,
+                                              depth, best_turn)
+                except SearchTimeout:
+                    if self._partial is not None:
+                        best_turn = self._partial
+                    break
+                self.score, best_turn, self.completed_depth = score, turn, depth
+                if abs(score) > _WON:
+                    # a won or lost game stays so, whatever the depth
+                    break
+        finally:
+            self._deadline = None
+        if best_turn is None:
+            # out of time before a single turn was searched
+            best_turn = (self.winning_turn(board, player) or
+                         next(iter(self.search_turns(board, player)),
+                              (None, None, None)))
+        return best_turn
+
+    def ponder(self, board, turn, stop):
+        """Guess the opponent's replies to a turn and plan the next turn
+        after each of them until stop is set.
+
+        The replies are guessed in the order the search would try them, the
+        best one found by the search of the turn first. The next turn is
+        planned after every reply like plan_turn would, one turn deeper at a
+        time, and every depth completed is kept by the hash of the
+        position. When the reply guessed is played, plan_turn starts from
+        the turn kept, and the table keeps the rest of the searches. It does
+        nothing without a table, or after a turn that won or gave up.
+
+        :param BoardState board: the board the turn was planned on
+        :param tuple turn: the turn played on it
+        :param threading.Event stop: set when the search must end
+        """
+        self._pondered = {}
+        self.ponder_nodes = 0
+        worker = turn[0]
+        if self.table is None or worker is None:
+            return
+        board = board.clone()
+        board.make_turn(*turn)
+        if (board.get_height(board.worker_position(worker), Direction.STAY) ==
+                Building.MAX_HEIGHT - 1):
+            return
+        player = worker.player
+        opponent = self.opponent(board, player)
+        if self.winning_turn(board, opponent):
+            return
+        replies = self.move_order.order(board,
+                                        self.search_turns(board, opponent), 0)
+        entry = self.table.probe(board.zobrist_hash)
+        if entry is not None:
+            replies = _first(replies, entry[4])
+        self.table.new_search()
+        nodes, self.nodes = self.nodes, 0
+        self._stop = stop
+        try:
+            for reply in replies:
+                board.make_turn(*reply)
+                key = board.zobrist_hash
+                self.move_order.reset()
+                best_turn = None
+                for depth in range(1, max(self.depth, 1) + 1):
+                    score, best_turn = self.search(board.clone(), player,
+                                                   opponent, depth, best_turn)
+                    self._pondered[key] = (depth, score, best_turn)
+                    if abs(score) > _WON:
+                        break
+                board.unmake_turn()
+        except SearchTimeout:
+            pass
+        finally:
+            self._stop = None
+            self.ponder_nodes, self.nodes = self.nodes, nodes
@@ -0,0 +1,137 @@
+"""A static position evaluator to be used by the turn strategies of Santorini."""
+
+from collections import OrderedDict
+import os
+import sys
+sys.path.append(os.path.join(os.path.dirname(__file__), "../.."))
+from Santorini.Common.pieces import Building, NEIGHBORS, CELL_INDEX
+from Santorini.Common.rulechecker import MOVE_HEIGHT_DIFFERENCE
+
+
+class Evaluator:
+    """Scores a position from features of the workers of each player.
+
+    The features of a player, in FEATURES order, are:
+    * height: the sum of the heights of the player's workers
+    * reach_2: the cells of height 2 a worker can move onto
+    * reach_3: the cells of height 3 a worker can move onto
+    * mobility: the cells a worker can move onto
+    * domes: the domes next to a worker, which box it in
+    * threats: the workers that can move onto a cell of height 3, winning;
+      a threat of the opponent is one the player must answer
+
+    A cell next to both workers counts for both. The score of a position
+    for a player is the weighted sum of the differences between their
+    features and the opponent's. The features of a position are kept by
+    its Zobrist hash (see Board.zobrist_hash), in a bounded LRU cache, so
+    the many searches that reach the same position compute them once.
+
+    An Evaluator is called like the evaluators of AlphaBetaStrategy, with
+    (board, player, opponent).
+    """
+
+    FEATURES = ("height", "reach_2", "reach_3", "mobility", "domes",
+                "threats")
+
+    DEFAULT_WEIGHTS = {"height": 40, "reach_2": 8, "reach_3": 12,
+                       "mobility": 3, "domes": -4, "threats": 60}
+
+    DEFAULT_CACHE_SIZE = 100000
+
+    def __init__(self, weights=None, cache_size=DEFAULT_CACHE_SIZE):
+        """Create an evaluator.
+
+        :param dict weights: an (optional) weight for every feature name,
+                             the missing ones are DEFAULT_WEIGHTS
+        :param int cache_size: the number of positions to keep features for
+        :raise ValueError: if a weight is not for a feature, or the cache
+                           cannot hold a position
+        """
+        weights = dict(self.DEFAULT_WEIGHTS, **(weights or {}))
+        unknown = set(weights) - set(self.FEATURES)
+        if unknown:
+            raise ValueError(f"Unknown features {sorted(unknown)}")
+        if cache_size < 1:
+            raise ValueError("The cache must hold at least one position")
+        self.weights = weights
+        self._weights = [weights[name] for name in self.FEATURES]
+        self.cache_size = cache_size
+        self.hits = 0
+        self.misses = 0
+        self._cache = OrderedDict()
+
+    def __reduce__(self):
+        # the cache is not sent along to other processes
+        return (Evaluator, (self.weights, self.cache_size))
+
+    def clear(self):
+        """Drop the kept features and reset the hit and miss counters."""
+        self._cache.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def features(self, board):
+        """Return the features of every player with workers on the board.
+
+        :param Board board: the position
+        :rtype dict: every player to a tuple of their features, in FEATURES
+                     order
+        """
+        key = board.zobrist_hash
+        features = self._cache.get(key)
+        if features is not None:
+            self.hits += 1
+            self._cache.move_to_end(key)
+            return features
+        self.misses += 1
+        features = self._compute(board)
+        self._cache[key] = features
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+        return features
+
+    @staticmethod
+    def _compute(board):
+        """See features, without the cache."""
+        heights = board.heights()
+        occupied = {board.worker_position(worker) for worker in board.workers}
+        top = Building.MAX_HEIGHT - 1
+        features = {}
+        for worker in board.workers:
+            pos = board.worker_position(worker)
+            height = heights[CELL_INDEX[pos]]
+            reach_2 = reach_3 = mobility = domes = 0
+            for _, moved_pos in NEIGHBORS[pos]:
+                moved_height = heights[CELL_INDEX[moved_pos]]
+                if moved_height == Building.MAX_HEIGHT:
+                    domes += 1
+                elif (moved_height <= height + MOVE_HEIGHT_DIFFERENCE and
+                      moved_pos not in occupied):
+                    mobility += 1
+                    if moved_height == top - 1:
+                        reach_2 += 1
+                    elif moved_height == top:
+                        reach_3 += 1
+            totals = features.get(worker.player, (0, 0, 0, 0, 0, 0))
+            features[worker.player] = (totals[0] + height,
+                                       totals[1] + reach_2,
+                                       totals[2] + reach_3,
+                                       totals[3] + mobility,
+                                       totals[4] + domes,
+                                       totals[5] + (reach_3 > 0))
+        return features
+
+    def __call__(self, board, player, opponent):
+        """Score a position for a player.
+
+        :param Board board: the position
+        :param player: the player the score is for
+        :param opponent: the other player
+        :rtype int: the weighted sum of the player's features minus the
+                    opponent's
+        """
+        features = self.features(board)
+        ours = features.get(player, (0, 0, 0, 0, 0, 0))
+        theirs = features.get(opponent, (0, 0, 0, 0, 0, 0))
+        return sum(weight * (mine - other) for weight, mine, other in
+                   zip(self._weights, ours, theirs))
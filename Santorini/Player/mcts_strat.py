@@ -0,0 +1,273 @@
+"""A Monte Carlo tree search strategy to be used with a Player component in Santorini."""
+
+import math
+import os
+import random
+import sys
+import time
+sys.path.append(os.path.join(os.path.dirname(__file__), "../.."))
+from Santorini.Player.strategy import TurnStrategy
+from Santorini.Player.alphabeta_strat import AlphaBetaStrategy
+from Santorini.Common.pieces import Building, Direction, NEIGHBORS
+from Santorini.Common import rulechecker
+
+
+class _Node:
+    """A position of the search tree and the statistics of its playouts."""
+
+    __slots__ = ("turn", "parent", "children", "untried", "wins", "visits")
+
+    def __init__(self, turn, parent, untried):
+        """
+        :param tuple turn: the turn that reached this position
+        :param _Node parent: the position the turn was made in
+        :param list untried: the turns of this position not expanded yet
+        """
+        self.turn = turn
+        self.parent = parent
+        self.children = []
+        self.untried = untried
+        # playouts won by the player that made the turn to this position
+        self.wins = 0
+        self.visits = 0
+
+    def select(self, exploration):
+        """Return the child with the best upper confidence bound (UCT)."""
+        log_visits = math.log(self.visits)
+        return max(self.children,
+                   key=lambda child: (child.wins / child.visits +
+                                      exploration *
+                                      math.sqrt(log_visits / child.visits)))
+
+
+class MCTSStrategy(TurnStrategy):
+    """A strategy implementation that plays the turn most visited by a
+    Monte Carlo tree search with upper confidence bounds (UCT).
+
+    Every playout walks down the tree to a position with turns not tried
+    yet, tries one, then plays random turns to the end of the game and
+    counts the win for the player that won. The random turns prefer a move
+    onto a building of height Building.MAX_HEIGHT - 1, which wins. All turns
+    are made on a single copy of the board and unmade after the playout.
+    The root only has the turns that do not let the opponent win right
+    away, when there are any.
+
+    The search runs a number of playouts, or, with a time budget, as many
+    as fit in a fraction of it.
+    """
+
+    # The most turns a playout plays before it is called a draw
+    MAX_PLAYOUT_TURNS = 200
+
+    # How many playouts are run between two looks at the clock
+    CLOCK_PLAYOUTS = 16
+
+    def __init__(self, playouts=1000, time_budget=None, time_fraction=0.5,
+                 exploration=math.sqrt(2), seed=None):
+        """Constructs a Monte Carlo tree search turn strategy object
+
+        :param int playouts: the number of playouts per turn, when there is
+                             no time budget
+        :param float time_budget: an (optional) number of seconds a turn
+                                  must be planned in
+        :param float time_fraction: the fraction of the time budget to
+                                    search for
+        :param float exploration: the weight of the exploration term of the
+                                  upper confidence bound
+        :param int seed: an (optional) seed of the random playouts
+        :raise ValueError: if the time fraction is not in (0, 1]
+        """
+        if not 0 < time_fraction <= 1:
+            raise ValueError("The time fraction must be in (0, 1]")
+        self.playouts = playouts
+        self.time_budget = time_budget
+        self.time_fraction = time_fraction
+        self.exploration = exploration
+        self.random = random.Random(seed)
+        self.played = 0
+
+    @staticmethod
+    def tree_turns(board, player):
+        """Return the turns of a position of the tree.
+
+        :rtype list: the winning turn if there is one, otherwise the turns
+                     AlphaBetaStrategy searches
+        """
+        win = AlphaBetaStrategy.winning_turn(board, player)
+        if win:
+            return [win]
+        return AlphaBetaStrategy.search_turns(board, player)
+
+    @staticmethod
+    def safe_turns(board, opponent, turns):
+        """Return the turns after which the opponent cannot win right away.
+
+        :param Board board: a game board, turns are made and unmade on it
+        :param opponent: the player to move after the turns
+        :param list turns: the turns of the player to move
+        :rtype list: the safe turns, or all the turns if none is safe
+        """
+        safe = []
+        for turn in turns:
+            board.make_turn(*turn)
+            if not AlphaBetaStrategy.winning_turn(board, opponent):
+                safe.append(turn)
+            board.unmake_turn()
+        return safe or turns
+
+    def random_turn(self, board, player):
+        """Return a random turn of a player, a winning one if there is one.
+
+        Rather than finding every turn, a random worker tries its moves and
+        then its builds in a random order, until one can be made.
+
+        :param Board board: a game board
+        :param player: the player to move
+        :rtype tuple | None: a (Worker, Direction, Direction) turn, None if
+                             the player has none
+        """
+        win = AlphaBetaStrategy.winning_turn(board, player)
+        if win:
+            return win
+        shuffle = self.random.shuffle
+        workers = list(board.workers_of(player))
+        shuffle(workers)
+        for worker in workers:
+            pos = board.worker_position(worker)
+            max_height = (board.get_height(pos, Direction.STAY) +
+                          rulechecker.MOVE_HEIGHT_DIFFERENCE)
+            moves = list(NEIGHBORS[pos])
+            shuffle(moves)
+            for move_dir, moved_pos in moves:
+                if (board.is_occupied(moved_pos) or
+                        board.get_height(moved_pos, Direction.STAY) > max_height):
+                    continue
+                builds = list(NEIGHBORS[moved_pos])
+                shuffle(builds)
+                for build_dir, build_pos in builds:
+                    if ((build_pos == pos or not board.is_occupied(build_pos)) and
+                            not board.is_maxheight(build_pos, Direction.STAY)):
+                        return (worker, move_dir, build_dir)
+        return None
+
+    def playout(self, board, player, opponent):
+        """Play random turns to the end of the game.
+
+        The board is played on with make_turn and is restored on return.
+
+        :param Board board: the position
+        :param player: the player to move
+        :param opponent: the other player
+        :rtype: the winning player, or None for a draw
+        """
+        made = 0
+        winner = None
+        top = Building.MAX_HEIGHT - 1
+        try:
+            while made < self.MAX_PLAYOUT_TURNS:
+                turn = self.random_turn(board, player)
+                if turn is None:
+                    winner = opponent
+                    break
+                board.make_turn(*turn)
+                made += 1
+                if board.get_height(board.worker_position(turn[0]),
+                                    Direction.STAY) == top:
+                    winner = player
+                    break
+                player, opponent = opponent, player
+        finally:
+            for _ in range(made):
+                board.unmake_turn()
+        return winner
+
+    def _run_playout(self, root, board, player, opponent):
+        """Select, expand, play out and back up one playout from the root."""
+        node = root
+        made = 0
+        mover, other = opponent, player
+        winner = None
+        top = Building.MAX_HEIGHT - 1
+        try:
+            # select
+            while not node.untried and node.children:
+                node = node.select(self.exploration)
+                board.make_turn(*node.turn)
+                made += 1
+                mover, other = other, mover
+            if node.turn is not None and board.get_height(
+                    board.worker_position(node.turn[0]), Direction.STAY) == top:
+                winner = mover
+            elif not node.untried:
+                # the player to move has no turns left
+                winner = mover
+            else:
+                # expand
+                turn = node.untried.pop(
+                    self.random.randrange(len(node.untried)))
+                board.make_turn(*turn)
+                made += 1
+                mover, other = other, mover
+                if board.get_height(board.worker_position(turn[0]),
+                                    Direction.STAY) == top:
+                    untried = []
+                    winner = mover
+                else:
+                    untried = self.tree_turns(board, other)
+                    winner = (self.playout(board, other, mover) if untried
+                              else mover)
+                child = _Node(turn, node, untried)
+                node.children.append(child)
+                node = child
+        finally:
+            for _ in range(made):
+                board.unmake_turn()
+        # back up, a node's wins are those of the player who moved into it
+        while node is not None:
+            node.visits += 1
+            if winner is not None and winner == mover:
+                node.wins += 1
+            elif winner is None:
+                node.wins += 0.5
+            mover, other = other, mover
+            node = node.parent
+        self.played += 1
+
+    def plan_turn(self, workers, board):
+        """Return a valid turn for the list of player's worker on the board.
+
+        A valid turn is one of:
+        (None, None, None) - A no request if it couldn't find any move
+        (Worker, Direction, None) - Move request
+        (Worker, Direction, Direction). - Move+Build request
+
+        :param list Worker workers: A list of a player's worker
+        :param Board board: a game board
+
+        :rtype Union[(None, None, None), (Worker, Direction, None),
+                     (Worker, Direction, Direction)]:
+               a valid turn as described above
+        """
+        if not workers:
+            return (None, None, None)
+        board = board.clone()
+        player = workers[0].player
+        opponent = AlphaBetaStrategy.opponent(board, player)
+        self.played = 0
+        turns = self.tree_turns(board, player)
+        if len(turns) > 1:
+            turns = self.safe_turns(board, opponent, turns)
+        root = _Node(None, None, turns)
+        if len(root.untried) < 2:
+            return root.untried[0] if root.untried else (None, None, None)
+        deadline = (time.perf_counter() + self.time_budget * self.time_fraction
+                    if self.time_budget is not None else None)
+        while True:
+            self._run_playout(root, board, player, opponent)
+            if deadline is None:
+                if self.played >= self.playouts:
+                    break
+            elif (not self.played % self.CLOCK_PLAYOUTS and
+                  time.perf_counter() > deadline):
+                break
+        return max(root.children, key=lambda child: child.visits).turn
@@ -0,0 +1,120 @@
+"""Orders of the turns tried by the game tree searches of Santorini turn strategies."""
+
+import os
+import sys
+sys.path.append(os.path.join(os.path.dirname(__file__), "../.."))
+from Santorini.Common.pieces import Building, NEIGHBORS, CELL_INDEX
+
+
+class MoveOrder:
+    """The order the search tries the turns of a position in.
+
+    Turns are tried in the order rulechecker.legal_turns gives them. A
+    subclass reorders them so that a good turn comes early and cuts off the
+    rest; the search tells it which turns cut off, to learn from.
+    """
+
+    def order(self, board, turns, ply):
+        """Return the turns of a position in the order to try them.
+
+        :param Board board: the position, it must be left as it is
+        :param list turns: the (Worker, Direction, Direction) turns
+        :param int ply: the number of turns from the root of the search
+        :rtype list: the turns
+        """
+        return turns
+
+    def cutoff(self, board, turn, ply, depth):
+        """Called when a turn scored too well for the opponent to allow it.
+
+        :param Board board: the position the turn was made in
+        :param tuple turn: the (Worker, Direction, Direction) turn
+        :param int ply: the number of turns from the root of the search
+        :param int depth: the number of turns left to search below the turn
+        """
+        pass
+
+    def reset(self):
+        """Forget what was learned, called before every search."""
+        pass
+
+
+class HeuristicOrder(MoveOrder):
+    """Tries the turns most likely to cut off first.
+
+    Turns are tried in this order:
+    * a move onto a building of height Building.MAX_HEIGHT - 1, which wins
+    * climbs, the highest first
+    * the killer turns of the ply: the last KILLERS turns that cut off at
+      the same number of turns from the root, most recent first
+    * the turns that cut off the most, and the deepest, anywhere in the
+      search, from a history table
+    and otherwise in the order they were given. The killers and the history
+    table can be left out, to measure what they bring.
+    """
+
+    # How many killer turns are kept per ply
+    KILLERS = 2
+
+    def __init__(self, killers=True, history=True):
+        """Create an order that has not learned anything yet.
+
+        :param bool killers: if killer turns are tried early
+        :param bool history: if the history table orders the other turns
+        """
+        self.killers = killers
+        self.history = history
+        self._killers = {}
+        self._history = {}
+
+    def __reduce__(self):
+        # what was learned is about this process's workers, it is not sent
+        # along to other processes
+        return (HeuristicOrder, (self.killers, self.history))
+
+    def order(self, board, turns, ply):
+        """Return the turns of a position in the order to try them.
+
+        See MoveOrder.order.
+        """
+        heights = board.heights()
+        top = Building.MAX_HEIGHT - 1
+        killers = self._killers.get(ply, ())
+        history = self._history
+        targets = {}
+        for worker in board.workers:
+            pos = board.worker_position(worker)
+            targets[worker] = (heights[CELL_INDEX[pos]],
+                               {move_dir: heights[CELL_INDEX[moved_pos]]
+                                for move_dir, moved_pos in NEIGHBORS[pos]})
+
+        def key(turn):
+            height, moved_heights = targets[turn[0]]
+            moved_height = moved_heights[turn[1]]
+            # turns that do not climb are all alike, for the killers and
+            # the history to order
+            return (moved_height == top, max(moved_height - height, 0),
+                    len(killers) - killers.index(turn) if turn in killers else 0,
+                    history.get(turn, 0))
+
+        return sorted(turns, key=key, reverse=True)
+
+    def cutoff(self, board, turn, ply, depth):
+        """Remember a turn that cut off as a killer of its ply and in the
+        history table, by the square of the depth searched below it.
+
+        See MoveOrder.cutoff.
+        """
+        if self.killers:
+            killers = self._killers.setdefault(ply, [])
+            if turn in killers:
+                killers.remove(turn)
+            killers.insert(0, turn)
+            del killers[self.KILLERS:]
+        if self.history:
+            self._history[turn] = self._history.get(turn, 0) + (depth + 1) ** 2
+
+    def reset(self):
+        """Forget the killers and the history, called before every search."""
+        self._killers.clear()
+        self._history.clear()
@@ -0,0 +1,166 @@
+"""A parallel alpha-beta game tree search strategy to be used with a Player component in Santorini."""
+
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+sys.path.append(os.path.join(os.path.dirname(__file__), "../.."))
+from Santorini.Player.alphabeta_strat import (AlphaBetaStrategy, INFINITY,
+                                               _first)
+from Santorini.Player.transposition import TranspositionTable
+from Santorini.Common.pieces import Board
+
+# The players of a board decoded in a search process: the player to move
+# and the opponent, by their slot in the encoded board
+_SLOTS = (0, 1)
+
+
+def _search_turns(data, depth, turns, alpha, seconds, evaluator, move_order,
+                  memory):
+    """Score root turns of a position, in a search process.
+
+    :param bytes data: the position, encoded with Board.to_bytes with the
+                       player to move in slot 0
+    :param int depth: the number of turns to search, the root turn included
+    :param list turns: the (worker index in board.workers, Direction,
+                       Direction) root turns to score
+    :param int alpha: the score the player is already sure of
+    :param float seconds: an (optional) number of seconds to search for
+    :param function evaluator: see AlphaBetaStrategy
+    :param MoveOrder move_order: see AlphaBetaStrategy
+    :param int memory: the memory of the process's transposition table, or
+                       None for no table
+    :rtype (list, int): the score of every turn, exact when above alpha,
+                        and the number of nodes searched
+    :raise SearchTimeout: if the time is up
+    """
+    board = Board.from_bytes(data, _SLOTS)
+    table = TranspositionTable(memory) if memory is not None else None
+    strategy = AlphaBetaStrategy(depth, evaluator, move_order, table)
+    if seconds is not None:
+        strategy._deadline = time.perf_counter() + seconds
+    player, opponent = _SLOTS
+    workers = board.workers
+    scores = []
+    for index, move_dir, build_dir in turns:
+        board.make_turn(workers[index], move_dir, build_dir)
+        scores.append(-strategy._negamax(board, opponent, player, depth - 1,
+                                         -INFINITY, -alpha, 1))
+        board.unmake_turn()
+    return scores, strategy.nodes
+
+
+class ParallelAlphaBetaStrategy(AlphaBetaStrategy):
+    """An AlphaBetaStrategy that splits the turns of the root of its
+    searches across a pool of processes.
+
+    The first root turn, the most likely best, is searched here to get a
+    bound on the score. The other root turns are then dealt out to the
+    processes, which score them against that bound, each with its own
+    transposition table. The memory of the strategy's table is split evenly
+    between those tables. Positions are sent in the binary form of
+    Board.to_bytes.
+
+    The turn and score found for a depth are those of the serial search:
+    the root turns are tried in the same order and the first one with the
+    best score is played.
+
+    The processes are started by the first search that splits its root and
+    kept for the next ones. They are shut down by close, which end_of_game
+    calls, so a Player releases them when each game is over; the next
+    search starts them again.
+    """
+
+    def __init__(self, depth=4, evaluator=None, move_order=None,
+                 table=None, time_budget=None, time_fraction=0.5, reuse=True,
+                 processes=None):
+        """Constructs a parallel alpha-beta turn strategy object
+
+        See AlphaBetaStrategy for the other arguments.
+
+        :param int processes: the number of search processes, the number of
+                              CPUs by default
+        """
+        super().__init__(depth, evaluator, move_order, table, time_budget,
+                         time_fraction, reuse)
+        self.processes = processes or os.cpu_count() or 1
+        self._pool = None
+
+    def close(self):
+        """Shut the search processes down, they are started again when
+        needed."""
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    def end_of_game(self):
+        """Shut the search processes down, see TurnStrategy.end_of_game."""
+        self.close()
+
+    def search(self, board, player, opponent, depth, first=None):
+        """Search a position and return the best turn and its score.
+
+        See AlphaBetaStrategy.search.
+        """
+        win = self.winning_turn(board, player)
+        # a ponder search stays here, where its table is kept and it can be
+        # stopped
+        if win or depth < 2 or self._stop is not None:
+            return super().search(board, player, opponent, depth, first)
+        turns = self.move_order.order(board, self.search_turns(board, player), 0)
+        if self.table is not None:
+            entry = self.table.probe(board.zobrist_hash)
+            if entry is not None:
+                turns = _first(turns, entry[4])
+        turns = _first(turns, first)
+        if len(turns) < 2:
+            return super().search(board, player, opponent, depth, first)
+
+        self._partial = None
+        board.make_turn(*turns[0])
+        best_score = -self._negamax(board, opponent, player, depth - 1,
+                                    -INFINITY, INFINITY, 1)
+        board.unmake_turn()
+        best_turn = self._partial = turns[0]
+
+        for turn, score in zip(turns[1:], self._split(
+                board, player, opponent, depth, turns[1:], best_score)):
+            if score > best_score:
+                best_score, best_turn = score, turn
+        if self.table is not None:
+            self.table.store(board.zobrist_hash, depth, TranspositionTable.EXACT,
+                             best_score, best_turn)
+        return best_score, best_turn
+
+    def _split(self, board, player, opponent, depth, turns, alpha):
+        """Score root turns in the search processes.
+
+        :rtype list int: the score of every turn, exact when above alpha
+        :raise SearchTimeout: if the time is up
+        """
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(self.processes)
+        data = board.to_bytes([player, opponent])
+        index = {worker: slot for slot, worker in enumerate(board.workers)}
+        encoded = [(index[worker], move_dir, build_dir)
+                   for worker, move_dir, build_dir in turns]
+        seconds = (self._deadline - time.perf_counter()
+                   if self._deadline is not None else None)
+        memory = None
+        if self.table is not None:
+            # the processes share the memory of the table between them
+            memory = max(self.table.memory // self.processes,
+                         2 * TranspositionTable.ENTRY_BYTES)
+        # deal the turns out in turn, so every process gets good and bad ones
+        chunks = [encoded[start::self.processes]
+                  for start in range(min(self.processes, len(encoded)))]
+        futures = [self._pool.submit(_search_turns, data, depth, chunk, alpha,
+                                     seconds, self.evaluator, self.move_order,
+                                     memory)
+                   for chunk in chunks]
+        scores = [None] * len(encoded)
+        for start, future in enumerate(futures):
+            chunk_scores, nodes = future.result()
+            scores[start::self.processes] = chunk_scores
+            self.nodes += nodes
+        return scores
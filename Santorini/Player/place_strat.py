@@ -4,7 +4,7 @@ import sys
 import os
 sys.path.append(os.path.join(os.path.dirname(__file__), "../.."))
 from Santorini.Player.strategy import PlaceStrategy
-from Santorini.Common.pieces import Board
+from Santorini.Common.pieces import CELLS
 
 
 class PlaceStratDiagonal(PlaceStrategy):
@@ -58,18 +58,18 @@ class PlaceStratFar(PlaceStrategy):
         farthest_pos = (0, 0)
         farthest_dist = 0
 
-        for row in range(Board.BOARD_SIZE):
-            for col in range(Board.BOARD_SIZE):
-                low_dist = board.BOARD_SIZE * 2
-                for worker in opposing_workers:
-                    dist = PlaceStratFar.calc_distance((row, col), worker)
-                    if dist < low_dist:
-                        low_dist = dist
-                empty_board[row][col] = low_dist
-                if (farthest_dist < low_dist and
-                        not board.is_occupied((row, col))):
-                    farthest_pos = (row, col)
-                    farthest_dist = low_dist
+        for pos in CELLS:
+            row, col = pos
+            low_dist = board.BOARD_SIZE * 2
+            for worker in opposing_workers:
+                dist = PlaceStratFar.calc_distance(pos, worker)
+                if dist < low_dist:
+                    low_dist = dist
+            empty_board[row][col] = low_dist
+            if (farthest_dist < low_dist and
+                    not board.is_occupied(pos)):
+                farthest_pos = pos
+                farthest_dist = low_dist
         return farthest_pos
 
     @staticmethod
@@ -1,6 +1,7 @@
 """Player implementation in Santorini"""
 import sys
 import os
+import threading
 sys.path.append(os.path.join(os.path.dirname(__file__), "../.."))
 from Santorini.Common.player_interface import AbstractPlayer
 import Santorini.Common.rulechecker
@@ -13,11 +14,24 @@ from Santorini.Player.tree_strat import TreeStrategy
 class Player(AbstractPlayer):
     """Player data reprensation in Santorini."""
 
-    def __init__(self):
+    def __init__(self, turn_strat=None, ponder=False):
         """Create a Player.
+
+        :param TurnStrategy turn_strat: an (optional) turn strategy, a
+                                        TreeStrategy by default
+        :param bool ponder: if the turn strategy keeps thinking in a
+                            background thread while the opponent plays,
+                            see TurnStrategy.ponder. The thread shares the
+                            interpreter, so it slows down an opponent
+                            running in the same process.
         """
-        self.strategy = Strategy(PlaceStratDiagonal(), TreeStrategy())
+        if turn_strat is None:
+            turn_strat = TreeStrategy()
+        self.strategy = Strategy(PlaceStratDiagonal(), turn_strat)
         self.workers = []
+        self.ponder = ponder
+        self._ponder_thread = None
+        self._ponder_stop = None
 
     def set_id(self, player_id):
         """Give a id for this Player.
@@ -26,6 +40,21 @@ class Player(AbstractPlayer):
         """
         self._player_id = player_id
 
+    def set_name(self, name, new_name=False):
+        """Informs the player of their name.
+
+        :param String name: the name of the this player
+        :param Bool new_name: whether this name is a new name
+        """
+        self._name = name
+
+    def set_opponent(self, opp_id, name):
+        """Informs the player of the opponent's id and name.
+
+        :param Uuid opp_id: the opponent's uuid
+        :param String name: the opponent's name
+        """
+        self._opponent_name = name
 
     def start_of_game(self):
         """Initialize the player.
@@ -33,15 +62,16 @@ class Player(AbstractPlayer):
         Called once at the start of the game to do any needed
         initialization for the implementation of the player.
         """
-        pass
+        self._stop_pondering()
+        self.workers = []
 
     def place_worker(self, cur_board):
         """Worker Placement.
 
-        :param Board cur_board: a copy of the current board
+        :param BoardState cur_board: a snapshot of the current board
         :rtype tuple (Worker, (row, col)) placement: the placement
         """
-        new_worker = Worker(self, len(self.workers) + 1)
+        new_worker = Worker(self._player_id, len(self.workers) + 1)
         self.workers.append(new_worker)
         placement = self.strategy.plan_placement(new_worker, cur_board)
         return new_worker, placement
@@ -49,14 +79,39 @@ class Player(AbstractPlayer):
     def play_turn(self, cur_board):
         """Regular Santorini turn.
 
-        :param Board cur_board: a copy of the current state of the board
+        :param BoardState cur_board: a snapshot of the current board
         :rtype Turn result_turn: the turn to be sent to the ref.
         """
-        return self.strategy.plan_turn(self.workers, cur_board)
+        self._stop_pondering()
+        turn = self.strategy.plan_turn(self.workers, cur_board)
+        if self.ponder:
+            self._start_pondering(cur_board, turn)
+        return turn
 
     def end_of_game(self, won):
         """Call when the game is over.
 
         :param str winner: the name of the Player that won the game
         """
-        pass
+        self._stop_pondering()
+        self.strategy.end_of_game()
+
+    def _start_pondering(self, cur_board, turn):
+        """Start thinking about the next turn in a background thread.
+
+        :param BoardState cur_board: the board the turn was planned on
+        :param tuple turn: the turn played on it
+        """
+        self._ponder_stop = threading.Event()
+        self._ponder_thread = threading.Thread(
+            target=self.strategy.ponder, args=(cur_board, turn, self._ponder_stop),
+            daemon=True)
+        self._ponder_thread.start()
+
+    def _stop_pondering(self):
+        """Stop the background thinking, if any, and wait for it to end."""
+        if self._ponder_thread is not None:
+            self._ponder_stop.set()
+            self._ponder_thread.join()
+            self._ponder_thread = None
+            self._ponder_stop = None
@@ -21,10 +21,10 @@ class Strategy:
         self.place_strat = place_strat
         self.turn_strat = turn_strat
 
-    def plan_placement(self, player, board):  # pragma: no cover
+    def plan_placement(self, worker, board):  # pragma: no cover
         """Generate a plan for the next turn to be played.
 
-        :param Uuid player: the id of the Player to plan a placement for
+        :param Worker worker: the worker to plan a placement for
         :param Board board: a copy of the current game board
         :rtype tuple result: a tuple containing a worker and a position
         (row, col), representing the placement on the board
@@ -42,6 +42,19 @@ class Strategy:
         """
         return self.turn_strat.plan_turn(workers, board)
 
+    def ponder(self, board, turn, stop):
+        """Think about the next turn while the opponent plays theirs.
+
+        :param BoardState board: the board the turn was planned on
+        :param tuple turn: the turn played on it
+        :param threading.Event stop: set when the thinking must end
+        """
+        self.turn_strat.ponder(board, turn, stop)
+
+    def end_of_game(self):
+        """Release what the strategy holds for a game once it is over."""
+        self.turn_strat.end_of_game()
+
 
 class PlaceStrategy(ABC):
     """An interface for a placement strategy."""
@@ -65,3 +78,24 @@ class TurnStrategy(ABC):
         (Worker, Direction, Direction). - Move+Build request
         """
         pass
+
+    def ponder(self, board, turn, stop):
+        """Think about the next turn while the opponent plays theirs, until
+        stop is set. A strategy that has nothing to think about returns
+        right away, which is the default.
+
+        Called in a thread of its own after a turn was played, never while
+        a turn is being planned.
+
+        :param BoardState board: the board the turn was planned on
+        :param tuple turn: the turn played on it
+        :param threading.Event stop: set when the thinking must end
+        """
+        pass
+
+    def end_of_game(self):
+        """Release what the strategy holds for a game once it is over, such
+        as threads or processes. The strategy can still plan turns after,
+        for the next game. Nothing to release is the default.
+        """
+        pass
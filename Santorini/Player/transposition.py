@@ -0,0 +1,135 @@
+"""A transposition table to be used by the game tree searches of Santorini turn strategies."""
+
+
+class TranspositionTable:
+    """A fixed-size table of search results, keyed by position hash.
+
+    Different orders of turns often reach the same heights and worker
+    positions, so a search meets the same position many times. The table
+    remembers what the search found about a position, by its Zobrist hash
+    (see Board.zobrist_hash): the depth it was searched to, the score, if
+    the score is exact or only a bound, and the best turn.
+
+    The table has a fixed number of buckets, set by a memory cap. A
+    position goes into the bucket of its hash modulo the number of buckets,
+    which has two entries: a depth-preferred one, that keeps the deepest
+    result, and an always-replace one, that keeps the most recent result
+    that was not deep enough for the first.
+
+    A table can be kept from one search to the next: every search started
+    with new_search is a new generation, and the entries of earlier
+    generations give way to the entries of the current one, whatever their
+    depth. A hit on an entry of an earlier generation is counted as reused.
+
+    An entry is a tuple (key, depth, bound, score, move).
+    """
+
+    # The bounds of a score: the score is exact, or the score is at least
+    # (a lower bound) or at most (an upper bound) the position's score
+    EXACT = 0
+    LOWER = 1
+    UPPER = 2
+
+    # The bytes taken by an entry: the tuple, the hash, the score, the turn
+    # tuple and the slots in the entry and generation lists, measured with
+    # sys.getsizeof
+    ENTRY_BYTES = 224
+
+    DEFAULT_MEMORY = 64 * 1024 * 1024
+
+    def __init__(self, memory=DEFAULT_MEMORY):
+        """Create an empty table.
+
+        :param int memory: the number of bytes the entries may take
+        :raise ValueError: if that is not enough for a bucket
+        """
+        buckets = memory // (2 * self.ENTRY_BYTES)
+        if buckets < 1:
+            raise ValueError("The table must have room for at least one bucket")
+        self.memory = memory
+        self.buckets = buckets
+        self.clear()
+
+    def clear(self):
+        """Drop every entry and reset the statistics."""
+        self.generation = 0
+        self._deep = [None] * self.buckets
+        self._recent = [None] * self.buckets
+        # the generation each entry was stored in
+        self._deep_generation = [0] * self.buckets
+        self._recent_generation = [0] * self.buckets
+        self.reset_stats()
+
+    def new_search(self):
+        """Start a search that keeps the entries of the earlier ones, and
+        reset the statistics."""
+        self.generation += 1
+        self.reset_stats()
+
+    def reset_stats(self):
+        """Reset the statistics, called at the start of every search."""
+        self.probes = 0
+        self.hits = 0
+        self.reused = 0
+        self.stores = 0
+        self.replaced = 0
+
+    @property
+    def hit_rate(self):
+        """The fraction of probes that found their position."""
+        return self.hits / self.probes if self.probes else 0.0
+
+    def __len__(self):
+        return (sum(entry is not None for entry in self._deep) +
+                sum(entry is not None for entry in self._recent))
+
+    def probe(self, key):
+        """Return the entry of a position, or None if it is not kept.
+
+        :param int key: the Zobrist hash of the position
+        :rtype tuple (key, depth, bound, score, move) | None
+        """
+        self.probes += 1
+        index = key % self.buckets
+        entry = self._deep[index]
+        generation = self._deep_generation[index]
+        if entry is None or entry[0] != key:
+            entry = self._recent[index]
+            generation = self._recent_generation[index]
+            if entry is None or entry[0] != key:
+                return None
+        self.hits += 1
+        if generation != self.generation:
+            self.reused += 1
+        return entry
+
+    def store(self, key, depth, bound, score, move):
+        """Keep the result of searching a position.
+
+        :param int key: the Zobrist hash of the position
+        :param int depth: the number of turns the position was searched to
+        :param int bound: EXACT, LOWER or UPPER
+        :param int score: the score of the position, for the player to move
+        :param tuple move: the best (Worker, Direction, Direction) turn found,
+                           or None
+        """
+        self.stores += 1
+        index = key % self.buckets
+        entry = (key, depth, bound, score, move)
+        deep = self._deep[index]
+        if (deep is None or deep[0] == key or depth >= deep[1] or
+                self._deep_generation[index] != self.generation):
+            self._deep[index] = entry
+            self._deep_generation[index] = self.generation
+            if deep is not None and deep[0] != key:
+                self.replaced += 1
+            recent = self._recent[index]
+            if recent is not None and recent[0] == key:
+                # do not keep an older result of the same position
+                self._recent[index] = None
+        else:
+            recent = self._recent[index]
+            if recent is not None and recent[0] != key:
+                self.replaced += 1
+            self._recent[index] = entry
+            self._recent_generation[index] = self.generation
@@ -1,12 +1,9 @@
 """A game tree-based strategy to be used with a Player component in Santorini."""
 
-import copy
-from itertools import product
 import os
 import sys
 sys.path.append(os.path.join(os.path.dirname(__file__), "../.."))
 from Santorini.Player.strategy import TurnStrategy
-from Santorini.Common.pieces import Direction
 from Santorini.Common import rulechecker
 import logging
 logger = logging.getLogger('tree_strat')
@@ -37,14 +34,7 @@ class TreeStrategy(TurnStrategy):
         :rtype Generator[(Worker, Direction, Direction), None None]
         """
         for worker in workers:
-            for move_dir in Direction:
-                if (rulechecker.can_move_build(board, worker,
-                                               move_dir)):
-                    yield (worker, move_dir, None)
-            for move_dir, build_dir in product(Direction, Direction):
-                if (rulechecker.can_move_build(board, worker,
-                                               move_dir, build_dir)):
-                    yield (worker, move_dir, build_dir)
+            yield from rulechecker.worker_turns(board, worker)
 
     @staticmethod
     def do_survive(board, pname, depth, worker=None,
@@ -53,6 +43,9 @@ class TreeStrategy(TurnStrategy):
         optional turn, return whether or not the given player name
         survives up to the depth number of rounds.
 
+        Turns are played on the given board with make_turn and undone
+        before returning, so the board is left exactly as it was given.
+
         :param Board board: A game board
         :param str pname: A player name
         :param int depth: the number of look-ahead rounds
@@ -62,76 +55,95 @@ class TreeStrategy(TurnStrategy):
         :param Direction build_dir: An optional direction the worker builds in
         :rtype bool: if we survived depth number of rounds
         """
-        copied_board = copy.deepcopy(board)
-        if move_dir:
-            copied_board.move_worker(worker, move_dir)
-            if build_dir:
-                copied_board.build_floor(worker, build_dir)
-            else:
+        if not move_dir:
+            return TreeStrategy._survive_position(board, pname, depth, False)
+
+        board.make_turn(worker, move_dir, build_dir)
+        try:
+            if not build_dir:
                 # if there's no build, you must win this turn
-                return rulechecker.get_winner(copied_board) == pname
+                return rulechecker.get_winner(board) == pname
+            return TreeStrategy._survive_position(board, pname, depth, True)
+        finally:
+            board.unmake_turn()
+
+    @staticmethod
+    def _survive_position(board, pname, depth, moved):
+        """Return whether the given player name survives from a position.
 
-        checkwin = rulechecker.get_winner(copied_board)
+        :param Board board: A game board, turns are made and unmade on it
+        :param str pname: A player name
+        :param int depth: the number of look-ahead rounds
+        :param bool moved: if the player just made a turn to reach the board
+        :rtype bool: if we survived depth number of rounds
+        """
+        checkwin = rulechecker.get_winner(board)
         if checkwin == pname:
             # if we won, we survived
-            logger.info(str(pname) + " won a case Board:" + str(board) + " at Depth:" + str(depth))
-            depth -= 1
+            logger.info("%s won a case Board:%s at Depth:%s",
+                        pname, board, depth)
             return True
         elif checkwin:
-            logger.info(str(pname) + " won a case Board:" + str(board) + " at Depth:" + str(depth))
+            logger.info("%s won a case Board:%s at Depth:%s",
+                        pname, board, depth)
             # if we lost, we died
             return False
 
         # base case, if there's no winner, we survived
         if depth == 0:
-            logger.info("player" + pname + "lived with this move:" + str(copied_board) + " depth:" + str(depth))
-            return not rulechecker.get_winner(copied_board)
+            logger.info("player%slived with this move:%s depth:%s",
+                        pname, board, depth)
+            return not rulechecker.get_winner(board)
 
         # recursive case
-        opp_workers = [w for w in copied_board.workers
+        opp_workers = [w for w in board.workers
                        if pname != w.player]
-        our_workers = [w for w in copied_board.workers
-                       if pname == w.player]
-        enemy_turns = TreeStrategy.next_turn(opp_workers, copied_board)
+        our_workers = board.workers_of(pname)
+        enemy_turns = TreeStrategy.next_turn(opp_workers, board)
         viable_move = False
-        if move_dir:
+        if moved:
             for enemy_worker, enemy_move, enemy_build in enemy_turns:
-                next_board = copy.deepcopy(copied_board)
-                next_board.move_worker(enemy_worker, enemy_move)
-                if enemy_build:
-                    next_board.build_floor(enemy_worker, enemy_build)
-                winner = rulechecker.get_winner(next_board)
-                if (winner and winner != pname):
-                    #enemy found a way to kill you on their move, return False
-                    logger.info("player " + str(winner) + " kills with this move:" + str(next_board) + " depth:" + str(depth))
-                    return False
-
-                if depth > 1:
-                    our_turns = TreeStrategy.next_turn(our_workers, next_board)
-                    safe = False
-                    # check that we have a safe move
-                    for our_worker, our_move, our_build in our_turns:
-                        if TreeStrategy.do_survive(next_board, pname, depth - 2, worker=our_worker, move_dir=our_move, build_dir=our_build):
-                            logger.info("player " + str(pname) + " survived with this move:" + str(next_board) + " depth:" + str(depth))
-                            continue
-                        else:
-                            safe = True
-                            break
-                    if safe:
-                        viable_move = True
+                board.make_turn(enemy_worker, enemy_move, enemy_build)
+                try:
+                    winner = rulechecker.get_winner(board)
+                    if (winner and winner != pname):
+                        #enemy found a way to kill you on their move, return False
+                        logger.info("player %s kills with this move:%s depth:%s",
+                                    winner, board, depth)
+                        return False
+
+                    if depth > 1:
+                        our_turns = TreeStrategy.next_turn(our_workers, board)
+                        safe = False
+                        # check that we have a safe move
+                        for our_worker, our_move, our_build in our_turns:
+                            if TreeStrategy.do_survive(board, pname, depth - 2, worker=our_worker, move_dir=our_move, build_dir=our_build):
+                                logger.info("player %s survived with this move:%s depth:%s",
+                                            pname, board, depth)
+                                continue
+                            else:
+                                safe = True
+                                break
+                        if safe:
+                            viable_move = True
+                finally:
+                    board.unmake_turn()
             # fell through
             # if depth was 1, that means that we were checking if the enemy could kill us, and if so that means this should
             # be True cause they failed to kill us
             # if depth was 2 or more that means searching for more moves failed, and we died
-            logger.info("player " + str(pname) +" depth:" + str(depth) + " viable_move" + str(viable_move))
+            logger.info("player %s depth:%s viable_move%s",
+                        pname, depth, viable_move)
             return depth < 2 or viable_move
         else:
-            our_turns = TreeStrategy.next_turn(our_workers, copied_board)
+            our_turns = TreeStrategy.next_turn(our_workers, board)
             for our_worker, our_move, our_build in our_turns:
-                if TreeStrategy.do_survive(copied_board, pname, depth - 2, worker=our_worker, move_dir=our_move, build_dir=our_build):
-                    logger.info("player " + str(pname) + " survived with this move:" + str(copied_board) + " depth:" + str(depth))
+                if TreeStrategy.do_survive(board, pname, depth - 2, worker=our_worker, move_dir=our_move, build_dir=our_build):
+                    logger.info("player %s survived with this move:%s depth:%s",
+                                pname, board, depth)
                     return True
-            logger.info("player " + str(pname) + " can't survive with this board:" + str(copied_board) + " depth:" + str(depth))
+            logger.info("player %s can't survive with this board:%s depth:%s",
+                        pname, board, depth)
             return False
 
     def plan_turn(self, workers, board):
@@ -150,6 +162,7 @@ class TreeStrategy(TurnStrategy):
                a valid turn as described above
         """
         turn = (None, None, None)
+        board = board.clone()
         for worker, move_dir, build_dir in TreeStrategy.next_turn(workers,
                                                                   board):
             if TreeStrategy.do_survive(board, workers[0].player, self.depth,
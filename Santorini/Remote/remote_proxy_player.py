@@ -47,7 +47,7 @@ class RemoteProxyPlayer(AbstractPlayer):
     def place_worker(self, cur_board):
         """ask the client for a placement given the current placements
 
-        :param Board cur_board: a copy of the current board
+        :param BoardState cur_board: a snapshot of the current board
         :rtype tuple (Worker, (row, col)) placement: the placement
         """
         self._worker_count += 1
@@ -65,12 +65,10 @@ class RemoteProxyPlayer(AbstractPlayer):
     def play_turn(self, cur_board):
         """Regular Santorini turn.
 
-        :param Board cur_board: a copy of the current state of the board
+        :param BoardState cur_board: a snapshot of the current board
         :rtype Turn result_turn: the turn to be sent to the ref.
         """
-        board_json = cur_board.dump_as_json(self._uuid_to_name)
-
-        self._send_json(board_json)
+        self._socket.send(cur_board.dump_as_json_bytes(self._uuid_to_name))
         action = self._recv_json()
 
         if not validate_json(ACTION, action):
@@ -88,7 +86,7 @@ class RemoteProxyPlayer(AbstractPlayer):
     def _non_giveup_action_to_turn(self, action, cur_board):
         """ converts a non give up action to a Turn
         :param Action action: An action that isn't a give up action
-        :param Board cur_board: a copy of the current state of the board
+        :param BoardState cur_board: a snapshot of the current board
         :rtype Turn
         """
         worker_str = action[0]
@@ -99,8 +97,8 @@ class RemoteProxyPlayer(AbstractPlayer):
             raise ValueError("malicious player name in worker")
         worker_num = int(worker_str[-1])
         worker = None
-        for w in cur_board.workers:
-            if w.player == self._player_id and w.number == worker_num:
+        for w in cur_board.workers_of(self._player_id):
+            if w.number == worker_num:
                 worker = w
         move_dir = DIR_TABLE[(move_ew, move_ns)]
         if len(action) == 3:
@@ -6,4 +6,5 @@ from .exception_player import ExceptionPlayer
 from .loop_player import LoopPlayer
 from .sleep_player import SleepPlayer
 from .malformed_data_player import MalformedDataPlayer
+from .random_boards import random_board
 
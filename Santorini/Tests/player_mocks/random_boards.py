@@ -0,0 +1,22 @@
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(__file__), "../../.."))
+from Santorini.Common.pieces import Board, CELLS
+
+# The default mix of heights, mostly low buildings as in the middle of a game
+MIDGAME_HEIGHTS = (0, 0, 1, 1, 2, 3, 4)
+
+
+def random_board(rng, workers, heights=MIDGAME_HEIGHTS):
+    """Return a random position, the same for the same seed.
+
+    :param random.Random rng: the seeded generator to draw from
+    :param list Worker workers: the workers to place, each on its own cell
+    :param tuple int heights: the heights to draw each cell from
+    :rtype Board: a board of random heights with the workers on it
+    """
+    board = Board([[rng.choice(heights) for col in range(Board.BOARD_SIZE)]
+                   for row in range(Board.BOARD_SIZE)])
+    for worker, cell in zip(workers, rng.sample(CELLS, len(workers))):
+        board.place_worker(worker, cell)
+    return board
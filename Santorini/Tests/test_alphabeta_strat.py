@@ -0,0 +1,307 @@
+"""Unit tests for the AlphaBetaStrategy Component."""
+import unittest
+import sys
+import os
+import random
+import threading
+import time
+sys.path.append(os.path.join(os.path.dirname(__file__), "../.."))
+from Santorini.Player.alphabeta_strat import (AlphaBetaStrategy,
+                                               WIN_SCORE, MAX_DEPTH,
+                                               height_evaluator)
+from Santorini.Player.strategy import Strategy
+from Santorini.Player.transposition import TranspositionTable
+from Santorini.Player.move_order import MoveOrder
+from Santorini.Player.place_strat import PlaceStratDiagonal
+from Santorini.Common.pieces import Board, Worker, Direction
+from Santorini.Tests.player_mocks import random_board
+from Santorini.Common import rulechecker
+from Santorini.Common.player_guard import PlayerGuard
+
+
+def minimax(strat, board, player, opponent, depth, ply=0):
+    """Score a position like AlphaBetaStrategy, without pruning."""
+    if strat.winning_turn(board, player):
+        return WIN_SCORE - ply - 1
+    if depth == 0:
+        return strat.evaluator(board, player, opponent)
+    turns = strat.search_turns(board, player)
+    if not turns:
+        return ply - WIN_SCORE
+    best = None
+    for turn in turns:
+        board.make_turn(*turn)
+        score = -minimax(strat, board, opponent, player, depth - 1, ply + 1)
+        board.unmake_turn()
+        best = score if best is None else max(best, score)
+    return best
+
+
+class ReversedOrder(MoveOrder):
+    """Tries turns backwards and counts the cutoffs."""
+
+    def __init__(self):
+        self.cutoffs = 0
+
+    def order(self, board, turns, ply):
+        return turns[::-1]
+
+    def cutoff(self, board, turn, ply, depth):
+        self.cutoffs += 1
+
+
+class TestAlphaBetaStrategy(unittest.TestCase):
+    """Test the alpha-beta turn strategy."""
+
+    def setUp(self):
+        self.workers = [Worker("p1", 1),
+                        Worker("p1", 2),
+                        Worker("p2", 1),
+                        Worker("p2", 2)]
+
+    def random_boards(self, count, seed):
+        """Return random mid-game positions."""
+        rng = random.Random(seed)
+        return [random_board(rng, self.workers) for _ in range(count)]
+
+    def test_plan_turn_wins(self):
+        """A worker next to a level 3 building climbs it without building."""
+        board = Board([[2, 3]],
+                      workers={self.workers[i]: (i, i)
+                               for i in range(len(self.workers))})
+        strat = AlphaBetaStrategy(3)
+        self.assertEqual(strat.plan_turn(self.workers[0:2], board),
+                         (self.workers[0], Direction.EAST, None))
+
+    def test_plan_turn_blocks(self):
+        """The opponent's winning climb is domed."""
+        board = Board([[0, 3, 2], [0, 0, 0]],
+                      workers={self.workers[0]: (1, 0),
+                               self.workers[1]: (5, 0),
+                               self.workers[2]: (0, 2),
+                               self.workers[3]: (5, 5)})
+        strat = AlphaBetaStrategy(2)
+        worker, move_dir, build_dir = strat.plan_turn(self.workers[0:2],
+                                                      board)
+        self.assertTrue(rulechecker.can_move_build(board, worker, move_dir,
+                                                   build_dir))
+        board.make_turn(worker, move_dir, build_dir)
+        self.assertIsNone(strat.winning_turn(board, "p2"))
+
+    def test_plan_turn_no_turns(self):
+        """A player that cannot move gets the no request."""
+        board = Board([[0, 2], [2, 2]],
+                      workers={self.workers[0]: (0, 0),
+                               self.workers[2]: (5, 5)})
+        self.assertEqual(AlphaBetaStrategy(2).plan_turn(self.workers[0:1],
+                                                        board),
+                         (None, None, None))
+
+    def test_plan_turn_leaves_board(self):
+        """The board given to plan_turn is not changed."""
+        board = self.random_boards(1, 3)[0]
+        before = board.snapshot()
+        AlphaBetaStrategy(3).plan_turn(self.workers[0:2], board.snapshot())
+        self.assertEqual(board.snapshot(), before)
+        AlphaBetaStrategy(3).plan_turn(self.workers[0:2], board)
+        self.assertEqual(board.snapshot(), before)
+
+    def test_search_matches_minimax(self):
+        """Pruning does not change the score of the best turn."""
+        strat = AlphaBetaStrategy(evaluator=height_evaluator)
+        for board in self.random_boards(12, 17):
+            for depth in (1, 2):
+                score, turn = strat.search(board, "p1", "p2", depth)
+                expected = minimax(strat, board, "p1", "p2", depth)
+                self.assertEqual(score, expected)
+                if turn == (None, None, None):
+                    continue
+                if turn == strat.winning_turn(board, "p1"):
+                    self.assertEqual(score, WIN_SCORE - 1)
+                    continue
+                # the best turn scores what the position does
+                board.make_turn(*turn)
+                self.assertEqual(
+                    -minimax(strat, board, "p2", "p1", depth - 1, 1),
+                    expected)
+                board.unmake_turn()
+
+    def test_move_order(self):
+        """A move order changes the nodes searched, not the score."""
+        order = ReversedOrder()
+        plain = AlphaBetaStrategy(evaluator=height_evaluator)
+        reordered = AlphaBetaStrategy(evaluator=height_evaluator,
+                                      move_order=order)
+        for board in self.random_boards(6, 5):
+            self.assertEqual(plain.search(board, "p1", "p2", 3)[0],
+                             reordered.search(board, "p1", "p2", 3)[0])
+        self.assertGreater(order.cutoffs, 0)
+
+    def test_table(self):
+        """A transposition table saves nodes, not the score."""
+        plain = AlphaBetaStrategy(evaluator=height_evaluator)
+        tabled = AlphaBetaStrategy(evaluator=height_evaluator,
+                                   table=TranspositionTable(1 << 20))
+        for board in self.random_boards(2, 5):
+            plain.nodes = tabled.nodes = 0
+            tabled.table.clear()
+            self.assertEqual(plain.search(board, "p1", "p2", 4)[0],
+                             tabled.search(board, "p1", "p2", 4)[0])
+            self.assertLessEqual(tabled.nodes, plain.nodes)
+        self.assertGreater(tabled.table.hits, 0)
+
+    def test_time_budget(self):
+        """A time budgeted search stops at its fraction of the budget with
+        the turn of the deepest search so far."""
+        board = self.random_boards(1, 8)[0]
+        strat = AlphaBetaStrategy(MAX_DEPTH, time_budget=0.4,
+                                  time_fraction=0.5)
+        start = time.perf_counter()
+        turn = strat.plan_turn(self.workers[0:2], board)
+        self.assertLess(time.perf_counter() - start, 0.4)
+        self.assertTrue(rulechecker.can_move_build(board, *turn))
+        self.assertGreaterEqual(strat.completed_depth, 1)
+        self.assertLess(strat.completed_depth, MAX_DEPTH)
+
+    def test_time_budget_no_time(self):
+        """A search out of time before any turn still plays a legal one."""
+        board = self.random_boards(1, 8)[0]
+        strat = AlphaBetaStrategy(MAX_DEPTH, time_budget=0)
+        strat.CLOCK_NODES = 1
+        turn = strat.plan_turn(self.workers[0:2], board)
+        self.assertTrue(rulechecker.can_move_build(board, *turn))
+        self.assertEqual(strat.completed_depth, 0)
+
+    def test_deepening_matches_fixed_depth(self):
+        """Deepening to a depth in time scores like searching that depth."""
+        for board in self.random_boards(3, 21):
+            fixed = AlphaBetaStrategy(3)
+            deepening = AlphaBetaStrategy.timed(1000, depth=3)
+            fixed.plan_turn(self.workers[0:2], board)
+            deepening.plan_turn(self.workers[0:2], board)
+            self.assertEqual(deepening.score, fixed.score)
+            if abs(fixed.score) < WIN_SCORE - MAX_DEPTH:
+                self.assertEqual(deepening.completed_depth, 3)
+
+    def test_timed(self):
+        """A timed strategy defaults to the PlayerGuard timeout."""
+        strat = AlphaBetaStrategy.timed()
+        self.assertEqual(strat.time_budget, PlayerGuard.DEFAULT_TIMEOUT)
+        self.assertEqual(strat.depth, MAX_DEPTH)
+        self.assertIsNotNone(strat.table)
+        with self.assertRaises(ValueError):
+            AlphaBetaStrategy(time_fraction=1.5)
+
+    def test_reuse_same_position(self):
+        """A position planned again is found in the table."""
+        board = self.random_boards(1, 28)[0]
+        strat = AlphaBetaStrategy(3, height_evaluator,
+                                  table=TranspositionTable(1 << 20))
+        turn = strat.plan_turn(self.workers[0:2], board)
+        score = strat.score
+        self.assertEqual(strat.reused_depth, 0)
+        self.assertEqual(strat.plan_turn(self.workers[0:2], board), turn)
+        self.assertEqual((strat.nodes, strat.reused_depth, strat.score),
+                         (0, 3, score))
+        strat.reuse = False
+        strat.plan_turn(self.workers[0:2], board)
+        self.assertEqual(strat.reused_depth, 0)
+        self.assertGreater(strat.nodes, 0)
+
+    def test_reuse_next_turn(self):
+        """The next turn goes on from the depth the position was searched
+        to two turns below the root."""
+        board = self.random_boards(1, 28)[0]
+        strat = AlphaBetaStrategy.timed(1000, depth=4,
+                                        evaluator=height_evaluator,
+                                        table=TranspositionTable(1 << 20))
+        board.make_turn(*strat.plan_turn(self.workers[0:2], board))
+        # the reply the search expected
+        board.make_turn(*strat.table.probe(board.zobrist_hash)[4])
+        turn = strat.plan_turn(self.workers[0:2], board)
+        self.assertTrue(rulechecker.can_move_build(board, *turn))
+        self.assertEqual(strat.reused_depth, 2)
+        self.assertGreater(strat.table.reused, 0)
+        if abs(strat.score) < WIN_SCORE - MAX_DEPTH:
+            self.assertEqual(strat.completed_depth, 4)
+
+    def pondered(self, depth=2, time_budget=None, seconds=None):
+        """Plan and ponder a turn on a random position.
+
+        :rtype (AlphaBetaStrategy, Board): the strategy and the position
+                                           after its turn
+        """
+        board = self.random_boards(1, 28)[0]
+        strat = AlphaBetaStrategy(depth, height_evaluator,
+                                  table=TranspositionTable(1 << 20),
+                                  time_budget=time_budget)
+        turn = strat.plan_turn(self.workers[0:2], board)
+        stop = threading.Event()
+        if seconds is not None:
+            threading.Timer(seconds, stop.set).start()
+        strat.ponder(board.snapshot(), turn, stop)
+        board.make_turn(*turn)
+        return strat, board
+
+    def test_ponder_hit(self):
+        """After pondering every reply, the next turn is already planned."""
+        for index in (0, 20, -1):
+            strat, board = self.pondered()
+            self.assertGreater(strat.ponder_nodes, 0)
+            reply = strat.search_turns(board, "p2")[index]
+            board.make_turn(*reply)
+            fresh = AlphaBetaStrategy(2, height_evaluator)
+            fresh.plan_turn(self.workers[0:2], board)
+            turn = strat.plan_turn(self.workers[0:2], board)
+            self.assertTrue(strat.ponder_hit)
+            self.assertEqual(strat.nodes, 0)
+            self.assertEqual(strat.score, fresh.score)
+            self.assertTrue(rulechecker.can_move_build(board, *turn))
+            # what was pondered is for one turn only, the table keeps it
+            strat.plan_turn(self.workers[0:2], board)
+            self.assertFalse(strat.ponder_hit)
+            self.assertEqual(strat.reused_depth, 2)
+
+    def test_ponder_stop(self):
+        """Pondering ends when told to and a time budgeted search goes on
+        from the deepest search of the reply guessed."""
+        start = time.perf_counter()
+        strat, board = self.pondered(MAX_DEPTH, time_budget=0.2, seconds=0.3)
+        self.assertLess(time.perf_counter() - start, 1)
+        for reply in strat.search_turns(board, "p2"):
+            board.make_turn(*reply)
+            if board.zobrist_hash in strat._pondered:
+                break
+            board.unmake_turn()
+        depth = strat._pondered[board.zobrist_hash][0]
+        turn = strat.plan_turn(self.workers[0:2], board)
+        self.assertTrue(strat.ponder_hit)
+        self.assertTrue(rulechecker.can_move_build(board, *turn))
+        if abs(strat.score) < WIN_SCORE - MAX_DEPTH:
+            self.assertGreaterEqual(strat.completed_depth, depth)
+
+    def test_ponder_nothing(self):
+        """Without a table, or after a winning turn, there is nothing to
+        ponder."""
+        board = self.random_boards(1, 28)[0]
+        strat = AlphaBetaStrategy(2, height_evaluator)
+        turn = strat.plan_turn(self.workers[0:2], board)
+        strat.ponder(board.snapshot(), turn, threading.Event())
+        self.assertEqual(strat.ponder_nodes, 0)
+        board = Board([[2, 3]],
+                      workers={self.workers[i]: (i, i)
+                               for i in range(len(self.workers))})
+        strat = AlphaBetaStrategy(2, table=TranspositionTable(1 << 20))
+        turn = strat.plan_turn(self.workers[0:2], board)
+        strat.ponder(board.snapshot(), turn, threading.Event())
+        self.assertEqual(strat.ponder_nodes, 0)
+        strat.ponder(board.snapshot(), (None, None, None), threading.Event())
+        self.assertEqual(strat.ponder_nodes, 0)
+
+    def test_strategy_drop_in(self):
+        """The strategy plugs into a Strategy like TreeStrategy."""
+        strategy = Strategy(PlaceStratDiagonal(), AlphaBetaStrategy(2))
+        for board in self.random_boards(5, 11):
+            turn = strategy.plan_turn(self.workers[0:2], board.snapshot())
+            if turn != (None, None, None):
+                self.assertTrue(rulechecker.can_move_build(board, *turn))
@@ -0,0 +1,101 @@
+"""Unit tests for the batch Rulechecker Component."""
+import unittest
+import sys
+import os
+import random
+from itertools import product
+sys.path.append(os.path.join(os.path.dirname(__file__), "../.."))
+from Santorini.Common import rulechecker
+from Santorini.Common.pieces import Worker, Direction
+from Santorini.Tests.player_mocks import random_board
+try:
+    import numpy
+    from Santorini.Common import batch_rulechecker
+except ImportError:
+    numpy = None
+
+
+@unittest.skipIf(numpy is None, "numpy is not installed")
+class TestBatchRulechecker(unittest.TestCase):
+    """Batch rulechecker tests against the rulechecker."""
+
+    def setUp(self):
+        """Random positions with two workers per player.
+
+        Workers are placed in player order so that the order of the worker
+        axis is the order of board.workers. A few positions have two
+        workers sharing a cell.
+        """
+        self.players = ["player1", "player2"]
+        self.workers = [Worker(player, num)
+                        for player in self.players for num in (1, 2)]
+        rng = random.Random(1200)
+        self.boards = []
+        for _ in range(200):
+            board = random_board(rng, self.workers, (0, 0, 1, 2, 2, 3, 4))
+            if rng.random() < 0.1:
+                board.place_worker(self.workers[3],
+                                   board.worker_position(self.workers[0]))
+            self.boards.append(board)
+        self.heights, self.positions = batch_rulechecker.from_boards(
+            self.boards, self.players)
+
+    def test_from_boards(self):
+        """The arrays hold the heights and worker positions."""
+        self.assertEqual(self.heights.shape, (200, 6, 6))
+        self.assertEqual(self.positions.shape, (200, 4, 2))
+        board = self.boards[0]
+        self.assertEqual(self.heights[0].ravel().tolist(), board.heights())
+        self.assertEqual([tuple(pos) for pos in self.positions[0].tolist()],
+                         [board.worker_position(w) for w in self.workers])
+
+    def test_move_masks(self):
+        """Move masks match can_move_build without a build."""
+        masks = batch_rulechecker.move_masks(self.heights, self.positions)
+        self.assertEqual(masks.shape, (200, 4, 8))
+        for index, board in enumerate(self.boards):
+            for slot, worker in enumerate(self.workers):
+                for move, move_dir in enumerate(batch_rulechecker.DIRECTIONS):
+                    self.assertEqual(
+                        bool(masks[index, slot, move]),
+                        bool(rulechecker.can_move_build(board, worker,
+                                                        move_dir)))
+
+    def test_build_masks(self):
+        """Build masks match can_move_build with a build."""
+        masks = batch_rulechecker.build_masks(self.heights, self.positions)
+        self.assertEqual(masks.shape, (200, 4, 8, 8))
+        directions = list(enumerate(batch_rulechecker.DIRECTIONS))
+        for index, board in enumerate(self.boards[:50]):
+            for slot, worker in enumerate(self.workers):
+                for (move, move_dir), (build, build_dir) in product(
+                        directions, directions):
+                    self.assertEqual(
+                        bool(masks[index, slot, move, build]),
+                        bool(rulechecker.can_move_build(board, worker,
+                                                        move_dir, build_dir)))
+
+    def test_immediate_wins(self):
+        """A worker can win when it can move onto a level 3 building."""
+        wins = batch_rulechecker.immediate_wins(self.heights, self.positions)
+        self.assertEqual(wins.shape, (200, 4))
+        for index, board in enumerate(self.boards):
+            for slot, worker in enumerate(self.workers):
+                pos = board.worker_position(worker)
+                expected = any(
+                    rulechecker.can_move_build(board, worker, move_dir) and
+                    board.get_height(pos, move_dir) == 3
+                    for move_dir in Direction)
+                self.assertEqual(bool(wins[index, slot]), expected)
+        self.assertTrue(wins.any())
+
+    def test_winners(self):
+        """Winners match get_winner."""
+        winners = batch_rulechecker.winners(self.heights, self.positions)
+        self.assertEqual(winners.shape, (200,))
+        for index, board in enumerate(self.boards):
+            winner = rulechecker.get_winner(board)
+            expected = self.players.index(winner) if winner else -1
+            self.assertEqual(int(winners[index]), expected)
+        self.assertTrue((winners == -1).any())
+        self.assertTrue((winners != -1).any())
@@ -3,7 +3,14 @@ import unittest
 import sys
 import os
 sys.path.append(os.path.join(os.path.dirname(__file__), "../.."))
-from Santorini.Common.pieces import Board, Worker, Direction
+from Santorini.Common.pieces import Board, BoardState, Worker, Direction
+from Santorini.Tests.player_mocks import random_board
+from Santorini.Common import rulechecker
+from itertools import product
+import copy
+import json
+import pickle
+import random
 import uuid
 
 class TestBoard(unittest.TestCase):
@@ -315,3 +322,363 @@ class TestBoard(unittest.TestCase):
                  [0, 0, 0, 0, 0, 0], [0, 0, 0, 0, 0, 0]]
         self.assertEqual(board.dump_as_json(self.uuids_to_name),
                 expected_str)
+
+    def test_move_worker_off_shared_cell(self):
+        """Case for moving a worker off a cell that another worker is on."""
+        board = Board(workers={self.workers[0]: (0, 0),
+                               self.workers[1]: (0, 0)})
+        board.move_worker(self.workers[0], Direction.EAST)
+        self.assertTrue(board.is_occupied((0, 0)))
+        self.assertTrue(board.is_occupied((0, 1)))
+        board.move_worker(self.workers[1], Direction.SOUTH)
+        self.assertFalse(board.is_occupied((0, 0)))
+        self.assertTrue(board.is_occupied((1, 0)))
+
+    def test_build_floor_to_max(self):
+        """Case for building every floor of a building one at a time."""
+        board = Board(workers={self.workers[0]: (0, 0)})
+        for height in range(1, 5):
+            board.build_floor(self.workers[0], Direction.EAST)
+            self.assertEqual(board.get_height((0, 0), Direction.EAST), height)
+        self.assertTrue(board.is_maxheight((0, 0), Direction.EAST))
+        self.assertEqual(board.get_height((0, 0), Direction.STAY), 0)
+
+    def test_clone(self):
+        """Test that a cloned board can be changed without changing the original."""
+        board = Board([[0, 1]], workers={self.workers[0]: (0, 0)})
+        clone = board.clone()
+        clone.move_worker(self.workers[0], Direction.EAST)
+        clone.build_floor(self.workers[0], Direction.WEST)
+        clone.place_worker(self.workers[1], (2, 2))
+        self.assertEqual(board.worker_position(self.workers[0]), (0, 0))
+        self.assertEqual(board.get_height((0, 0), Direction.STAY), 0)
+        self.assertFalse(board.is_occupied((2, 2)))
+        self.assertEqual(len(board.workers), 1)
+        self.assertEqual(clone.worker_position(self.workers[0]), (0, 1))
+        self.assertEqual(clone.get_height((0, 0), Direction.STAY), 1)
+        self.assertEqual(clone.dump_as_json(self.uuids_to_name)[0][:2],
+                         [1, '1player11'])
+
+    def _board_state(self, board):
+        """Return everything observable about a board for comparison."""
+        return (board.dump_as_json(self.uuids_to_name),
+                [(w, board.worker_position(w)) for w in board.workers],
+                [board.is_occupied((row, col))
+                 for row in range(Board.BOARD_SIZE)
+                 for col in range(Board.BOARD_SIZE)])
+
+    def test_make_unmake_turn(self):
+        """Test that unmaking a turn restores the board exactly."""
+        board = Board([[0, 1, 3]], workers={self.workers[0]: (0, 0),
+                                            self.workers[2]: (1, 1)})
+        before = self._board_state(board)
+        record = board.make_turn(self.workers[0], Direction.EAST,
+                                 Direction.EAST)
+        self.assertEqual(record, (self.workers[0], (0, 0), 2))
+        self.assertEqual(board.worker_position(self.workers[0]), (0, 1))
+        self.assertTrue(board.is_maxheight((0, 1), Direction.EAST))
+        self.assertEqual(board.unmake_turn(), record)
+        self.assertEqual(self._board_state(board), before)
+
+    def test_make_turn_failed_build(self):
+        """Test that a turn with an invalid build leaves the board unchanged."""
+        board = Board([[0, 0, 4]], workers={self.workers[0]: (0, 0)})
+        before = self._board_state(board)
+        with self.assertRaises(OverflowError):
+            board.make_turn(self.workers[0], Direction.EAST, Direction.EAST)
+        with self.assertRaises(IndexError):
+            board.make_turn(self.workers[0], Direction.EAST, Direction.NORTH)
+        self.assertEqual(self._board_state(board), before)
+        with self.assertRaises(IndexError):
+            board.unmake_turn()
+
+    def test_make_unmake_round_trip(self):
+        """Test that random sequences of turns undo back to the original."""
+        rng = random.Random(2035)
+        for _ in range(50):
+            board = random_board(rng, self.workers, range(5))
+            before = self._board_state(board)
+            states = []
+            for ply in range(rng.randint(1, 8)):
+                worker = self.workers[ply % len(self.workers)]
+                turns = [(m, b) for m, b in product(Direction, Direction)
+                         if rulechecker.can_move_build(board, worker, m, b)]
+                if not turns:
+                    break
+                states.append((self._board_state(board), board.zobrist_hash))
+                board.make_turn(worker, *rng.choice(turns))
+                self.assertEqual(board.zobrist_hash,
+                                 board.compute_zobrist_hash())
+            for state, hashed in reversed(states):
+                board.unmake_turn()
+                self.assertEqual(self._board_state(board), state)
+                self.assertEqual(board.zobrist_hash, hashed)
+            self.assertEqual(self._board_state(board), before)
+
+    def test_zobrist_hash_transposition(self):
+        """Test that the same position reached two ways has the same hash."""
+        board1 = Board(workers={self.workers[0]: (2, 2),
+                                self.workers[2]: (4, 4)})
+        board2 = board1.clone()
+        self.assertEqual(board1.zobrist_hash, board2.zobrist_hash)
+        board1.make_turn(self.workers[0], Direction.NORTH, Direction.SOUTH)
+        board1.make_turn(self.workers[2], Direction.WEST, Direction.NORTH)
+        board2.make_turn(self.workers[2], Direction.WEST, Direction.NORTH)
+        board2.make_turn(self.workers[0], Direction.NORTH, Direction.SOUTH)
+        self.assertEqual(board1.zobrist_hash, board2.zobrist_hash)
+        self.assertEqual(board1.zobrist_hash, board1.compute_zobrist_hash())
+
+    def test_zobrist_worker_keys_stable(self):
+        """Test that worker keys do not depend on the order workers are seen."""
+        board = Board(workers={self.workers[0]: (2, 2),
+                               self.workers[3]: (4, 4)})
+        hashed = board.zobrist_hash
+        for worker in self.workers:
+            worker._zobrist_keys = None
+        board = Board(workers={Worker(uuid.uuid4(), 1): (0, 0),
+                               self.workers[3]: (4, 4)})
+        board = Board(workers={self.workers[0]: (2, 2),
+                               self.workers[3]: (4, 4)})
+        self.assertEqual(board.zobrist_hash, hashed)
+
+    def test_zobrist_hash_changes(self):
+        """Test that heights, workers and the side to move change the hash."""
+        board = Board(workers={self.workers[0]: (2, 2)})
+        seen = {board.zobrist_hash}
+        board.build_floor(self.workers[0], Direction.EAST)
+        seen.add(board.zobrist_hash)
+        board.place_worker(self.workers[1], (0, 0))
+        seen.add(board.zobrist_hash)
+        board.move_worker(self.workers[1], Direction.EAST)
+        seen.add(board.zobrist_hash)
+        board.move_worker(self.workers[1], Direction.WEST)
+        seen.add(board.zobrist_hash)
+        self.assertEqual(len(seen), 4)
+        self.assertEqual(board.zobrist_hash, board.compute_zobrist_hash())
+        fresh = Board([[], [], [0, 0, 0, 1]], {self.workers[0]: (2, 2),
+                                               self.workers[1]: (0, 0)})
+        self.assertEqual(board.zobrist_hash, fresh.zobrist_hash)
+
+    def test_worker_at(self):
+        """Test looking up the worker on a position."""
+        board = Board(workers={self.workers[0]: (0, 0),
+                               self.workers[2]: (1, 1)})
+        self.assertEqual(board.worker_at((0, 0)), self.workers[0])
+        self.assertEqual(board.worker_at((1, 1)), self.workers[2])
+        self.assertIsNone(board.worker_at((0, 1)))
+        board.move_worker(self.workers[0], Direction.EAST)
+        self.assertIsNone(board.worker_at((0, 0)))
+        self.assertEqual(board.worker_at((0, 1)), self.workers[0])
+        board.make_turn(self.workers[2], Direction.SOUTH, Direction.NORTH)
+        board.unmake_turn()
+        self.assertEqual(board.worker_at((1, 1)), self.workers[2])
+        self.assertIsNone(board.worker_at((2, 1)))
+
+    def test_worker_at_shared_cell(self):
+        """Test the worker lookup when workers are placed on each other."""
+        board = Board(workers={self.workers[0]: (0, 0),
+                               self.workers[1]: (0, 0),
+                               self.workers[2]: (0, 0)})
+        self.assertEqual(board.worker_at((0, 0)), self.workers[2])
+        board.move_worker(self.workers[1], Direction.EAST)
+        self.assertEqual(board.worker_at((0, 0)), self.workers[2])
+        board.move_worker(self.workers[2], Direction.SOUTH)
+        self.assertEqual(board.worker_at((0, 0)), self.workers[0])
+        board.move_worker(self.workers[0], Direction.SOUTHEAST)
+        self.assertIsNone(board.worker_at((0, 0)))
+        self.assertFalse(board.is_occupied((0, 0)))
+
+    def test_workers_of(self):
+        """Test getting the workers of each player."""
+        board = Board()
+        board.place_worker(self.workers[2], (0, 0))
+        board.place_worker(self.workers[0], (1, 1))
+        board.place_worker(self.workers[3], (2, 2))
+        board.place_worker(self.workers[1], (3, 3))
+        self.assertEqual(board.workers_of(self.ids[0]),
+                         (self.workers[0], self.workers[1]))
+        self.assertEqual(board.workers_of(self.ids[1]),
+                         (self.workers[2], self.workers[3]))
+        self.assertEqual(board.workers_of("nobody"), ())
+        self.assertEqual(board.workers, (self.workers[2], self.workers[0],
+                                         self.workers[3], self.workers[1]))
+        board.move_worker(self.workers[0], Direction.EAST)
+        self.assertEqual(len(board.workers), 4)
+
+    def test_heights(self):
+        """Test getting every building height as a flat list."""
+        board = Board([[0, 1, 2], [], [4, 0, 0, 0, 0, 3]])
+        heights = board.heights()
+        self.assertEqual(len(heights), Board.BOARD_SIZE * Board.BOARD_SIZE)
+        self.assertEqual(heights[:3], [0, 1, 2])
+        self.assertEqual(heights[12], 4)
+        self.assertEqual(heights[17], 3)
+        self.assertEqual(sum(heights), 10)
+
+    def test_to_bytes(self):
+        """Test the binary encoding of a board."""
+        board = Board([[0, 1, 2, 3, 4]], {self.workers[0]: (0, 0),
+                                           self.workers[2]: (5, 5),
+                                           self.workers[1]: (0, 1),
+                                           self.workers[3]: (1, 0)})
+        data = board.to_bytes()
+        self.assertEqual(len(data), 23)
+        self.assertEqual(data[:3], bytes([0x10, 0x32, 0x04]))
+        self.assertEqual(data[18], 0x40)
+        self.assertEqual(data[19:], bytes([0x00, 0x80 | 35, 0x40 | 1,
+                                           0xC0 | 6]))
+        self.assertEqual(board.to_bytes(self.ids[::-1])[19], 0x80)
+
+    def test_from_bytes_round_trip(self):
+        """Test that decoding an encoded board gives back the same board."""
+        rng = random.Random(2355)
+        for _ in range(50):
+            board = random_board(rng, self.workers, range(5))
+            if rng.random() < 0.5:
+                board.move_worker(self.workers[0], Direction.STAY)
+            data = board.to_bytes(self.ids)
+            decoded = Board.from_bytes(memoryview(data), self.ids)
+            self.assertEqual(self._board_state(decoded),
+                             self._board_state(board))
+            self.assertEqual(decoded.zobrist_hash, board.zobrist_hash)
+            self.assertEqual(decoded.to_bytes(self.ids), data)
+
+    def test_bytes_errors(self):
+        """Test encoding and decoding boards that cannot be encoded."""
+        board = Board(workers={self.workers[0]: (0, 0),
+                               self.workers[2]: (1, 1),
+                               Worker("player3", 1): (2, 2)})
+        with self.assertRaises(ValueError):
+            board.to_bytes()
+        with self.assertRaises(ValueError):
+            board.to_bytes(self.ids)
+        data = Board(workers={self.workers[0]: (0, 0)}).to_bytes()
+        with self.assertRaises(ValueError):
+            Board.from_bytes(data[:-1], self.ids)
+        with self.assertRaises(ValueError):
+            Board.from_bytes(bytes([0x05]) + data[1:], self.ids)
+        with self.assertRaises(ValueError):
+            Board.from_bytes(data[:-1] + bytes([36]), self.ids)
+
+    def test_snapshot(self):
+        """Test that a snapshot keeps the position it was taken at."""
+        board = Board([[1, 2], [0, 3]],
+                      {self.workers[0]: (0, 0), self.workers[2]: (1, 1)})
+        state = board.snapshot()
+        self.assertIsInstance(state, BoardState)
+        self.assertIs(board.snapshot(), state)
+        self.assertEqual(self._board_state(state), self._board_state(board))
+        self.assertEqual(state.zobrist_hash, board.zobrist_hash)
+        before = self._board_state(state)
+        board.make_turn(self.workers[0], Direction.EAST, Direction.SOUTH)
+        self.assertIsNot(board.snapshot(), state)
+        self.assertEqual(self._board_state(state), before)
+        board.unmake_turn()
+        self.assertEqual(board.snapshot(), state)
+
+    def test_snapshot_immutable(self):
+        """Test that a snapshot cannot be changed."""
+        state = Board(workers={self.workers[0]: (0, 0)}).snapshot()
+        with self.assertRaises(AttributeError):
+            state._levels = [0, 0, 0, 0]
+        with self.assertRaises(AttributeError):
+            state.move_worker(self.workers[0], Direction.EAST)
+        with self.assertRaises(TypeError):
+            state._workers[self.workers[1]] = (1, 1)
+        self.assertIs(copy.deepcopy(state), state)
+        self.assertEqual(pickle.loads(pickle.dumps(state)), state)
+
+    def test_snapshot_as_key(self):
+        """Test that equal positions give equal snapshots."""
+        first = Board(workers={self.workers[0]: (0, 0),
+                               self.workers[2]: (0, 2)})
+        second = first.clone()
+        first.move_worker(self.workers[0], Direction.EAST)
+        first.move_worker(self.workers[2], Direction.SOUTH)
+        second.move_worker(self.workers[2], Direction.SOUTH)
+        second.move_worker(self.workers[0], Direction.EAST)
+        seen = {first.snapshot(): "first"}
+        self.assertEqual(seen[second.snapshot()], "first")
+        second.move_worker(self.workers[0], Direction.EAST)
+        self.assertNotIn(second.snapshot(), seen)
+
+    def test_snapshot_to_board(self):
+        """Test that a snapshot gives back a board that can be changed."""
+        board = Board([[1, 2], [0, 3]],
+                      {self.workers[0]: (0, 0), self.workers[2]: (1, 1)})
+        state = board.snapshot()
+        copied = state.to_board()
+        self.assertIsInstance(copied, Board)
+        self.assertEqual(self._board_state(copied), self._board_state(board))
+        self.assertEqual(copied.zobrist_hash, board.zobrist_hash)
+        copied.make_turn(self.workers[0], Direction.SOUTH, Direction.EAST)
+        self.assertEqual(self._board_state(state), self._board_state(board))
+        self.assertTrue(rulechecker.can_move_build(
+            state, self.workers[0], Direction.SOUTH, Direction.NORTH))
+
+    def _fresh_dumps(self, board, id_to_name):
+        """Return the Json dumps of a new board with the same position."""
+        fresh = Board([board.heights()[row * 6:(row + 1) * 6]
+                       for row in range(6)])
+        for worker in board.workers:
+            fresh.place_worker(worker, board.worker_position(worker))
+        return (fresh.dump_as_json(id_to_name),
+                fresh.dump_workers_as_json(id_to_name))
+
+    def test_dump_as_json_cached(self):
+        """Test that repeated dumps of a board give the same Json."""
+        board = Board([[1, 2, 2]], {self.workers[0]: (0, 0),
+                                    self.workers[2]: (2, 2)})
+        first = board.dump_as_json(self.uuids_to_name)
+        first[0][0] = "changed"
+        self.assertEqual(board.dump_as_json(self.uuids_to_name)[0][0],
+                         "1player11")
+        self.assertEqual(board.snapshot().dump_as_json(self.uuids_to_name),
+                         board.dump_as_json(self.uuids_to_name))
+        other_names = {self.ids[0]: "a", self.ids[1]: "b"}
+        self.assertEqual(board.dump_as_json(other_names)[0][0], "1a1")
+        self.assertEqual(board.dump_workers_as_json(other_names),
+                         [["a1", 0, 0], ["b1", 2, 2]])
+        self.assertEqual(board.dump_as_json_bytes(self.uuids_to_name),
+                         json.dumps(board.dump_as_json(
+                             self.uuids_to_name)).encode())
+
+    def test_dump_as_json_after_turns(self):
+        """Test that dumps follow the board through random turns."""
+        rng = random.Random(2024)
+        board = Board(workers={self.workers[0]: (0, 0),
+                               self.workers[1]: (5, 5),
+                               self.workers[2]: (0, 5),
+                               self.workers[3]: (5, 0)})
+        snapshots = []
+        for _ in range(200):
+            worker = rng.choice(self.workers)
+            turns = [(move_dir, build_dir)
+                     for move_dir, build_dir in product(Direction, repeat=2)
+                     if rulechecker.can_move_build(board, worker, move_dir,
+                                                   build_dir)]
+            if rng.random() < 0.3 and board._undo_stack:
+                board.unmake_turn()
+            elif turns:
+                board.make_turn(worker, *rng.choice(turns))
+            if rng.random() < 0.3:
+                snapshots.append((board.snapshot(),
+                                  self._fresh_dumps(board,
+                                                    self.uuids_to_name)))
+            self.assertEqual((board.dump_as_json(self.uuids_to_name),
+                              board.dump_workers_as_json(self.uuids_to_name)),
+                             self._fresh_dumps(board, self.uuids_to_name))
+        for state, dumps in snapshots:
+            self.assertEqual((state.dump_as_json(self.uuids_to_name),
+                              state.dump_workers_as_json(self.uuids_to_name)),
+                             dumps)
+
+    def test_dump_as_json_shared_cell(self):
+        """Test dumping workers that share a cell as they move apart."""
+        board = Board(workers={self.workers[0]: (0, 0),
+                               self.workers[1]: (0, 0)})
+        self.assertEqual(board.dump_as_json(self.uuids_to_name)[0][0],
+                         "0player11player12")
+        board.move_worker(self.workers[0], Direction.EAST)
+        tiles = board.dump_as_json(self.uuids_to_name)
+        self.assertEqual(tiles[0][:2], ["0player12", "0player11"])
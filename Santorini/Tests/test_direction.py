@@ -3,7 +3,7 @@ import unittest
 import sys
 import os
 sys.path.append(os.path.join(os.path.dirname(__file__), "../.."))
-from Santorini.Common.pieces import Direction
+from Santorini.Common.pieces import Direction, CELLS, NEIGHBORS, MOVE_BUILDS
 
 
 class TestDirection(unittest.TestCase):
@@ -98,3 +98,37 @@ class TestDirection(unittest.TestCase):
         """Test string stay"""
         dir_str = Direction.STAY.string_values()
         self.assertEqual(dir_str, ["PUT", "PUT"])
+
+    def test_move_pos_off_board(self):
+        """Testing moving from a position that is not on the board."""
+        self.assertEqual(Direction.move_position((-1, 7), Direction.SOUTHWEST),
+                         (0, 6))
+        self.assertEqual(Direction.move_position([2, 2], Direction.NORTH),
+                         (1, 2))
+
+    def test_neighbors_corner(self):
+        """Test the neighbour table for a corner of the board."""
+        self.assertEqual(NEIGHBORS[(0, 0)],
+                         ((Direction.SOUTH, (1, 0)),
+                          (Direction.SOUTHEAST, (1, 1)),
+                          (Direction.EAST, (0, 1))))
+
+    def test_neighbors_match_directions(self):
+        """Test the neighbour table against moving in every direction."""
+        for pos in CELLS:
+            expected = [(direction, Direction.move_position(pos, direction))
+                        for direction in Direction
+                        if direction is not Direction.STAY]
+            expected = [(direction, (row, col))
+                        for direction, (row, col) in expected
+                        if 0 <= row < 6 and 0 <= col < 6]
+            self.assertEqual(list(NEIGHBORS[pos]), expected)
+
+    def test_move_builds(self):
+        """Test the move+build table against the neighbour table."""
+        self.assertEqual(len(MOVE_BUILDS[(0, 0)]), 5 + 8 + 5)
+        self.assertEqual(len(MOVE_BUILDS[(2, 2)]), 8 * 8)
+        for pos in CELLS:
+            for move_dir, build_dir, moved_pos, build_pos in MOVE_BUILDS[pos]:
+                self.assertIn((move_dir, moved_pos), NEIGHBORS[pos])
+                self.assertIn((build_dir, build_pos), NEIGHBORS[moved_pos])
@@ -0,0 +1,54 @@
+"""Unit tests for the JSON echo Library."""
+import unittest
+import sys
+import os
+import io
+import json
+sys.path.append(os.path.join(os.path.dirname(__file__), "../.."))
+from Santorini.Lib import echo
+
+VALUES = [[["0a1", 1], [0, "2b1"]], ["move", "a1", ["EAST", "PUT"]], 12345,
+          "text", True, None, {"key": [1.5, -2]}, 7]
+
+
+class TestEcho(unittest.TestCase):
+    """JSON echo tests."""
+
+    def setUp(self):
+        self.text = " \n".join(json.dumps(value) for value in VALUES) + "\n"
+
+    def test_json_echo(self):
+        """All of the values of a string are parsed."""
+        self.assertEqual(echo.json_echo(self.text), VALUES)
+        self.assertEqual(echo.json_echo("  "), [])
+        with self.assertRaises(json.decoder.JSONDecodeError):
+            echo.json_echo('[1, 2] ["move"')
+
+    def test_iter_json_chunks(self):
+        """Values split across reads, even inside numbers, are parsed."""
+        for chunk_size in (1, 2, 3, 7, 1 << 16):
+            stream = io.BytesIO(self.text.encode())
+            self.assertEqual(list(echo.iter_json(stream,
+                                                 chunk_size=chunk_size)),
+                             VALUES)
+            stream = io.StringIO(self.text)
+            self.assertEqual(list(echo.iter_json(stream,
+                                                 chunk_size=chunk_size)),
+                             VALUES)
+
+    def test_iter_json_as_read(self):
+        """A value is yielded before the rest of the stream is read."""
+        reads = []
+        stream = io.BytesIO(b'["a"] ["b"]')
+        values = echo.iter_json(stream, lambda: reads.append(stream.tell()),
+                                chunk_size=6)
+        self.assertEqual(next(values), ["a"])
+        self.assertEqual(reads, [0])
+        self.assertEqual(list(values), [["b"]])
+
+    def test_iter_json_invalid(self):
+        """Invalid or unfinished JSON raises an error."""
+        with self.assertRaises(json.decoder.JSONDecodeError):
+            list(echo.iter_json(io.BytesIO(b'[1] ["move"')))
+        with self.assertRaises(json.decoder.JSONDecodeError):
+            list(echo.iter_json(io.BytesIO(b'[1] ]')))
@@ -0,0 +1,80 @@
+"""Unit tests for the Evaluator Component."""
+import unittest
+import sys
+import os
+import pickle
+sys.path.append(os.path.join(os.path.dirname(__file__), "../.."))
+from Santorini.Player.evaluation import Evaluator
+from Santorini.Common.pieces import Board, Worker, Direction
+
+
+class TestEvaluator(unittest.TestCase):
+    """Test the static position evaluator."""
+
+    def setUp(self):
+        self.workers = [Worker("p1", 1),
+                        Worker("p1", 2),
+                        Worker("p2", 1),
+                        Worker("p2", 2)]
+        self.board = Board([[2, 3, 4, 0],
+                            [1, 2, 0, 0],
+                            [0, 0, 0, 0],
+                            [0, 0, 0, 0, 0, 1]],
+                           workers={self.workers[0]: (1, 1),
+                                    self.workers[1]: (5, 5),
+                                    self.workers[2]: (0, 0),
+                                    self.workers[3]: (3, 3)})
+        self.evaluator = Evaluator()
+
+    def test_features(self):
+        """Heights, reachable cells, mobility, domes and threats."""
+        features = self.evaluator.features(self.board)
+        # p1: (1, 1) at 2 reaches (0, 1) at 3, domes (0, 2), (0, 0) is taken;
+        # (5, 5) at 0 moves onto its three neighbours
+        self.assertEqual(features["p1"], (2, 0, 1, 9, 1, 1))
+        # p2: (0, 0) at 2 reaches (0, 1) at 3 and (1, 0) at 1, (1, 1) is
+        # taken; (3, 3) at 0 moves anywhere around it
+        self.assertEqual(features["p2"], (2, 0, 1, 10, 0, 1))
+
+    def test_score(self):
+        """The score is the weighted difference of the features."""
+        weights = Evaluator.DEFAULT_WEIGHTS
+        self.assertEqual(self.evaluator(self.board, "p1", "p2"),
+                         -weights["mobility"] + weights["domes"])
+        self.assertEqual(self.evaluator(self.board, "p2", "p1"),
+                         -self.evaluator(self.board, "p1", "p2"))
+        evaluator = Evaluator({"mobility": 0, "domes": 10})
+        self.assertEqual(evaluator(self.board, "p1", "p2"), 10)
+        with self.assertRaises(ValueError):
+            Evaluator({"tallness": 1})
+        with self.assertRaises(ValueError):
+            Evaluator(cache_size=0)
+
+    def test_cache(self):
+        """Features are kept by position hash, the least recently used
+        position is dropped first."""
+        evaluator = Evaluator(cache_size=2)
+        first = evaluator.features(self.board)
+        self.assertIs(evaluator.features(self.board), first)
+        self.assertEqual((evaluator.hits, evaluator.misses), (1, 1))
+        self.board.make_turn(self.workers[1], Direction.NORTH,
+                             Direction.NORTH)
+        moved = evaluator.features(self.board)
+        self.assertNotEqual(moved["p1"], first["p1"])
+        self.board.make_turn(self.workers[3], Direction.WEST, Direction.WEST)
+        evaluator.features(self.board)
+        self.board.unmake_turn()
+        self.board.unmake_turn()
+        self.assertEqual(len(evaluator._cache), 2)
+        again = evaluator.features(self.board)
+        self.assertIsNot(again, first)
+        self.assertEqual(again, first)
+        evaluator.clear()
+        self.assertEqual((evaluator.hits, evaluator.misses), (0, 0))
+
+    def test_pickle(self):
+        """An evaluator is sent to another process without its cache."""
+        self.evaluator.features(self.board)
+        copy = pickle.loads(pickle.dumps(self.evaluator))
+        self.assertEqual(copy.weights, self.evaluator.weights)
+        self.assertEqual(len(copy._cache), 0)
@@ -0,0 +1,89 @@
+"""Unit tests for the MCTSStrategy Component."""
+import unittest
+import sys
+import os
+import random
+sys.path.append(os.path.join(os.path.dirname(__file__), "../.."))
+from Santorini.Player.mcts_strat import MCTSStrategy
+from Santorini.Player.alphabeta_strat import AlphaBetaStrategy
+from Santorini.Common.pieces import Board, Worker, Direction
+from Santorini.Tests.player_mocks import random_board
+from Santorini.Common import rulechecker
+
+
+class TestMCTSStrategy(unittest.TestCase):
+    """Test the Monte Carlo tree search turn strategy."""
+
+    def setUp(self):
+        self.workers = [Worker("p1", 1),
+                        Worker("p1", 2),
+                        Worker("p2", 1),
+                        Worker("p2", 2)]
+        self.board = random_board(random.Random(4), self.workers)
+
+    def test_plan_turn_wins(self):
+        """A worker next to a level 3 building climbs it without building."""
+        board = Board([[2, 3]],
+                      workers={self.workers[i]: (i, i)
+                               for i in range(len(self.workers))})
+        self.assertEqual(MCTSStrategy(50, seed=1).plan_turn(self.workers[0:2],
+                                                            board),
+                         (self.workers[0], Direction.EAST, None))
+
+    def test_plan_turn_blocks(self):
+        """The opponent's winning climb is domed."""
+        board = Board([[0, 3, 2], [0, 0, 0]],
+                      workers={self.workers[0]: (1, 0),
+                               self.workers[1]: (5, 0),
+                               self.workers[2]: (0, 2),
+                               self.workers[3]: (5, 5)})
+        turn = MCTSStrategy(50, seed=1).plan_turn(self.workers[0:2], board)
+        board.make_turn(*turn)
+        self.assertIsNone(AlphaBetaStrategy.winning_turn(board, "p2"))
+
+    def test_plan_turn_no_turns(self):
+        """A player that cannot move gets the no request."""
+        board = Board([[0, 2], [2, 2]],
+                      workers={self.workers[0]: (0, 0),
+                               self.workers[2]: (5, 5)})
+        self.assertEqual(MCTSStrategy(50).plan_turn(self.workers[0:1], board),
+                         (None, None, None))
+
+    def test_plan_turn(self):
+        """The turn is legal, the board is left as it was, and the same seed
+        plans the same turn."""
+        before = self.board.snapshot()
+        strat = MCTSStrategy(300, seed=9)
+        turn = strat.plan_turn(self.workers[0:2], self.board)
+        self.assertEqual(strat.played, 300)
+        self.assertEqual(self.board.snapshot(), before)
+        self.assertTrue(rulechecker.can_move_build(self.board, *turn))
+        self.assertEqual(MCTSStrategy(300, seed=9).plan_turn(self.workers[0:2],
+                                                             before),
+                         turn)
+
+    def test_playout(self):
+        """A playout ends the game and restores the board."""
+        before = self.board.snapshot()
+        strat = MCTSStrategy(seed=2)
+        winners = {strat.playout(self.board, "p1", "p2") for _ in range(50)}
+        self.assertEqual(self.board.snapshot(), before)
+        self.assertLessEqual(winners, {"p1", "p2", None})
+        self.assertIn("p1", winners)
+
+    def test_random_turn(self):
+        """Random turns are legal move+builds."""
+        strat = MCTSStrategy(seed=3)
+        for _ in range(100):
+            turn = strat.random_turn(self.board, "p2")
+            self.assertIsNotNone(turn[2])
+            self.assertTrue(rulechecker.can_move_build(self.board, *turn))
+
+    def test_time_budget(self):
+        """With a time budget, playouts run until the time is up."""
+        strat = MCTSStrategy(time_budget=0.2, seed=5)
+        turn = strat.plan_turn(self.workers[0:2], self.board)
+        self.assertTrue(rulechecker.can_move_build(self.board, *turn))
+        self.assertGreaterEqual(strat.played, MCTSStrategy.CLOCK_PLAYOUTS)
+        with self.assertRaises(ValueError):
+            MCTSStrategy(time_fraction=0)
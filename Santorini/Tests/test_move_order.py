@@ -0,0 +1,149 @@
+"""Unit tests for the MoveOrder Components."""
+import unittest
+import sys
+import os
+import pickle
+import random
+sys.path.append(os.path.join(os.path.dirname(__file__), "../.."))
+from Santorini.Player.move_order import MoveOrder, HeuristicOrder
+from Santorini.Player.alphabeta_strat import AlphaBetaStrategy, height_evaluator
+from Santorini.Common.pieces import Board, Worker, Direction
+from Santorini.Tests.player_mocks import random_board
+from Santorini.Common import rulechecker
+
+
+class TestHeuristicOrder(unittest.TestCase):
+    """Test the order of wins, climbs, killers and history."""
+
+    def setUp(self):
+        self.workers = [Worker("p1", 1),
+                        Worker("p1", 2),
+                        Worker("p2", 1),
+                        Worker("p2", 2)]
+        self.board = Board([[1, 3, 0, 0],
+                            [2, 0, 0, 0],
+                            [0, 0, 0, 0]],
+                           workers={self.workers[0]: (0, 0),
+                                    self.workers[1]: (5, 5),
+                                    self.workers[2]: (3, 3),
+                                    self.workers[3]: (4, 0)})
+        self.order = HeuristicOrder()
+        self.turns = AlphaBetaStrategy.search_turns(self.board, "p1")
+
+    def level(self, turns):
+        """Return the turns of the worker on the ground, which all stay
+        level, in order."""
+        return [turn for turn in turns if turn[0] == self.workers[1]]
+
+    def test_wins_and_climbs_first(self):
+        """The winning climb comes first, then the climbs, then the rest."""
+        board = Board([[2, 3, 0], [1, 0, 0]],
+                      workers={self.workers[0]: (0, 0),
+                               self.workers[1]: (5, 5),
+                               self.workers[2]: (3, 3),
+                               self.workers[3]: (4, 0)})
+        turns = [turn for turn in rulechecker.legal_turns(board, "p1")
+                 if turn[2] is not None]
+        ordered = self.order.order(board, turns, 0)
+        self.assertEqual(ordered[0][:2], (self.workers[0], Direction.EAST))
+
+        ordered = self.order.order(self.board, self.turns, 0)
+        climbs = [turn for turn in self.turns
+                  if turn[0] == self.workers[0] and turn[1] == Direction.SOUTH]
+        self.assertTrue(climbs)
+        self.assertEqual(ordered[:len(climbs)], climbs)
+        # the turns that do not climb keep their order, descents included
+        self.assertEqual(ordered[len(climbs):],
+                         [turn for turn in self.turns if turn not in climbs])
+
+    def test_killers(self):
+        """The turns that cut off at a ply come first among the turns that
+        do not climb, the most recent first, and only at that ply."""
+        order = HeuristicOrder(history=False)
+        plain = order.order(self.board, self.turns, 2)
+        first, second, third = self.level(plain)[-3:][::-1]
+        order.cutoff(self.board, first, 2, 0)
+        order.cutoff(self.board, second, 2, 0)
+        ordered = order.order(self.board, self.turns, 2)
+        self.assertEqual(self.level(ordered)[:2], [second, first])
+        # climbs still come first
+        self.assertEqual(ordered[0][1], Direction.SOUTH)
+        self.assertEqual(order.order(self.board, self.turns, 1), plain)
+        # only KILLERS turns are kept
+        order.cutoff(self.board, third, 2, 0)
+        ordered = order.order(self.board, self.turns, 2)
+        self.assertEqual(self.level(ordered)[:2], [third, second])
+        self.assertEqual(self.level(ordered)[-1], first)
+
+    def test_killer_descent(self):
+        """A killer that descends comes before the moves that stay level,
+        right after the climbs."""
+        order = HeuristicOrder(history=False)
+        descent = next(turn for turn in self.turns
+                       if turn[:2] == (self.workers[0], Direction.SOUTHEAST))
+        order.cutoff(self.board, descent, 0, 0)
+        ordered = order.order(self.board, self.turns, 0)
+        climbs = [turn for turn in self.turns
+                  if turn[:2] == (self.workers[0], Direction.SOUTH)]
+        self.assertEqual(ordered[:len(climbs)], climbs)
+        self.assertEqual(ordered[len(climbs)], descent)
+        self.assertEqual(ordered[len(climbs) + 1:],
+                         [turn for turn in self.turns
+                          if turn not in climbs and turn != descent])
+
+    def test_history(self):
+        """Turns that cut off deeper and more often come earlier, at every
+        ply."""
+        order = HeuristicOrder(killers=False)
+        plain = self.level(order.order(self.board, self.turns, 0))
+        shallow, deep = plain[-1], plain[-2]
+        order.cutoff(self.board, shallow, 1, 0)
+        order.cutoff(self.board, shallow, 3, 0)
+        order.cutoff(self.board, deep, 2, 2)
+        ordered = order.order(self.board, self.turns, 5)
+        self.assertEqual(self.level(ordered)[:2], [deep, shallow])
+
+    def test_off(self):
+        """Without killers and history, cutoffs change nothing."""
+        order = HeuristicOrder(killers=False, history=False)
+        plain = order.order(self.board, self.turns, 0)
+        order.cutoff(self.board, plain[-1], 0, 3)
+        self.assertEqual(order.order(self.board, self.turns, 0), plain)
+
+    def test_reset(self):
+        """Reset forgets the killers and the history."""
+        plain = self.order.order(self.board, self.turns, 0)
+        self.order.cutoff(self.board, plain[-1], 0, 3)
+        self.assertNotEqual(self.order.order(self.board, self.turns, 0), plain)
+        self.order.reset()
+        self.assertEqual(self.order.order(self.board, self.turns, 0), plain)
+
+    def test_pickle(self):
+        """A pickled order keeps its settings but not what it learned."""
+        self.order.cutoff(self.board, self.turns[-1], 0, 3)
+        order = pickle.loads(pickle.dumps(HeuristicOrder(history=False)))
+        self.assertFalse(order.history)
+        self.assertTrue(order.killers)
+        order = pickle.loads(pickle.dumps(self.order))
+        self.assertEqual(order.order(self.board, self.turns, 0),
+                         HeuristicOrder().order(self.board, self.turns, 0))
+
+    def test_same_score_fewer_nodes(self):
+        """The search finds the same scores as with the order of
+        legal_turns, searching fewer nodes in all."""
+        rng = random.Random(23)
+        nodes = {MoveOrder: 0, HeuristicOrder: 0}
+        for _ in range(4):
+            board = random_board(rng, self.workers, (0, 0, 1, 1, 2, 3))
+            scores = set()
+            for order in nodes:
+                strat = AlphaBetaStrategy(3, height_evaluator, order())
+                strat.plan_turn(self.workers[0:2], board)
+                scores.add(strat.score)
+                nodes[order] += strat.nodes
+            self.assertEqual(len(scores), 1)
+        self.assertLess(nodes[HeuristicOrder], nodes[MoveOrder])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,103 @@
+"""Unit tests for the ParallelAlphaBetaStrategy Component."""
+import unittest
+import sys
+import os
+import random
+from unittest import mock
+import uuid
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+sys.path.append(os.path.join(os.path.dirname(__file__), "../.."))
+from Santorini.Player.alphabeta_strat import AlphaBetaStrategy
+from Santorini.Player.parallel_strat import ParallelAlphaBetaStrategy
+from Santorini.Player.transposition import TranspositionTable
+from Santorini.Player.player import Player
+from Santorini.Player.tree_strat import TreeStrategy
+from Santorini.Admin.referee import Referee
+from Santorini.Admin.observermanager import ObserverManager
+from Santorini.Common.player_guard import PlayerGuard
+from Santorini.Common.pieces import Worker
+from Santorini.Tests.player_mocks import random_board
+from Santorini.Common import rulechecker
+
+
+class TestParallelAlphaBetaStrategy(unittest.TestCase):
+    """Test the parallel alpha-beta turn strategy against the serial one."""
+
+    def setUp(self):
+        self.workers = [Worker("p1", 1),
+                        Worker("p1", 2),
+                        Worker("p2", 1),
+                        Worker("p2", 2)]
+        rng = random.Random(31)
+        self.boards = [random_board(rng, self.workers) for _ in range(4)]
+        self.parallel = ParallelAlphaBetaStrategy(3, processes=2)
+
+    def tearDown(self):
+        self.parallel.close()
+
+    def test_matches_serial(self):
+        """The parallel search plays the turn of the serial one."""
+        serial = AlphaBetaStrategy(3)
+        for board in self.boards:
+            turn = self.parallel.plan_turn(self.workers[0:2], board.snapshot())
+            self.assertEqual(turn, serial.plan_turn(self.workers[0:2], board))
+            self.assertEqual(self.parallel.score, serial.score)
+            self.assertTrue(rulechecker.can_move_build(board, *turn))
+
+    def test_matches_serial_with_table(self):
+        """With transposition tables, the turns are still the same."""
+        serial = AlphaBetaStrategy(3, table=TranspositionTable(1 << 20))
+        self.parallel.table = TranspositionTable(1 << 20)
+        for board in self.boards:
+            turn = self.parallel.plan_turn(self.workers[0:2], board)
+            self.assertEqual(turn, serial.plan_turn(self.workers[0:2], board))
+            self.assertEqual(self.parallel.score, serial.score)
+
+    def test_table_memory_split(self):
+        """The processes' tables share the memory of the strategy's table."""
+        self.parallel.table = TranspositionTable(1 << 20)
+        self.parallel._pool = ThreadPoolExecutor(2)
+        memory = []
+
+        def search_turns(data, depth, turns, alpha, seconds, evaluator,
+                         move_order, process_memory):
+            memory.append(process_memory)
+            return [alpha] * len(turns), 0
+
+        board = self.boards[0]
+        turns = self.parallel.search_turns(board, "p1")
+        with mock.patch("Santorini.Player.parallel_strat._search_turns",
+                        search_turns):
+            self.parallel._split(board, "p1", "p2", 3, turns, 0)
+        self.assertEqual(memory, [1 << 19, 1 << 19])
+
+    def test_end_of_game(self):
+        """A Player shuts the search processes down when the game is over."""
+        pools = []
+
+        def make_pool(processes):
+            pools.append(ProcessPoolExecutor(processes))
+            return pools[-1]
+
+        ids = [uuid.uuid4(), uuid.uuid4()]
+        self.parallel.depth = 2
+        referee = Referee({ids[0]: PlayerGuard(Player(self.parallel)),
+                           ids[1]: PlayerGuard(Player(TreeStrategy(1)))},
+                          {ids[0]: "p1", ids[1]: "p2"}, ObserverManager())
+        with mock.patch("Santorini.Player.parallel_strat.ProcessPoolExecutor",
+                        make_pool):
+            bad_players, winners = referee.run_game()
+        self.assertEqual(bad_players, [])
+        self.assertEqual(len(pools), 1)
+        self.assertIsNone(self.parallel._pool)
+        with self.assertRaises(RuntimeError):
+            pools[0].submit(abs, 0)
+
+    def test_time_budget(self):
+        """A time budgeted parallel search plays a legal turn."""
+        self.parallel.depth = 64
+        self.parallel.time_budget = 0.6
+        board = self.boards[0]
+        turn = self.parallel.plan_turn(self.workers[0:2], board)
+        self.assertTrue(rulechecker.can_move_build(board, *turn))
+        self.assertGreaterEqual(self.parallel.completed_depth, 1)
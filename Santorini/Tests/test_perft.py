@@ -0,0 +1,45 @@
+"""Unit tests for the perft tool."""
+import unittest
+import sys
+import os
+import json
+sys.path.append(os.path.join(os.path.dirname(__file__), "../.."))
+from Santorini.Benchmarks import perft
+from Santorini.Common import rulechecker
+
+
+class TestPerft(unittest.TestCase):
+    """Perft tests on the perft corpus."""
+
+    def setUp(self):
+        with open(perft.CORPUS) as corpus_file:
+            self.corpus = json.load(corpus_file)
+
+    def test_parse_board(self):
+        """The JSON board format gives the heights and the workers."""
+        board = perft.parse_board([["0a1", 1], [0, "2b1"]])
+        self.assertEqual(board.heights()[:8], [0, 1, 0, 0, 0, 0, 0, 2])
+        self.assertEqual([(w.player, w.number, board.worker_position(w))
+                          for w in board.workers],
+                         [("a", 1, (0, 0)), ("b", 1, (1, 1))])
+
+    def test_depth_one(self):
+        """One turn deep there is a leaf per legal turn."""
+        for cells, player, _, _ in self.corpus:
+            board = perft.parse_board(cells)
+            self.assertEqual(
+                perft.timed_perft(board, player, 1)[0],
+                len(list(rulechecker.legal_turns(board, player))))
+
+    def test_corpus(self):
+        """The shallow positions of the corpus have the expected counts,
+        with every node checked against can_move_build."""
+        for cells, player, depth, expected in self.corpus:
+            if depth > 2:
+                continue
+            board = perft.parse_board(cells)
+            before = board.to_bytes()
+            self.assertEqual(perft.timed_perft(board, player, depth,
+                                               perft.checked_turns)[0],
+                             expected)
+            self.assertEqual(board.to_bytes(), before)
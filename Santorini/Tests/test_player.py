@@ -0,0 +1,120 @@
+"""Unit tests for the Player Component."""
+import unittest
+import sys
+import os
+import uuid
+sys.path.append(os.path.join(os.path.dirname(__file__), "../.."))
+from Santorini.Player.player import Player
+from Santorini.Player.alphabeta_strat import AlphaBetaStrategy, height_evaluator
+from Santorini.Player.transposition import TranspositionTable
+from Santorini.Player.tree_strat import TreeStrategy
+from Santorini.Admin.referee import Referee
+from Santorini.Admin.observermanager import ObserverManager
+from Santorini.Common.player_guard import PlayerGuard
+from Santorini.Common.pieces import Board
+from Santorini.Common import rulechecker
+
+
+class PonderCount(AlphaBetaStrategy):
+    """An AlphaBetaStrategy that adds up the nodes of all its ponders."""
+
+    pondered = 0
+
+    def ponder(self, board, turn, stop):
+        super().ponder(board, turn, stop)
+        self.pondered += self.ponder_nodes
+
+
+class TestPlayer(unittest.TestCase):
+    """Test the Player and its pondering."""
+
+    def place(self, players):
+        """Place the workers of the players and return the board."""
+        board = Board()
+        for number, player in enumerate(players, 1):
+            player.set_id("p{}".format(number))
+            player.start_of_game()
+        for _ in (1, 2):
+            for player in players:
+                board.place_worker(*player.place_worker(board.snapshot()))
+        return board
+
+    def strategy(self):
+        return AlphaBetaStrategy(2, height_evaluator,
+                                 table=TranspositionTable(1 << 20))
+
+    def test_play(self):
+        """A player places its workers and plays legal turns."""
+        players = [Player(self.strategy()), Player(TreeStrategy(1))]
+        board = self.place(players)
+        self.assertEqual([worker.player for worker in players[0].workers],
+                         ["p1"] * 2)
+        for index in (0, 1, 0):
+            turn = players[index].play_turn(board.snapshot())
+            self.assertTrue(rulechecker.can_move_build(board, *turn))
+            board.make_turn(*turn)
+        self.assertIsNone(players[0]._ponder_thread)
+        # a new game starts with new workers
+        self.place(players)
+        self.assertEqual([worker.number for worker in players[0].workers], [1, 2])
+
+    def test_ponder(self):
+        """A pondering player thinks until its next turn or the end of the
+        game."""
+        players = [Player(self.strategy(), ponder=True),
+                   Player(self.strategy())]
+        board = self.place(players)
+        turn = players[0].play_turn(board.snapshot())
+        thread = players[0]._ponder_thread
+        self.assertIsNotNone(thread)
+        board.make_turn(*turn)
+        reply = players[1].play_turn(board.snapshot())
+        board.make_turn(*reply)
+        players[0]._stop_pondering()
+        self.assertFalse(thread.is_alive())
+        self.assertGreater(players[0].strategy.turn_strat.ponder_nodes, 0)
+        turn = players[0].play_turn(board.snapshot())
+        self.assertTrue(rulechecker.can_move_build(board, *turn))
+        # the next turn stops the pondering before planning
+        thread = players[0]._ponder_thread
+        board.make_turn(*turn)
+        board.make_turn(*players[1].play_turn(board.snapshot()))
+        turn = players[0].play_turn(board.snapshot())
+        self.assertFalse(thread.is_alive())
+        self.assertTrue(rulechecker.can_move_build(board, *turn))
+        thread = players[0]._ponder_thread
+        players[0].end_of_game("p1")
+        self.assertFalse(thread.is_alive())
+        self.assertIsNone(players[0]._ponder_thread)
+
+    def test_ponder_tree_strategy(self):
+        """A strategy that does not ponder returns right away."""
+        players = [Player(TreeStrategy(1), ponder=True),
+                   Player(TreeStrategy(1))]
+        board = self.place(players)
+        players[0].play_turn(board.snapshot())
+        players[0]._ponder_thread.join(5)
+        self.assertFalse(players[0]._ponder_thread.is_alive())
+        players[0].end_of_game("p1")
+
+    def test_refereed_game(self):
+        """A pondering player plays a whole game through the referee."""
+        ids = [uuid.uuid4(), uuid.uuid4()]
+        strategy = PonderCount(2, height_evaluator,
+                               table=TranspositionTable(1 << 20))
+        players = [Player(strategy, ponder=True), Player(TreeStrategy(1))]
+        referee = Referee({ids[0]: PlayerGuard(players[0]),
+                           ids[1]: PlayerGuard(players[1])},
+                          {ids[0]: "p1", ids[1]: "p2"}, ObserverManager())
+        bad_players, winners = referee.run_game()
+        self.assertEqual(bad_players, [])
+        self.assertEqual(len(winners), 1)
+        self.assertIn(winners[0], ids)
+        self.assertEqual([worker.player for worker in players[0].workers],
+                         [ids[0]] * 2)
+        self.assertIsNone(players[0]._ponder_thread)
+        self.assertGreater(strategy.pondered, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -14,6 +14,10 @@ from Santorini.Common.player_guard import PlayerGuard
 from Santorini.Tests.player_mocks import *
 import uuid
 import time
+import random
+import itertools
+from Santorini.Common import rulechecker
+from Santorini.Common.pieces import Board, Worker, Direction
 
 
 class TestReferee(unittest.TestCase):
@@ -308,6 +312,64 @@ class TestReferee(unittest.TestCase):
         for actual, expected in zip(game_results, expected_game_results):
             self.assertEqual(actual, expected)
 
+    def test_update_mobility(self):
+        """test that the mobility kept from the last turns gives the same
+        game over and winner as checking every worker again
+        """
+        ref = Referee({}, self.uuids_to_name, self.obs_man)
+        ref._reset_board()
+        rng = random.Random(1300)
+        workers = [Worker(uuid, num) for num in (1, 2)
+                   for uuid in (self.uuidp1, self.uuidp2)]
+        cells = rng.sample(list(itertools.product(range(6), range(6))), 4)
+        for worker, cell in zip(workers, cells):
+            player = mock.MagicMock()
+            player.place_worker = mock.MagicMock(return_value=(worker, cell))
+            self.assertIs(ref._place_worker(player), PlayerResult.OK)
+        for turn in range(300):
+            player = (self.uuidp1, self.uuidp2)[turn % 2]
+            turns = list(rulechecker.legal_turns(ref.board, player))
+            if not turns:
+                break
+            ref._do_move(*rng.choice(turns))
+            mobility = ref._update_mobility()
+            self.assertEqual(mobility, {
+                worker: rulechecker.can_move(ref.board, worker)
+                for worker in ref.board.workers})
+            player_workers = ref.board.workers_of(player)
+            self.assertEqual(
+                rulechecker.is_game_over(ref.board, player_workers, mobility),
+                rulechecker.is_game_over(ref.board, player_workers))
+            self.assertEqual(rulechecker.get_winner(ref.board, mobility),
+                             rulechecker.get_winner(ref.board))
+        self.assertGreater(turn, 20)
+
+    def test_game_won_by_climb(self):
+        """test that the referee ends a game when a worker climbs onto a
+        building of height 3, from the mobility kept over the turns
+        """
+        ref = Referee({}, self.uuids_to_name, self.obs_man)
+        ref._reset_board()
+        ref.board = Board([[2, 3]])
+        placements = {self.uuidp1: [(0, 0), (5, 0)],
+                      self.uuidp2: [(5, 5), (0, 5)]}
+        for uuid_ in (self.uuidp1, self.uuidp2):
+            player = mock.MagicMock()
+            player.place_worker = mock.MagicMock(side_effect=[
+                (Worker(uuid_, num + 1), cell)
+                for num, cell in enumerate(placements[uuid_])])
+            ref.uuids_to_player[uuid_] = player
+        ref.uuids_to_player[self.uuidp1].play_turn = mock.MagicMock(
+            return_value=(Worker(self.uuidp1, 1), Direction.EAST, None))
+
+        result = ref._play_game([self.uuidp1, self.uuidp2])
+
+        self.assertEqual(result, (PlayerResult.OK, self.uuidp1))
+        ref.uuids_to_player[self.uuidp2].play_turn.assert_not_called()
+        self.assertEqual(ref._changed_positions, [])
+        self.assertEqual(ref._determine_winner_result(result),
+                         (self.uuidp1, []))
+
 
 class testRefereeExceptionsTimeout(unittest.TestCase):
     """class that rests the referee when the player
@@ -3,9 +3,12 @@ import unittest
 import sys
 import os
 import copy
+import random
+from itertools import product
 sys.path.append(os.path.join(os.path.dirname(__file__), "../.."))
 from Santorini.Common import rulechecker
 from Santorini.Common.pieces import Board, Worker, Direction
+from Santorini.Tests.player_mocks import random_board
 
 
 class TestRulechecker(unittest.TestCase):
@@ -287,3 +290,136 @@ class TestRulechecker(unittest.TestCase):
                                self.workers[2]: (0, 1),
                                self.workers[3]: (0, 3)})
         self.assertEqual(rulechecker.get_winner(board), "player2")
+
+    def _reference_turns(self, board, player):
+        """Return the turns can_move_build accepts for a player."""
+        return [(worker, move_dir, build_dir)
+                for worker in board.workers_of(player)
+                for move_dir, build_dir in product(Direction,
+                                                   [None] + list(Direction))
+                if rulechecker.can_move_build(board, worker, move_dir,
+                                              build_dir)]
+
+    def test_legal_turns(self):
+        """Legal turns of the workers on the diagonal."""
+        turns = list(rulechecker.legal_turns(self.board, "player1"))
+        self.assertEqual(set(turns),
+                         set(self._reference_turns(self.board, "player1")))
+        self.assertEqual(len(turns), len(set(turns)))
+        self.assertIn((self.workers[0], Direction.EAST, Direction.WEST),
+                      turns)
+        self.assertNotIn((self.workers[1], Direction.SOUTHEAST, None), turns)
+        self.assertEqual(list(rulechecker.legal_turns(self.board, "nobody")),
+                         [])
+
+    def test_legal_turns_random(self):
+        """Legal turns match can_move_build on random positions."""
+        rng = random.Random(1011)
+        for _ in range(150):
+            board = random_board(rng, self.workers, (0, 0, 1, 2, 3, 4))
+            if rng.random() < 0.2:
+                board.place_worker(Worker("player3", 1),
+                                   board.worker_position(self.workers[0]))
+            for player in ("player1", "player2"):
+                turns = list(rulechecker.legal_turns(board, player))
+                self.assertEqual(sorted(turns, key=str), sorted(
+                    self._reference_turns(board, player), key=str))
+                snapshot_turns = list(rulechecker.legal_turns(
+                    board.snapshot(), player))
+                self.assertEqual(snapshot_turns, turns)
+
+    def test_worker_turns_moves_first(self):
+        """A worker's moves come before its move+builds."""
+        turns = list(rulechecker.worker_turns(self.board, self.workers[2]))
+        builds = [turn[2] is not None for turn in turns]
+        self.assertEqual(builds, sorted(builds))
+        self.assertEqual([turn[1] for turn in turns if turn[2] is None],
+                         [move_dir for move_dir in Direction
+                          if rulechecker.can_move_build(
+                              self.board, self.workers[2], move_dir)])
+
+
+class TestRuleCache(unittest.TestCase):
+    """Rulechecker cache test Class."""
+
+    def setUp(self):
+        """Two workers per player on a board with some buildings."""
+        self.workers = [Worker("player1", 1),
+                        Worker("player1", 2),
+                        Worker("player2", 1),
+                        Worker("player2", 2)]
+        self.board = Board([[0, 1, 2], [3, 4, 0], [1, 2, 3]],
+                           {worker: (i, 5 - i)
+                            for i, worker in enumerate(self.workers)})
+        self.cache = rulechecker.cache
+        self.cache.enable()
+
+    def tearDown(self):
+        self.cache.enable(rulechecker.RuleCache.DEFAULT_MAX_SIZE)
+        self.cache.disable()
+
+    def test_disabled_by_default(self):
+        """A new cache does not keep results."""
+        cache = rulechecker.RuleCache()
+        self.assertFalse(cache.enabled)
+        self.cache.disable()
+        rulechecker.can_move_build(self.board, self.workers[0],
+                                   Direction.WEST)
+        self.assertEqual((self.cache.hits, self.cache.misses), (0, 0))
+        self.assertEqual(len(self.cache), 0)
+
+    def test_hits_and_misses(self):
+        """Checking a position again is a hit."""
+        args = (self.board, self.workers[0], Direction.WEST, Direction.SOUTH)
+        first = rulechecker.can_move_build(*args)
+        self.assertEqual((self.cache.hits, self.cache.misses), (0, 1))
+        self.assertEqual(rulechecker.can_move_build(*args), first)
+        self.assertEqual(rulechecker.can_move_build(
+            self.board.snapshot(), *args[1:]), first)
+        self.assertEqual((self.cache.hits, self.cache.misses), (2, 1))
+        rulechecker.get_winner(self.board)
+        rulechecker.get_winner(self.board)
+        rulechecker.is_game_over(self.board, self.workers[:2])
+        self.assertEqual((self.cache.hits, self.cache.misses), (3, 3))
+        self.cache.invalidate()
+        self.assertEqual((self.cache.hits, self.cache.misses), (0, 0))
+        self.assertEqual(len(self.cache), 0)
+
+    def test_results_follow_the_board(self):
+        """Cached results are the results of the current position."""
+        rng = random.Random(1400)
+        board = self.board
+        for _ in range(100):
+            worker = rng.choice(self.workers)
+            for move_dir, build_dir in product(Direction, [None] +
+                                               list(Direction)):
+                cached = rulechecker.can_move_build(board, worker, move_dir,
+                                                    build_dir)
+                self.assertEqual(bool(cached), bool(
+                    rulechecker._can_move_build(board, worker, move_dir,
+                                                build_dir)))
+            self.assertEqual(rulechecker.get_winner(board),
+                             rulechecker._get_winner(board, None))
+            turns = list(rulechecker.worker_turns(board, worker))
+            if not turns:
+                break
+            if board._undo_stack and rng.random() < 0.3:
+                board.unmake_turn()
+            else:
+                board.make_turn(*rng.choice(turns))
+        self.assertGreater(self.cache.hits, 0)
+
+    def test_bounded(self):
+        """The least recently used results are dropped first."""
+        self.cache.enable(max_size=2)
+        for move_dir in (Direction.WEST, Direction.SOUTH, Direction.WEST):
+            rulechecker.can_move_build(self.board, self.workers[0], move_dir)
+        self.assertEqual(len(self.cache), 2)
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 2))
+        rulechecker.can_move_build(self.board, self.workers[0],
+                                   Direction.SOUTHWEST)
+        rulechecker.can_move_build(self.board, self.workers[0],
+                                   Direction.SOUTH)
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 4))
+        with self.assertRaises(ValueError):
+            self.cache.enable(max_size=0)
@@ -0,0 +1,93 @@
+"""Unit tests for the TranspositionTable Component."""
+import unittest
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(__file__), "../.."))
+from Santorini.Player.transposition import TranspositionTable
+
+
+class TestTranspositionTable(unittest.TestCase):
+    """Test the transposition table."""
+
+    def setUp(self):
+        self.table = TranspositionTable(4 * TranspositionTable.ENTRY_BYTES)
+
+    def test_memory(self):
+        """The memory cap sets the number of buckets."""
+        self.assertEqual(self.table.buckets, 2)
+        self.assertEqual(TranspositionTable().buckets,
+                         TranspositionTable.DEFAULT_MEMORY //
+                         (2 * TranspositionTable.ENTRY_BYTES))
+        with self.assertRaises(ValueError):
+            TranspositionTable(TranspositionTable.ENTRY_BYTES)
+
+    def test_probe_store(self):
+        """A stored position is found by its key, others are not."""
+        self.assertIsNone(self.table.probe(7))
+        self.table.store(7, 3, TranspositionTable.LOWER, 12, "turn")
+        self.assertEqual(self.table.probe(7),
+                         (7, 3, TranspositionTable.LOWER, 12, "turn"))
+        self.assertIsNone(self.table.probe(9))
+        self.assertEqual(len(self.table), 1)
+
+    def test_depth_preferred(self):
+        """A shallower result of another position goes to the always-replace
+        entry and does not push out the deeper one."""
+        self.table.store(1, 4, TranspositionTable.EXACT, 1, None)
+        self.table.store(3, 2, TranspositionTable.EXACT, 3, None)
+        self.table.store(5, 1, TranspositionTable.EXACT, 5, None)
+        self.assertEqual(self.table.probe(1)[3], 1)
+        self.assertIsNone(self.table.probe(3))
+        self.assertEqual(self.table.probe(5)[3], 5)
+        self.assertEqual(self.table.replaced, 1)
+        # a deeper result replaces the depth-preferred entry
+        self.table.store(7, 6, TranspositionTable.EXACT, 7, None)
+        self.assertIsNone(self.table.probe(1))
+        self.assertEqual(self.table.probe(7)[3], 7)
+        self.assertEqual(self.table.probe(5)[3], 5)
+
+    def test_same_position(self):
+        """A new result of a position replaces its old one."""
+        self.table.store(1, 4, TranspositionTable.EXACT, 1, None)
+        self.table.store(3, 2, TranspositionTable.UPPER, 3, None)
+        self.table.store(3, 5, TranspositionTable.EXACT, 4, None)
+        self.assertEqual(self.table.probe(3)[1:4],
+                         (5, TranspositionTable.EXACT, 4))
+        self.assertEqual(len(self.table), 1)
+
+    def test_stats(self):
+        """Probes, hits and stores are counted until reset."""
+        self.table.store(2, 1, TranspositionTable.EXACT, 0, None)
+        self.table.probe(2)
+        self.table.probe(4)
+        self.assertEqual((self.table.probes, self.table.hits,
+                          self.table.stores), (2, 1, 1))
+        self.assertEqual(self.table.hit_rate, 0.5)
+        self.table.reset_stats()
+        self.assertEqual(self.table.hit_rate, 0.0)
+        self.assertEqual(len(self.table), 1)
+        self.table.clear()
+        self.assertEqual(len(self.table), 0)
+
+    def test_generations(self):
+        """Entries of earlier searches are reused and give way to the
+        entries of the current one."""
+        self.table.store(1, 4, TranspositionTable.EXACT, 1, None)
+        self.table.store(2, 6, TranspositionTable.EXACT, 2, None)
+        self.table.new_search()
+        self.assertEqual((self.table.probes, self.table.stores), (0, 0))
+        self.assertEqual(self.table.probe(1)[3], 1)
+        self.assertEqual(self.table.reused, 1)
+        # a shallower result replaces a deeper one of an earlier search
+        self.table.store(3, 2, TranspositionTable.EXACT, 3, None)
+        self.assertIsNone(self.table.probe(1))
+        self.assertEqual(self.table.probe(3)[3], 3)
+        self.assertEqual(self.table.reused, 1)
+        # but not a deeper one of this search
+        self.table.store(5, 1, TranspositionTable.EXACT, 5, None)
+        self.assertEqual(self.table.probe(3)[3], 3)
+        self.assertEqual(self.table.probe(5)[3], 5)
+        self.assertEqual(self.table.probe(2)[3], 2)
+        self.assertEqual(self.table.reused, 2)
+        self.table.clear()
+        self.assertEqual(self.table.generation, 0)
@@ -1,5 +1,7 @@
 """Unit tests for the Worker Component."""
 import unittest
+import copy
+import pickle
 import sys
 import os
 sys.path.append(os.path.join(os.path.dirname(__file__), "../.."))
@@ -50,3 +52,24 @@ class TestWorker(unittest.TestCase):
         self.assertEqual(worker_dict[Worker("player1", 2)], 2)
         self.assertEqual(worker_dict[Worker("player2", 1)], 3)
         self.assertEqual(worker_dict[Worker("player2", 2)], 4)
+
+    def test_interned(self):
+        """Test that equal workers are the same object."""
+        self.assertIs(Worker("player1", 1), Worker("player1", 1))
+        self.assertIsNot(Worker("player1", 1), Worker("player1", 2))
+        self.assertEqual(hash(Worker("player1", 1)), hash(("player1", 1)))
+
+    def test_copy(self):
+        """Test that copying a worker gives back the same worker."""
+        worker = Worker("player1", 2)
+        self.assertIs(copy.copy(worker), worker)
+        self.assertIs(copy.deepcopy(worker), worker)
+        self.assertIs(pickle.loads(pickle.dumps(worker)), worker)
+
+    def test_immutable(self):
+        """Test that workers have no attributes to change."""
+        worker = Worker("player1", 1)
+        with self.assertRaises(AttributeError):
+            worker.player = "player2"
+        with self.assertRaises(AttributeError):
+            worker.color = "blue"